@@ -10,6 +10,8 @@ document.addEventListener('DOMContentLoaded', function () {
         let y = 0;
         let prevSiblingHeight = 0;
         let prevSiblingWidth = 0;
+        let parentHeight = 0;
+        let parentWidth = 0;
 
         // Handle the mousedown event that's triggered when user drags the resizer
         const mouseDownHandler = function (e) {
@@ -19,6 +21,10 @@ document.addEventListener('DOMContentLoaded', function () {
             const rect = prevSibling.getBoundingClientRect();
             prevSiblingHeight = rect.height;
             prevSiblingWidth = rect.width;
+            // Read the layout once, reading it on every mousemove forces a reflow after each style write
+            const parentRect = resizer.parentNode.getBoundingClientRect();
+            parentHeight = parentRect.height;
+            parentWidth = parentRect.width;
 
             // Attach the listeners to document
             document.addEventListener('mousemove', mouseMoveHandler);
@@ -32,16 +38,12 @@ document.addEventListener('DOMContentLoaded', function () {
 
             switch (direction) {
                 case 'vertical':
-                    const h =
-                        ((prevSiblingHeight + dy) * 100) /
-                        resizer.parentNode.getBoundingClientRect().height;
+                    const h = ((prevSiblingHeight + dy) * 100) / parentHeight;
                     prevSibling.style.height = h + '%';
                     break;
                 case 'horizontal':
                 default:
-                    const w =
-                        ((prevSiblingWidth + dx) * 100) /
-                        resizer.parentNode.getBoundingClientRect().width;
+                    const w = ((prevSiblingWidth + dx) * 100) / parentWidth;
                     prevSibling.style.width = w + '%';
                     break;
             }
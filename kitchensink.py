@@ -5,10 +5,11 @@ This software is distributed under the terms of the MIT license. See LICENSE.txt
 Main file
 """
 
+import json
+
 from datetime import datetime
-from js import fetch, JSON  # type: ignore # pylint: disable=import-error
 
-from widgets import PGrid, PTextInput, PButton, PLabel, bind_to_dom, base_url
+from widgets import PGrid, PTextInput, PButton, PLabel, bind_to_dom, base_url, fetch_json
 from todo import TodoPanel
 
 
@@ -25,7 +26,7 @@ class Main(PGrid):
 
         # First demo panel
         self.inp = PTextInput("").set_placeholder("press the button...")
-        self.btn = PButton("Press me!").set_color("blue").on_click(self.btn_click)
+        self.btn = PButton("Press me!").set_color("blue").on_click(self.btn_click, "cancel")
 
         self.grd = PGrid().set_margin(6).set_row_gap(6).set_column_gap(6)
         self.grd.set_rows([36, 36, 72])
@@ -65,9 +66,8 @@ class Main(PGrid):
     async def btn_click(self, event):  # pylint: disable=unused-argument
         """Button click event handler"""
         self.btn.set_color("red")
-        response = await fetch(base_url() + "/assets/demo-data.json", {"method": "GET"})
-        data = await response.json()
-        self.inp.set_value("Now is: " + str(datetime.now()) + " " + JSON.stringify(data))
+        data = await fetch_json(base_url() + "/assets/demo-data.json")
+        self.inp.set_value("Now is: " + str(datetime.now()) + " " + json.dumps(data))
 
     def after_page_load(self):  # pylint: disable=useless-parent-delegation
         super().after_page_load()
@@ -0,0 +1,49 @@
+// Generated by precache.py, do not edit
+self.PRECACHE_MANIFEST = {
+    "version": "a197ec729c78",
+    "urls": [
+        "./",
+        "assets/demo-data.json",
+        "assets/logo.png",
+        "assets/logo.svg",
+        "favicon.ico",
+        "index.html",
+        "kitchensink.py",
+        "manifest.json",
+        "pyscript.toml",
+        "test.py",
+        "todo.py",
+        "widgets/__init__.py",
+        "widgets/base.py",
+        "widgets/button.py",
+        "widgets/canvas.py",
+        "widgets/combobox.py",
+        "widgets/compound.py",
+        "widgets/editable.py",
+        "widgets/focussable.py",
+        "widgets/globals.py",
+        "widgets/grid.py",
+        "widgets/handler.py",
+        "widgets/input.py",
+        "widgets/label.py",
+        "widgets/lazy.py",
+        "widgets/observable.py",
+        "widgets/panel.py",
+        "widgets/scheduler.py",
+        "widgets/splitpane.py",
+        "widgets/stream.py",
+        "widgets/svg.py",
+        "widgets/tab.py",
+        "widgets/tabpane.py",
+        "widgets/template.py",
+        "widgets/text.py",
+        "widgets/textarea.py",
+        "widgets/tree.py",
+        "widgets/virtual.py",
+        "widgets/widgets.css",
+        "widgets/widgets.js",
+        "https://cdn.jsdelivr.net/npm/fomantic-ui@2.9.4/dist/semantic.min.css",
+        "https://pyscript.net/releases/2025.3.1/core.css",
+        "https://pyscript.net/releases/2025.3.1/core.js"
+    ]
+};
@@ -0,0 +1,70 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Generate the precache manifest for the service worker, run this with CPython after changing any application file
+"""
+
+import hashlib
+import json
+import re
+import tomllib
+
+from pathlib import Path
+
+
+_ROOT = Path(__file__).parent
+_MANIFEST = "precache-manifest.js"
+
+# Static files that are not listed in pyscript.toml
+_STATIC_FILES = [
+    "index.html",
+    "pyscript.toml",
+    "manifest.json",
+    "favicon.ico",
+    "widgets/widgets.css",
+    "widgets/widgets.js",
+    "assets/demo-data.json",
+    "assets/logo.png",
+    "assets/logo.svg",
+]
+
+
+def _local_files() -> list[str]:
+    """Static files and the Python files that PyScript fetches, as listed in pyscript.toml"""
+    with open(_ROOT / "pyscript.toml", "rb") as f:
+        config = tomllib.load(f)
+    files = list(_STATIC_FILES)
+    for local in config.get("files", {}).values():
+        if local.startswith("./"):
+            files.append(local[2:])
+    return sorted(set(files))
+
+
+def _remote_urls() -> list[str]:
+    """Versioned CDN urls of scripts and stylesheets in index.html"""
+    html = (_ROOT / "index.html").read_text(encoding="utf-8")
+    return sorted(set(re.findall(r'(?:src|href)="(https://[^"]+)"', html)))
+
+
+def generate() -> str:
+    """Write the manifest, the version is a hash of the contents of all local files"""
+    files = _local_files()
+    digest = hashlib.sha256()
+    for name in files:
+        digest.update(name.encode("utf-8"))
+        digest.update((_ROOT / name).read_bytes())
+    version = digest.hexdigest()[:12]
+    manifest = {"version": version, "urls": ["./"] + files + _remote_urls()}
+    (_ROOT / _MANIFEST).write_text(
+        "// Generated by precache.py, do not edit\n"
+        + "self.PRECACHE_MANIFEST = "
+        + json.dumps(manifest, indent=4)
+        + ";\n",
+        encoding="utf-8",
+    )
+    return version
+
+
+if __name__ == "__main__":
+    print("Precache manifest version: " + generate())
@@ -0,0 +1,496 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Pre-render the initial widget tree to static HTML in index.html, run this with CPython after changing the main widget
+
+The widget classes run unchanged against a string building DOM, instead of the browser DOM of PyScript.
+Event listeners, timers and browser storage do nothing here, bind_to_dom() hydrates the elements in the browser.
+"""
+
+import argparse
+import asyncio
+import html
+import importlib
+import re
+import sys
+import types
+
+from pathlib import Path
+
+
+_ROOT = Path(__file__).parent
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+_BEGIN_MARKER = "<!-- prerender:begin -->"
+_END_MARKER = "<!-- prerender:end -->"
+
+# DOM properties that reflect an attribute, see:
+# https://html.spec.whatwg.org/multipage/common-dom-interfaces.html#reflecting-content-attributes-in-idl-attributes
+_REFLECTED_PROPERTIES = {
+    "id": "id",
+    "className": "class",
+    "htmlFor": "for",
+    "value": "value",
+    "type": "type",
+    "placeholder": "placeholder",
+    "width": "width",
+    "height": "height",
+}
+
+# Layout properties, the static HTML has no layout so these are zero
+_LAYOUT_PROPERTIES = {
+    "clientWidth",
+    "clientHeight",
+    "offsetWidth",
+    "offsetHeight",
+    "scrollWidth",
+    "scrollHeight",
+    "scrollLeft",
+    "scrollTop",
+}
+
+
+def _kebab_case(name: str) -> str:
+    """Convert a camel case DOM property name to a kebab case CSS property or data attribute name"""
+    return re.sub(r"([A-Z])", lambda m: "-" + m.group(1).lower(), name)
+
+
+class _Null:
+    """Null object for browser features without effect on the static HTML, every attribute and call returns itself"""
+
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __bool__(self):
+        return False
+
+
+class _ClassList:
+    """String DOM class list"""
+
+    def __init__(self):
+        self._names = []
+
+    def add(self, *names):
+        """Add class names, once"""
+        for name in names:
+            if name not in self._names:
+                self._names.append(name)
+
+    def remove(self, *names):
+        """Remove class names"""
+        for name in names:
+            if name in self._names:
+                self._names.remove(name)
+
+    def toggle(self, name, force=None):
+        """Add or remove a class name, return whether it is present"""
+        if force is None:
+            force = name not in self._names
+        if force:
+            self.add(name)
+        else:
+            self.remove(name)
+        return force
+
+    def contains(self, name):
+        """Is the class name present"""
+        return name in self._names
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def __len__(self):
+        return len(self._names)
+
+    def __str__(self):
+        return " ".join(self._names)
+
+    def set(self, value):
+        """Replace all class names by the names of a class attribute value"""
+        self._names = [] if value is None else str(value).split()
+
+
+class _Style:
+    """String DOM inline style, setting None or an empty string removes the property"""
+
+    def __init__(self):
+        object.__setattr__(self, "_properties", {})
+
+    def __setattr__(self, name, value):
+        self.setProperty(_kebab_case(name), value)
+
+    def __getattr__(self, name):
+        return self._properties.get(_kebab_case(name), "")
+
+    def setProperty(self, name, value):  # pylint: disable=invalid-name
+        """Set a property, None or an empty string removes it"""
+        if value is None or str(value) == "":
+            self._properties.pop(name, None)
+        else:
+            self._properties[name] = str(value)
+
+    def removeProperty(self, name):  # pylint: disable=invalid-name
+        """Remove a property, return its old value"""
+        return self._properties.pop(name, "")
+
+    def getPropertyValue(self, name):  # pylint: disable=invalid-name
+        """Get a property, an empty string when it is not set"""
+        return self._properties.get(name, "")
+
+    def __str__(self):
+        return "; ".join(k + ": " + v for k, v in self._properties.items())
+
+    def set(self, value):
+        """Replace all properties by the declarations of a style attribute value"""
+        self._properties.clear()
+        for declaration in (value or "").split(";"):
+            if ":" in declaration:
+                name, value = declaration.split(":", 1)
+                self.setProperty(name.strip(), value.strip())
+
+
+class _Dataset:
+    """String DOM data attributes"""
+
+    def __init__(self, element):
+        object.__setattr__(self, "_element", element)
+
+    def __setattr__(self, name, value):
+        self._element.setAttribute("data-" + _kebab_case(name), value)
+
+    def __getattr__(self, name):
+        value = self._element.getAttribute("data-" + _kebab_case(name))
+        if value is None:
+            raise AttributeError(name)  # Like a JsProxy for an undefined property
+        return value
+
+
+class _Node:  # pylint: disable=too-few-public-methods
+    """String DOM node"""
+
+    parentNode = None  # Set with object.__setattr__(), because elements override __setattr__()
+
+    def __init__(self):
+        object.__setattr__(self, "parentNode", None)
+
+    @property
+    def js_id(self):
+        """Identity of the node, like the JsProxy of a browser DOM node"""
+        return id(self)
+
+    @property
+    def nextSibling(self):  # pylint: disable=invalid-name
+        """Next node of the parent, None for the last node or a node without parent"""
+        if self.parentNode is None:
+            return None
+        siblings = self.parentNode.childNodes
+        index = siblings.index(self) + 1
+        return siblings[index] if index < len(siblings) else None
+
+    def isSameNode(self, other):  # pylint: disable=invalid-name
+        """Is the other node this node"""
+        return other is self
+
+    def remove(self):
+        """Remove the node from its parent, if any"""
+        if self.parentNode is not None:
+            self.parentNode.removeChild(self)
+
+
+class _Text(_Node):
+    """String DOM text node"""
+
+    def __init__(self, text):
+        super().__init__()
+        self.nodeValue = str(text)  # pylint: disable=invalid-name
+
+    @property
+    def textContent(self):  # pylint: disable=invalid-name
+        """Text of the node"""
+        return self.nodeValue
+
+    def cloneNode(self, deep=False):  # pylint: disable=invalid-name,unused-argument
+        """Copy of the text node"""
+        return _Text(self.nodeValue)
+
+    def to_html(self) -> str:
+        """Serialize the escaped text"""
+        return html.escape(self.nodeValue, quote=False)
+
+
+class _Element(_Node):  # pylint: disable=too-many-public-methods
+    """String DOM element, with the subset of the DOM API that the widgets use"""
+
+    def __init__(self, tag, namespace=None):
+        super().__init__()
+        for name, value in [
+            ("tagName", tag),
+            ("namespaceURI", namespace),
+            ("childNodes", []),
+            ("classList", _ClassList()),
+            ("style", _Style()),
+            ("_attributes", {}),
+        ]:
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "dataset", _Dataset(self))
+
+    def __setattr__(self, name, value):
+        if name in _REFLECTED_PROPERTIES and not (name == "value" and self.tagName == "textarea"):
+            self.setAttribute(_REFLECTED_PROPERTIES[name], value)
+        elif name in ("textContent", "innerText") or (name == "value" and self.tagName == "textarea"):
+            self.replaceChildren(_Text(value))
+        else:
+            object.__setattr__(self, name, value)  # Runtime only properties, like scrollTop
+
+    def __getattr__(self, name):
+        if name in _REFLECTED_PROPERTIES:
+            return self.getAttribute(_REFLECTED_PROPERTIES[name]) or ""
+        if name in ("textContent", "innerText"):
+            return "".join(c.textContent for c in self.childNodes)
+        if name in _LAYOUT_PROPERTIES:
+            return 0
+        raise AttributeError(name)
+
+    # Attributes
+    def setAttribute(self, name, value):  # pylint: disable=invalid-name
+        """Set an attribute, the class and style attributes are kept in their own objects"""
+        if name == "class":
+            self.classList.set(value)
+        elif name == "style":
+            self.style.set(value)
+        else:
+            self._attributes[name] = str(value)
+
+    def getAttribute(self, name):  # pylint: disable=invalid-name
+        """Get an attribute, None when it is not set"""
+        if name == "class":
+            return str(self.classList) if len(self.classList) > 0 else None
+        if name == "style":
+            return str(self.style) or None
+        return self._attributes.get(name)
+
+    def hasAttribute(self, name):  # pylint: disable=invalid-name
+        """Is the attribute set"""
+        return self.getAttribute(name) is not None
+
+    def removeAttribute(self, name):  # pylint: disable=invalid-name
+        """Remove an attribute"""
+        if name == "class":
+            self.classList.set(None)
+        elif name == "style":
+            self.style.set(None)
+        else:
+            self._attributes.pop(name, None)
+
+    # Events, the static HTML has no event listeners
+    def addEventListener(self, event_type, listener):  # pylint: disable=invalid-name
+        """Ignore the event listener"""
+
+    def removeEventListener(self, event_type, listener):  # pylint: disable=invalid-name
+        """Ignore the event listener"""
+
+    # Children
+    @property
+    def children(self):
+        """Child elements, without the text nodes"""
+        return [c for c in self.childNodes if isinstance(c, _Element)]
+
+    @property
+    def firstChild(self):  # pylint: disable=invalid-name
+        """First child node, None when there are no child nodes"""
+        return self.childNodes[0] if len(self.childNodes) > 0 else None
+
+    def appendChild(self, child):  # pylint: disable=invalid-name
+        """Append a child node, after removing it from its current parent"""
+        child.remove()
+        object.__setattr__(child, "parentNode", self)
+        self.childNodes.append(child)
+        return child
+
+    def insertBefore(self, child, reference):  # pylint: disable=invalid-name
+        """Insert a child node before the reference node, append it when the reference is None"""
+        if reference is None:
+            return self.appendChild(child)
+        child.remove()
+        object.__setattr__(child, "parentNode", self)
+        self.childNodes.insert(self.childNodes.index(reference), child)
+        return child
+
+    def removeChild(self, child):  # pylint: disable=invalid-name
+        """Remove a child node"""
+        self.childNodes.remove(child)
+        object.__setattr__(child, "parentNode", None)
+        return child
+
+    def replaceChildren(self, *children):  # pylint: disable=invalid-name
+        """Replace all child nodes"""
+        for c in list(self.childNodes):
+            self.removeChild(c)
+        for c in children:
+            self.appendChild(c)
+
+    def append(self, *children):
+        """Append child nodes, strings are appended as text nodes"""
+        for c in children:
+            self.appendChild(c if isinstance(c, _Node) else _Text(c))
+
+    def cloneNode(self, deep=False):  # pylint: disable=invalid-name
+        """Copy of the element with its attributes, and a copy of its descendants when deep"""
+        clone = _Element(self.tagName, self.namespaceURI)
+        clone._attributes.update(self._attributes)  # pylint: disable=protected-access
+        clone.classList.set(str(self.classList))
+        clone.style.set(str(self.style))
+        if deep:
+            for c in self.childNodes:
+                clone.appendChild(c.cloneNode(True))
+        return clone
+
+    def querySelectorAll(self, selector):  # pylint: disable=invalid-name
+        """Descendant elements in document order, only attribute prefix selectors like [id^='e'] are supported"""
+        match = re.fullmatch(r"\[([\w-]+)\^='([^']*)'\]", selector)
+        if match is None:
+            raise ValueError("Unsupported selector: " + selector)
+        name, prefix = match.groups()
+        found = []
+        for c in self.children:
+            value = c.getAttribute(name)
+            if value is not None and value.startswith(prefix):
+                found.append(c)
+            found.extend(c.querySelectorAll(selector))
+        return found
+
+    def closest(self, selector):  # pylint: disable=unused-argument
+        """No ancestor matches, the static HTML has no surrounding page"""
+        return None
+
+    def getBoundingClientRect(self):  # pylint: disable=invalid-name
+        """Zero size bounds, the static HTML has no layout"""
+        return types.SimpleNamespace(x=0, y=0, width=0, height=0, top=0, left=0, right=0, bottom=0)
+
+    # Methods without effect on the static HTML
+    focus = blur = scrollIntoView = setPointerCapture = releasePointerCapture = _Null()
+    hasPointerCapture = _Null()
+
+    def to_html(self) -> str:
+        """Serialize the element and its descendants"""
+        attributes = dict(self._attributes)
+        if len(self.classList) > 0:
+            attributes["class"] = str(self.classList)
+        if len(str(self.style)) > 0:
+            attributes["style"] = str(self.style)
+        start = self.tagName + "".join(
+            " " + k + '="' + html.escape(v, quote=True) + '"' for k, v in attributes.items()
+        )
+        if self.tagName in _VOID_TAGS:
+            return "<" + start + ">"
+        return "<" + start + ">" + "".join(c.to_html() for c in self.childNodes) + "</" + self.tagName + ">"
+
+
+class _Document:
+    """String DOM document"""
+
+    def __init__(self):
+        self.body = _Element("body")
+        self.visibilityState = "visible"  # pylint: disable=invalid-name
+
+    def createElement(self, tag):  # pylint: disable=invalid-name
+        """Create an element"""
+        return _Element(tag)
+
+    def createElementNS(self, namespace, tag):  # pylint: disable=invalid-name
+        """Create an element in a namespace, like SVG"""
+        return _Element(tag, namespace)
+
+    def createTextNode(self, text):  # pylint: disable=invalid-name
+        """Create a text node"""
+        return _Text(text)
+
+    def getElementById(self, element_id):  # pylint: disable=invalid-name,unused-argument
+        """No element is found, the widgets create their own elements"""
+        return None
+
+    def addEventListener(self, event_type, listener, capture=False):  # pylint: disable=invalid-name
+        """Ignore the event listener"""
+
+
+def _install_browser_modules() -> _Document:
+    """Register the pyscript, js and pyodide modules with the string DOM, before importing the widgets"""
+    document = _Document()
+    null = _Null()
+    window = types.SimpleNamespace(
+        document=document,
+        performance=types.SimpleNamespace(now=lambda: 0.0),
+        setTimeout=null,
+        requestAnimationFrame=null,
+        matchMedia=null,
+        location=types.SimpleNamespace(href=""),
+    )
+    modules = {
+        "pyscript": {"document": document, "window": window},
+        "js": {
+            "console": null,
+            "fetch": null,
+            "sessionStorage": types.SimpleNamespace(getItem=lambda key: None, setItem=null, removeItem=null),
+            "Date": null,
+            "IntersectionObserver": null,
+            "Object": null,
+            "ResizeObserver": null,
+            "Response": null,
+            "pcanvas_replay": null,
+            "pevent_filter": null,
+            "ptemplate_elements": null,
+            "ptemplate_shift_ids": null,
+        },
+        "pyodide": {},
+        "pyodide.ffi": {"to_js": lambda obj, **kwargs: obj, "create_proxy": lambda f: null, "create_once_callable": lambda f: f},
+        "pyodide.ffi.wrappers": {"add_event_listener": null, "remove_event_listener": null},
+    }
+    for name, attributes in modules.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        sys.modules[name] = module
+    return document
+
+
+def prerender(module_name: str, class_name: str) -> str:
+    """Construct the main widget like bind_to_dom() does, and return its static HTML"""
+    _install_browser_modules()
+    sys.path.insert(0, str(_ROOT))
+    main_class = getattr(importlib.import_module(module_name), class_name)
+    from widgets.scheduler import flush_renders  # pylint: disable=import-outside-toplevel
+
+    async def construct():
+        # Widgets can start asynchronous loading in their constructor, that content is rendered in the browser
+        main_widget = main_class()
+        flush_renders()
+        return main_widget._elem.to_html()  # pylint: disable=protected-access
+
+    return asyncio.run(construct())
+
+
+def write(html_text: str, page: str):
+    """Replace the markup between the prerender markers in the page"""
+    path = _ROOT / page
+    text = path.read_text(encoding="utf-8")
+    begin = text.index(_BEGIN_MARKER) + len(_BEGIN_MARKER)
+    end = text.index(_END_MARKER, begin)
+    indent = text[text.rindex("\n", 0, begin) + 1 : text.index(_BEGIN_MARKER)]
+    path.write_text(text[:begin] + "\n" + indent + html_text + "\n" + indent + text[end:], encoding="utf-8")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-render the initial widget tree to static HTML")
+    parser.add_argument("module", nargs="?", default="kitchensink", help="main Python module")
+    parser.add_argument("main_class", nargs="?", default="Main", help="main widget class")
+    parser.add_argument("--page", default="index.html", help="page with the prerender markers")
+    options = parser.parse_args()
+    markup = prerender(options.module, options.main_class)
+    write(markup, options.page)
+    print(f"Pre-rendered {len(markup)} characters into: {options.page}")
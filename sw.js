@@ -0,0 +1,61 @@
+/*
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Service worker, serve the application and widget files cache first
+See: https://developer.mozilla.org/en-US/docs/Web/Progressive_web_apps/Guides/Caching
+*/
+
+// Defines self.PRECACHE_MANIFEST, regenerate it with: python precache.py
+importScripts("precache-manifest.js");
+
+const CACHE_PREFIX = "pyscriptwidgets-";
+const CACHE_NAME = CACHE_PREFIX + self.PRECACHE_MANIFEST.version;
+
+// Versioned runtime downloads (Pyodide packages etc.) are cached on first use
+const RUNTIME_HOSTS = ["cdn.jsdelivr.net", "pyscript.net"];
+
+self.addEventListener("install", function (event) {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(function (cache) { return cache.addAll(self.PRECACHE_MANIFEST.urls); })
+            .then(function () { return self.skipWaiting(); })
+    );
+});
+
+self.addEventListener("activate", function (event) {
+    // Remove the caches of previous versions
+    event.waitUntil(
+        caches.keys()
+            .then(function (names) {
+                return Promise.all(names
+                    .filter(function (name) { return name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME; })
+                    .map(function (name) { return caches.delete(name); }));
+            })
+            .then(function () { return self.clients.claim(); })
+    );
+});
+
+self.addEventListener("fetch", function (event) {
+    const request = event.request;
+    if (request.method !== "GET") {
+        return;
+    }
+    const url = new URL(request.url);
+    const runtime = RUNTIME_HOSTS.includes(url.hostname);
+    event.respondWith(
+        caches.open(CACHE_NAME).then(function (cache) {
+            return cache.match(request, { ignoreSearch: !runtime }).then(function (cached) {
+                if (cached) {
+                    return cached;
+                }
+                return fetch(request).then(function (response) {
+                    if (runtime && response.ok) {
+                        cache.put(request, response.clone());
+                    }
+                    return response;
+                });
+            });
+        })
+    );
+});
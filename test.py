@@ -5,10 +5,6 @@ This software is distributed under the terms of the MIT license. See LICENSE.txt
 Main file
 """
 
-import js  # pylint: disable=import-error
-
-# from pyscript.js_modules.JQuery import default as jq  # type: ignore # pylint: disable=import-error
-
 from widgets import PGrid, PLabel, PTab, PPanel, bind_to_dom
 
 
@@ -64,12 +60,6 @@ class Test(PGrid):
 
         self.tab.set_active(0)
 
-    def after_page_load(self):  # pylint: disable=useless-parent-delegation
-        super().after_page_load()
-
-        # jq(".menu .item").tab()
-        js.ptab_init()
-
 
 if __name__ == "__main__":
     bind_to_dom(Test, "root")
@@ -0,0 +1,30 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Test configuration, the widgets run with CPython against the string DOM of the pre-renderer instead of a browser
+"""
+
+import sys
+
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import prerender  # pylint: disable=wrong-import-position
+
+prerender._install_browser_modules()  # pylint: disable=protected-access
+
+from widgets import scheduler  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture(autouse=True)
+def discard_pending_renders():
+    """Empty the render scheduler queues after each test, so a test does not render the widgets of another test"""
+    yield
+    scheduler._pending_renders.clear()  # pylint: disable=protected-access
+    scheduler._pending_measures.clear()  # pylint: disable=protected-access
+    scheduler._pending_mutations.clear()  # pylint: disable=protected-access
+    scheduler._bounds_cache.clear()  # pylint: disable=protected-access
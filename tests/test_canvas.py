@@ -0,0 +1,57 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for the canvas widget draw command buffer
+"""
+
+import widgets.canvas
+
+from widgets import PCanvas, flush_renders, set_sync_rendering
+
+
+class _Replay:  # pylint: disable=too-few-public-methods
+    """Stand-in for pcanvas_replay() in widgets.js, that records the replayed commands and the canvas size"""
+
+    def __init__(self):
+        """Constructor, no calls recorded yet"""
+        self.calls = []
+
+    def __call__(self, elem, ops, strings):
+        """Record a copy of the commands, and the size of the canvas element when they are replayed"""
+        self.calls.append((list(ops), list(strings), elem.width, elem.height))
+
+
+def _install_replay(monkeypatch) -> _Replay:
+    """Record the replayed draw commands"""
+    replay = _Replay()
+    monkeypatch.setattr(widgets.canvas.js, "pcanvas_replay", replay)
+    return replay
+
+
+def test_sync_rendering_replays_polyline_with_its_coordinates(monkeypatch):
+    """With sync rendering the coordinates are replayed together with the polyline command"""
+    replay = _install_replay(monkeypatch)
+    set_sync_rendering(True)
+    try:
+        canvas = PCanvas()
+        canvas.polyline([1, 2, 3], [4, 5, 6])
+        canvas.points([(7, 8)], size=3)
+    finally:
+        set_sync_rendering(False)
+    assert len(replay.calls) == 2
+    assert replay.calls[0][0][-6:] == [1.0, 4.0, 2.0, 5.0, 3.0, 6.0]
+    assert replay.calls[0][0][-7] == 3  # Number of points
+    assert replay.calls[1][0][-4:] == [1.0, 3.0, 7.0, 8.0]
+
+
+def test_resize_is_applied_before_drawing_in_the_same_frame(monkeypatch):
+    """Changing the size clears the canvas, so it is applied before the commands of the frame are replayed"""
+    replay = _install_replay(monkeypatch)
+    canvas = PCanvas()
+    flush_renders()
+    canvas.fill_rect(0, 0, 10, 10)
+    canvas.set_canvas_width(640).set_canvas_height(480)
+    flush_renders()
+    assert len(replay.calls) == 1
+    assert replay.calls[0][2:] == ("640", "480")  # The string DOM stores attribute values as text
@@ -0,0 +1,61 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for the searchable combobox widget
+"""
+
+import asyncio
+import pickle
+
+from widgets import PComboBox
+
+
+_OPTIONS = [(1, "Amsterdam"), (2, "Rotterdam"), (3, "Utrecht")]
+
+
+def _failing_provider(query: str) -> list[tuple[int, str]]:
+    """Provider that cannot load options"""
+    raise OSError("network down: " + query)
+
+
+def _city_provider(query: str) -> list[tuple[int, str]]:
+    """Provider that matches the options that contain the query"""
+    return [(k, t) for k, t in _OPTIONS if query.lower() in t.lower()]
+
+
+def test_choosing_the_selected_option_again_restores_its_text():
+    """The input shows the option text after choosing, also when the option was already selected"""
+    combobox = PComboBox(_OPTIONS)
+    combobox._choose(1)  # pylint: disable=protected-access
+    combobox.set_value("Rotter")
+    combobox._choose(1)  # pylint: disable=protected-access
+    assert combobox.get_selected() == 2
+    assert combobox.get_value() == "Rotterdam"
+
+
+def test_failing_provider_resets_loading_state():
+    """A provider error clears the options and the loading state"""
+
+    async def run():
+        combobox = PComboBox().set_provider(_failing_provider)
+        assert combobox.is_loading()
+        await asyncio.sleep(0)
+        assert not combobox.is_loading()
+        assert not combobox.get_options()
+
+    asyncio.run(run())
+
+
+def test_provider_options_are_not_pickled():
+    """Options of a provider are loaded again, instead of being stored in session storage"""
+
+    async def run():
+        combobox = PComboBox().set_provider(_city_provider)
+        await asyncio.sleep(0)
+        assert len(combobox.get_options()) == 3
+        combobox.backup_state()
+        restored = pickle.loads(pickle.dumps(combobox))
+        assert not restored.get_options()
+
+    asyncio.run(run())
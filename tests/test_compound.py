@@ -0,0 +1,76 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for pooling the children of a compound widget
+"""
+
+from widgets import PButton, PPanel, PTextInput, flush_renders, globals as widget_globals
+
+
+def _click(event):  # pylint: disable=unused-argument
+    """Click handler"""
+
+
+def test_recycled_button_is_reset_to_constructor_defaults():
+    """A button from the pool has the new text, and no properties or handlers of its previous use"""
+    panel = PPanel(False)
+    button = panel.acquire_child(PButton, "Delete")
+    button.set_icon("trash").set_color("red").set_visible(False).set_enabled(False).on_click(_click)
+    button.set_width(300).set_min_height("2em")
+    flush_renders()
+    assert button._elem.style.width == "300px"  # pylint: disable=protected-access
+    panel.recycle_child(button)
+    assert panel.get_pool_size(PButton) == 1
+    recycled = panel.acquire_child(PButton, "Add")
+    flush_renders()
+    assert recycled is button
+    assert recycled.get_text() == "Add"
+    assert recycled.get_icon() == ""
+    assert recycled.get_color() == ""
+    assert recycled.is_visible()
+    assert recycled.is_enabled()
+    assert recycled._click is None  # pylint: disable=protected-access
+    assert recycled.get_width() is None
+    assert recycled._elem.style.width == ""  # pylint: disable=protected-access
+    assert recycled._elem.style.minHeight == ""  # pylint: disable=protected-access
+
+
+def test_recycled_text_input_is_reset_to_constructor_defaults():
+    """A text input from the pool has the new value, and the placeholder and type of a new text input"""
+    panel = PPanel(False)
+    text_input = panel.acquire_child(PTextInput, "secret")
+    text_input.set_placeholder("Password").set_type_password(True).set_readonly(True)
+    panel.recycle_child(text_input)
+    recycled = panel.acquire_child(PTextInput, "")
+    assert recycled is text_input
+    assert recycled.get_value() == ""
+    assert recycled.get_placeholder() == ""
+    assert recycled.get_input_type() == "text"
+    assert not recycled.is_readonly()
+
+
+def test_removed_child_is_disposed_unless_kept():
+    """A removed child is disposed, a kept child can be added again with working handlers"""
+    panel = PPanel(False)
+    button = PButton("Ok").on_click(_click)
+    panel.add_child(button)
+    panel.remove_child(button, keep=True)
+    panel.add_child(button)
+    assert not button.is_disposed()
+    assert len(button._listeners) == 1  # pylint: disable=protected-access
+    panel.remove_child(button)
+    assert button.is_disposed()
+    assert len(button._listeners) == 0  # pylint: disable=protected-access
+
+
+def test_child_changes_mark_the_state_dirty():
+    """Adding and removing children does not pass the render scheduler, but it must be saved on unload"""
+    panel = PPanel(False)
+    button = PButton("Ok")
+    widget_globals._state_dirty = False  # pylint: disable=protected-access
+    panel.add_child(button)
+    assert widget_globals._state_dirty  # pylint: disable=protected-access
+    widget_globals._state_dirty = False  # pylint: disable=protected-access
+    panel.recycle_child(button)
+    assert widget_globals._state_dirty  # pylint: disable=protected-access
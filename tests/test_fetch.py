@@ -0,0 +1,103 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for the shared fetch layer, with the stub transport instead of the network
+"""
+
+import asyncio
+
+import pytest
+
+from widgets import PStubTransport, configure_fetch_cache, fetch_json, fetch_text, globals as widget_globals
+
+
+_RESPONSES = {"/a": '{"items": [1, 2]}', "/b": "bee", "/c": "sea"}
+
+
+class _Clock:  # pylint: disable=too-few-public-methods
+    """Stand-in for the JavaScript Date, with a time that the test advances"""
+
+    def __init__(self):
+        """Constructor, start at zero"""
+        self.millis = 0.0
+
+    def now(self) -> float:
+        """Current time in millis"""
+        return self.millis
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    """Fake clock for the cache timestamps"""
+    clock = _Clock()
+    monkeypatch.setattr(widget_globals, "Date", clock)
+    yield clock
+    configure_fetch_cache()  # Default limits and the browser transport
+
+
+def test_concurrent_requests_share_one_transport_call(clock):  # pylint: disable=unused-argument
+    """Requests for the same url in flight are deduplicated, later requests are served from the cache"""
+    transport = PStubTransport(_RESPONSES)
+    configure_fetch_cache(transport=transport)
+
+    async def run():
+        texts = await asyncio.gather(fetch_text("/b"), fetch_text("/b"), fetch_text("/c"))
+        return texts + [await fetch_text("/b")]
+
+    assert asyncio.run(run()) == ["bee", "bee", "sea", "bee"]
+    assert transport.get_calls() == ["/b", "/c"]
+
+
+def test_errors_are_not_cached(clock):  # pylint: disable=unused-argument
+    """A failing request raises for each caller, and is requested again next time"""
+    transport = PStubTransport(_RESPONSES)
+    configure_fetch_cache(transport=transport)
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(OSError):
+                await fetch_text("/missing")
+
+    asyncio.run(run())
+    assert transport.get_calls() == ["/missing", "/missing"]
+
+
+def test_least_recently_used_and_expired_entries_are_evicted(clock):
+    """The cache keeps the most recently used entries within its limits, and refetches expired entries"""
+    transport = PStubTransport(_RESPONSES)
+    configure_fetch_cache(max_entries=2, ttl_millis=1000, transport=transport)
+
+    async def run():
+        await fetch_text("/a")
+        await fetch_text("/b")
+        await fetch_text("/a")  # Cached, and now more recently used than /b
+        await fetch_text("/c")  # Evicts /b
+        await fetch_text("/a")
+        await fetch_text("/b")
+        clock.millis += 1001
+        await fetch_text("/b")  # Expired
+
+    asyncio.run(run())
+    assert transport.get_calls() == ["/a", "/b", "/c", "/b", "/b"]
+
+
+def test_each_json_caller_gets_its_own_copy(clock):  # pylint: disable=unused-argument
+    """Changing a parsed response does not change the response of another caller"""
+    configure_fetch_cache(transport=PStubTransport(_RESPONSES))
+
+    async def run():
+        first = await fetch_json("/a")
+        first["items"].append(3)
+        return await fetch_json("/a")
+
+    assert asyncio.run(run()) == {"items": [1, 2]}
+
+
+def test_stub_transport_returns_fixed_responses():
+    """The stub transport returns the fixed responses, and records the requested urls"""
+    transport = PStubTransport({"/x": "ex"})
+    assert asyncio.run(transport("/x")) == "ex"
+    with pytest.raises(OSError):
+        asyncio.run(transport("/y"))
+    assert transport.get_calls() == ["/x", "/y"]
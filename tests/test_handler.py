@@ -0,0 +1,80 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for the concurrency policies of async event handlers
+"""
+
+import asyncio
+import pickle
+
+import pytest
+
+from widgets import PButton, PHandler
+
+
+_log = []
+
+
+async def _slow_handler(event):
+    """Async handler that takes a while, and logs its progress"""
+    _log.append(("start", event))
+    try:
+        await asyncio.sleep(0.01)
+        _log.append(("end", event))
+    except asyncio.CancelledError:
+        _log.append(("cancel", event))
+        raise
+
+
+def _run(handler: PHandler, events: int, started: bool = False) -> list[tuple[str, int]]:
+    """Send the events to the handler and wait until all handlers are done, optionally let each handler start first"""
+    _log.clear()
+
+    async def run():
+        for event in range(events):
+            handler(event)
+            if started:
+                await asyncio.sleep(0)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+    return list(_log)
+
+
+def test_drop_ignores_events_while_running():
+    """Events that arrive while the handler runs are dropped"""
+    assert _run(PHandler(_slow_handler, "drop"), 3) == [("start", 0), ("end", 0)]
+
+
+def test_cancel_restarts_with_the_latest_event():
+    """A running handler is cancelled, so only the handler of the last event completes"""
+    log = _run(PHandler(_slow_handler, "cancel"), 3, started=True)
+    assert log == [("start", 0), ("cancel", 0), ("start", 1), ("cancel", 1), ("start", 2), ("end", 2)]
+
+
+def test_queue_handles_events_one_after_the_other():
+    """Events wait in order until the running handler is done"""
+    log = _run(PHandler(_slow_handler, "queue"), 3)
+    assert log == [("start", 0), ("end", 0), ("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+def test_parallel_with_a_limit():
+    """At most the limit of handlers run concurrently, other events wait in order"""
+    log = _run(PHandler(_slow_handler, "parallel", 2), 4)
+    assert log == [("start", 0), ("start", 1), ("end", 0), ("end", 1), ("start", 2), ("start", 3), ("end", 2), ("end", 3)]
+
+
+def test_unknown_policy_is_rejected():
+    """A typo in the policy name is reported immediately"""
+    with pytest.raises(ValueError):
+        PHandler(_slow_handler, "latest")
+
+
+def test_handler_is_pickled_without_running_tasks():
+    """The wrapped handler and policy survive pickling, running handlers and waiting events do not"""
+    button = PButton("Save").on_click(_slow_handler, concurrency="queue")
+    restored = pickle.loads(pickle.dumps(button._click))  # pylint: disable=protected-access
+    assert restored.get_handler() is _slow_handler
+    assert restored.get_policy() == "queue"
+    assert not restored.is_running()
@@ -0,0 +1,54 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for hydrating pre-rendered markup with a new or restored widget tree
+"""
+
+import pickle
+
+from pyscript import document  # type: ignore # pylint: disable=import-error
+
+from widgets import PLabel, PPanel, flush_renders, globals as widget_globals
+
+
+def _child_ids(elem) -> list[str]:
+    """Ids of the child elements"""
+    return [c.id for c in elem.children]
+
+
+def test_restored_tree_reorders_the_pre_rendered_children():
+    """The children of a restored panel are placed in the order of the widget tree, not of the markup"""
+    panel = PPanel(False)
+    a, b, c = PLabel("A"), PLabel("B"), PLabel("C")
+    panel.add_children([a, b, c])
+    panel.remove_all_children(keep=True)
+    panel.add_children([c, b, a])
+    flush_renders()
+    panel.backup_state()
+    state = pickle.dumps(panel)
+    # Pre-rendered markup, with the children in the original order
+    for child in (a, b, c):
+        panel._elem.appendChild(child._elem)  # pylint: disable=protected-access
+    root = document.createElement("div")
+    root.appendChild(panel._elem)  # pylint: disable=protected-access
+    widget_globals._begin_hydration(root)  # pylint: disable=protected-access
+    restored = pickle.loads(state)
+    restored.restore_state()
+    widget_globals._end_hydration()  # pylint: disable=protected-access
+    assert restored._elem is panel._elem  # pylint: disable=protected-access
+    expected = [child._widget_id for child in restored.get_children()]  # pylint: disable=protected-access
+    assert expected == [c._widget_id, b._widget_id, a._widget_id]  # pylint: disable=protected-access
+    assert _child_ids(restored._elem) == expected  # pylint: disable=protected-access
+
+
+def test_only_widget_ids_are_adopted_or_removed():
+    """Markup with an id that only starts like a widget id is kept, also when it is not adopted"""
+    root = document.createElement("div")
+    for element_id in ("e1", "e1_input", "editor", "e2x"):
+        elem = document.createElement("div")
+        elem.id = element_id
+        root.appendChild(elem)
+    widget_globals._begin_hydration(root)  # pylint: disable=protected-access
+    widget_globals._end_hydration()  # pylint: disable=protected-access
+    assert _child_ids(root) == ["editor", "e2x"]
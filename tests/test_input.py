@@ -0,0 +1,39 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for the cached values of input widgets
+"""
+
+import gc
+import types
+
+from widgets import PTextInput, globals as widget_globals
+
+
+def test_typing_updates_the_cached_value_and_marks_the_state_dirty():
+    """The delegated input listener updates the value of the widget of the event target"""
+    text_input = PTextInput("")
+    widget_globals._state_dirty = False  # pylint: disable=protected-access
+    target = types.SimpleNamespace(id=text_input._elem_input.id, value="typed")  # pylint: disable=protected-access
+    widget_globals._document_input(types.SimpleNamespace(target=target))  # pylint: disable=protected-access
+    assert text_input.get_value() == "typed"
+    assert widget_globals._state_dirty  # pylint: disable=protected-access
+
+
+def test_set_value_marks_the_state_dirty():
+    """A value change is saved, even though it is written to the DOM without the render scheduler"""
+    text_input = PTextInput("a")
+    widget_globals._state_dirty = False  # pylint: disable=protected-access
+    text_input.set_value("b")
+    assert widget_globals._state_dirty  # pylint: disable=protected-access
+
+
+def test_removed_input_widgets_are_not_kept_alive():
+    """The input registry does not keep a widget alive, that was dropped without disposing it"""
+    text_input = PTextInput("a")
+    input_id = text_input._elem_input.id  # pylint: disable=protected-access
+    assert input_id in widget_globals._input_widgets  # pylint: disable=protected-access
+    del text_input
+    gc.collect()
+    assert input_id not in widget_globals._input_widgets  # pylint: disable=protected-access
@@ -0,0 +1,108 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for observable values, computed values and observable lists
+"""
+
+from widgets import PComboBox, PComputed, PLabel, PObservable, PObservableList, PPanel, globals as widget_globals
+
+
+def test_subscribers_are_notified_only_on_changes():
+    """A subscriber is called with the new value, setting an equal value does not notify"""
+    values = []
+    observable = PObservable(1).subscribe(values.append)
+    observable.set(2).set(2).set(3)
+    assert values == [2, 3]
+
+
+def test_bind_sets_the_initial_value():
+    """A bound mutator is called with the current value and on each change"""
+    observable = PObservable("a")
+    label = PLabel("")
+    observable.bind(label.set_text)
+    assert label.get_text() == "a"
+    observable.set("b")
+    assert label.get_text() == "b"
+
+
+def test_computed_value_follows_its_dependencies():
+    """A computed value is evaluated again when an observable that it read changes"""
+    first = PObservable(1)
+    second = PObservable(2)
+    total = PComputed(lambda: first.get() + second.get())
+    values = []
+    total.subscribe(values.append)
+    first.set(10)
+    second.set(20)
+    assert total.get() == 30
+    assert values == [12, 30]
+
+
+def test_list_bind_passes_all_items():
+    """A mutator bound to an observable list is called with a copy of all items, not with the fine grained change"""
+    items = PObservableList(["a"])
+    values = []
+    items.bind(values.append)
+    items.append("b")
+    items.pop(0)
+    assert values == [["a"], ["a", "b"], ["b"]]
+
+
+def test_bind_children_keeps_children_in_sync():
+    """Children are inserted, replaced and removed for the list changes, other children are not touched"""
+    items = PObservableList(["a", "b"])
+    panel = PPanel(True)
+    footer = PLabel("footer")
+    panel.add_child(footer)
+    items.bind_children(panel, PLabel)
+    items.insert(1, "c")
+    items[0] = "d"
+    items.remove("b")
+    assert [c.get_text() for c in panel.get_children()] == ["footer", "d", "c"]
+    items.clear()
+    assert panel.get_children() == [footer]
+
+
+def test_subscriptions_of_disposed_widgets_are_dropped():
+    """A disposed widget is unsubscribed on the next change, instead of being updated and kept alive"""
+    observable = PObservable("a")
+    options = PObservableList([(1, "x")])
+    rows = PObservableList(["r"])
+    panel = PPanel(False)
+    label = PLabel("")
+    combobox = PComboBox([])
+    inner = PPanel(True)
+    panel.add_children([label, combobox, inner])
+    observable.bind(label.set_text)
+    options.bind(combobox.set_options)
+    rows.bind_children(inner, PLabel)
+    panel.remove_all_children()
+    observable.set("b")
+    options.append((2, "y"))
+    rows.append("s")
+    assert label.get_text() == "a"
+    assert len(combobox.get_options()) == 1
+    assert len(inner.get_children()) == 1
+    for o in (observable, options, rows):
+        assert len(o._subscribers) == 0  # pylint: disable=protected-access
+
+
+def test_negative_indices_update_the_bound_children():
+    """Replacing or inserting with a negative index changes the same position in the bound children"""
+    items = PObservableList(["a", "b", "c"])
+    panel = PPanel(True)
+    items.bind_children(panel, PLabel)
+    items[-1] = "z"
+    items.insert(-1, "y")
+    items.insert(-10, "x")
+    assert list(items) == ["x", "a", "b", "y", "z"]
+    assert [c.get_text() for c in panel.get_children()] == ["x", "a", "b", "y", "z"]
+
+
+def test_changes_mark_the_state_dirty():
+    """Observable changes do not pass the render scheduler, but they must be saved on unload"""
+    items = PObservableList([1, 2])
+    widget_globals._state_dirty = False  # pylint: disable=protected-access
+    items.append(3)
+    assert widget_globals._state_dirty  # pylint: disable=protected-access
@@ -0,0 +1,79 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for the render scheduler
+"""
+
+from widgets import PLabel, flush_renders, scheduler, set_sync_rendering
+
+
+def _label_text(label: PLabel) -> str:
+    """Rendered text of the label element"""
+    return label._elem.textContent  # pylint: disable=protected-access
+
+
+def test_property_changes_are_rendered_once_per_flush(monkeypatch):
+    """Several changes of a property render once with the last value, and mark the state dirty once"""
+    calls = []
+    monkeypatch.setattr(scheduler, "_render_callback", lambda: calls.append(True))
+    label = PLabel("a")
+    label.set_text("b").set_text("c").set_color("red")
+    assert _label_text(label) == "a"
+    assert len(scheduler._pending_renders) == 2  # pylint: disable=protected-access
+    flush_renders()
+    assert _label_text(label) == "c"
+    assert len(calls) == 1
+    flush_renders()
+    assert len(calls) == 1  # Nothing was rendered
+
+
+def test_sync_rendering_renders_immediately():
+    """With sync rendering a property change is rendered by its mutator, pending changes are flushed first"""
+    label = PLabel("a")
+    label.set_text("b")
+    set_sync_rendering(True)
+    try:
+        assert _label_text(label) == "b"
+        label.set_text("c")
+        assert _label_text(label) == "c"
+        assert len(scheduler._pending_renders) == 0  # pylint: disable=protected-access
+    finally:
+        set_sync_rendering(False)
+
+
+def test_layout_reads_run_before_dom_writes():
+    """In a flush all measure callbacks run before the mutate callbacks, also when they were scheduled later"""
+    order = []
+    scheduler.mutate(lambda: order.append("write 1"))
+    scheduler.measure(lambda: order.append("read 1"))
+    scheduler.mutate(lambda: order.append("write 2"))
+    scheduler.measure(lambda: order.append("read 2"))
+    flush_renders()
+    assert order == ["read 1", "read 2", "write 1", "write 2"]
+
+
+def test_bounds_are_cached_until_the_next_dom_write(monkeypatch):
+    """The bounding box is read once per widget, a DOM write invalidates the cache"""
+    label = PLabel("a")
+    reads = []
+    original = label._elem.getBoundingClientRect  # pylint: disable=protected-access
+
+    def read_bounds():
+        """Count the layout reads"""
+        reads.append(True)
+        return original()
+
+    monkeypatch.setattr(label._elem, "getBoundingClientRect", read_bounds)  # pylint: disable=protected-access
+    flush_renders()
+    scheduler.measure(label.get_bounds)
+    scheduler.measure(label.get_bounds)
+    flush_renders()
+    assert len(reads) == 1
+    scheduler.mutate(lambda: label.set_text("b"))
+    scheduler.measure(label.get_bounds)  # Reads before the write of the same frame, so from the cache
+    flush_renders()
+    assert len(reads) == 1
+    scheduler.measure(label.get_bounds)
+    flush_renders()
+    assert len(reads) == 2
@@ -0,0 +1,47 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for the incremental record parser of the streaming loader
+"""
+
+import json
+
+from widgets.stream import _PRecordParser
+
+
+_RECORDS = [{"name": "a, [b]", "n": 1}, [1, 2], "text", 123, True, None, {"nested": {"x": [3.5]}}]
+
+
+def _parse_chunks(text: str, size: int) -> list:
+    """Feed the text in chunks of the size, and collect the records"""
+    parser = _PRecordParser()
+    records = []
+    for start in range(0, len(text), size):
+        records.extend(parser.feed(text[start : start + size]))
+    records.extend(parser.close())
+    return records
+
+
+def test_json_array_split_at_every_position():
+    """Array elements are parsed when they are complete, also when a chunk ends inside a string or a number"""
+    text = "  " + json.dumps(_RECORDS, indent=1)
+    for size in range(1, 12):
+        assert _parse_chunks(text, size) == _RECORDS
+
+
+def test_json_array_records_are_returned_while_feeding():
+    """A complete element is returned before the array ends, a number waits for the next chunk"""
+    parser = _PRecordParser()
+    assert parser.feed('[{"a": 1}, 12') == [{"a": 1}]
+    assert parser.feed("3, 4") == [123]
+    assert parser.feed("]") == [4]
+    assert parser.close() == []
+
+
+def test_ndjson_lines_split_across_chunks():
+    """Newline delimited records are parsed per complete line, the last line without newline on close"""
+    text = "\n".join(json.dumps(r) for r in _RECORDS if not isinstance(r, list)) + "\n\n" + json.dumps([1, 2])
+    expected = [r for r in _RECORDS if not isinstance(r, list)] + [[1, 2]]
+    for size in range(1, 12):
+        assert _parse_chunks(text, size) == expected
@@ -0,0 +1,86 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for cloning widgets from a widget template
+"""
+
+import re
+
+import pytest
+
+import widgets.template
+
+from widgets import PButton, PLabel, PPanel, PTemplate, get_live_proxy_counts, scheduler
+
+
+class _Elements(dict):
+    """Elements by id, like the JsProxy of the object returned by ptemplate_elements() in widgets.js"""
+
+    def to_py(self) -> dict:
+        """Convert to a Python dictionary"""
+        return dict(self)
+
+
+def _descendants(elem) -> list:
+    """The element and its descendant elements"""
+    found = [elem]
+    for c in elem.children:
+        found.extend(_descendants(c))
+    return found
+
+
+def _template_elements(elem) -> _Elements:
+    """Stand-in for ptemplate_elements() in widgets.js"""
+    return _Elements((e.id, e) for e in _descendants(elem) if e.id)
+
+
+def _template_shift_ids(elem, offset: int):
+    """Stand-in for ptemplate_shift_ids() in widgets.js"""
+    def shift(text):
+        return re.sub(r"\be(\d+)", lambda m: "e" + str(int(m.group(1)) + offset), text)
+
+    for e in _descendants(elem):
+        e.id = shift(e.id)
+        e.style.gridArea = shift(e.style.gridArea)
+
+
+@pytest.fixture(autouse=True)
+def template_functions(monkeypatch):
+    """Install the stand-ins for the template functions in widgets.js"""
+    monkeypatch.setattr(widgets.template.js, "ptemplate_elements", _template_elements)
+    monkeypatch.setattr(widgets.template.js, "ptemplate_shift_ids", _template_shift_ids)
+
+
+class _Item(PPanel):
+    """Template item with a click handler"""
+
+    def __init__(self, text: str):
+        """Constructor, a label and a button"""
+        super().__init__(False)
+        self.label = PLabel(text).set_color("blue")
+        self.button = PButton("Delete").on_click(self.clicked)
+        self.add_children([self.label, self.button])
+
+    def clicked(self, event):  # pylint: disable=unused-argument
+        """Click handler"""
+
+
+def test_building_the_prototype_does_not_render_other_widgets():
+    """The prototype is rendered on its own, pending renders of the page stay pending until the next frame"""
+    other = PLabel("a").set_text("b")
+    item = PTemplate(_Item, "x").create()
+    assert other._elem.textContent == "a"  # pylint: disable=protected-access
+    assert len(scheduler._pending_renders) == 1  # pylint: disable=protected-access
+    assert item.label._elem.style.color == "blue"  # pylint: disable=protected-access
+
+
+def test_prototype_listeners_are_disposed():
+    """Only the cloned widgets keep event listener proxies, the prototype is disposed after it was captured"""
+    before = get_live_proxy_counts().get("PButton", 0)
+    template = PTemplate(_Item, "x")
+    first = template.create()
+    second = template.create()
+    assert get_live_proxy_counts().get("PButton", 0) == before + 2
+    assert not first.button.is_disposed()
+    assert first.button._widget_id != second.button._widget_id  # pylint: disable=protected-access
@@ -0,0 +1,51 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for the editable widgets, that share the enabled, readonly and change properties of their inner form control
+"""
+
+import pickle
+
+from widgets import PTextArea, PTextInput, flush_renders
+
+
+def _change(event):  # pylint: disable=unused-argument
+    """Change handler"""
+
+
+def test_properties_are_rendered_on_the_inner_form_control():
+    """Disabled and read-only apply to the text area and input elements, not to the surrounding element"""
+    text_area = PTextArea("a").set_readonly(True).set_enabled(False)
+    text_input = PTextInput("b").set_readonly(True).set_enabled(False)
+    flush_renders()
+    for widget, elem in ((text_area, text_area._elem_textarea), (text_input, text_input._elem_input)):  # pylint: disable=protected-access
+        assert elem.hasAttribute("readonly")
+        assert elem.hasAttribute("disabled")
+        assert not widget._elem.hasAttribute("disabled")  # pylint: disable=protected-access
+
+
+def test_properties_survive_pickling():
+    """The shared properties and the change handler are restored after unpickling"""
+    text_area = PTextArea("line 1\nline 2").set_readonly(True).on_change(_change)
+    flush_renders()
+    restored = pickle.loads(pickle.dumps(text_area))
+    restored.restore_state()
+    assert restored.is_readonly()
+    assert restored._elem_textarea.hasAttribute("readonly")  # pylint: disable=protected-access
+    assert restored._change is _change  # pylint: disable=protected-access
+    # The input and change listeners
+    assert len(restored._listeners) == 2  # pylint: disable=protected-access
+    assert restored.get_value() == "line 1\nline 2"
+
+
+def test_following_log_view_renders_the_window_at_the_last_line():
+    """When following, the rendered window contains the last line in the same frame as the scroll to it"""
+    text_area = PTextArea("").set_log_view(True)
+    flush_renders()
+    text_area.append("\n".join("line " + str(i) for i in range(100)))
+    flush_renders()
+    virtual_rows = text_area._virtual_rows  # pylint: disable=protected-access
+    shown = [key[0] for key in virtual_rows._shown if key is not None]  # pylint: disable=protected-access
+    assert 99 in shown
+    assert text_area._elem_log.scrollTop == virtual_rows._scroll_top > 0  # pylint: disable=protected-access
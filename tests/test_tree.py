@@ -0,0 +1,79 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+Tests for the lazy loading tree widget
+"""
+
+import asyncio
+
+from widgets import PTree
+
+
+class _FlakyProvider:  # pylint: disable=too-few-public-methods
+    """Provider that fails once for the path of the failing node"""
+
+    def __init__(self, failing_path: tuple[str, ...] | None = ("a",)):
+        """Constructor"""
+        self.failing_path = failing_path
+        self.failed = False
+
+    def __call__(self, path: tuple[str, ...]) -> list[tuple[str, str, bool]]:
+        """Return the child nodes of the path"""
+        if path == self.failing_path and not self.failed:
+            self.failed = True
+            raise OSError("network down")
+        if len(path) == 0:
+            return [("a", "A", True), ("b", "B", False)]
+        return [("c", "C", False)]
+
+
+def test_failing_provider_collapses_node_and_can_retry():
+    """A node whose children failed to load is collapsed and not loading, so expanding it retries"""
+
+    async def run():
+        tree = PTree(_FlakyProvider())
+        await asyncio.sleep(0)
+        tree.expand(("a",))
+        await asyncio.sleep(0)
+        node = tree._find_node(("a",))  # pylint: disable=protected-access
+        assert not node.loading
+        assert not tree.is_expanded(("a",))
+        tree.expand(("a",))
+        await asyncio.sleep(0)
+        assert tree.is_expanded(("a",))
+        assert [row[1] for row in tree._rows] == [("a",), ("a", "c"), ("b",)]  # pylint: disable=protected-access
+
+    asyncio.run(run())
+
+
+def test_failed_root_load_can_be_retried():
+    """After the root node failed to load, reloading the tree loads the root nodes"""
+
+    async def run():
+        tree = PTree(_FlakyProvider(()))
+        await asyncio.sleep(0)
+        assert not tree._root.loading  # pylint: disable=protected-access
+        assert not tree._rows  # pylint: disable=protected-access
+        tree.reload()
+        await asyncio.sleep(0)
+        assert [row[1] for row in tree._rows] == [("a",), ("b",)]  # pylint: disable=protected-access
+
+    asyncio.run(run())
+
+
+def test_row_indexes_follow_expand_and_collapse():
+    """The index of each visible row by path is kept up to date, when rows are inserted and removed"""
+
+    async def run():
+        tree = PTree(_FlakyProvider(None))
+        await asyncio.sleep(0)
+        tree.expand(("a",))
+        await asyncio.sleep(0)
+        assert tree._find_row(("b",)) == 2  # pylint: disable=protected-access
+        assert tree._find_row(("a", "c")) == 1  # pylint: disable=protected-access
+        tree.collapse(("a",))
+        assert tree._find_row(("b",)) == 1  # pylint: disable=protected-access
+        assert tree._find_row(("a", "c")) == -1  # pylint: disable=protected-access
+
+    asyncio.run(run())
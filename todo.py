@@ -6,7 +6,7 @@ Todo example
 """
 
 from datetime import datetime
-from widgets import PPanel, PLabel, PTextInput, PButton
+from widgets import PPanel, PLabel, PTextInput, PButton, PTemplate
 
 
 class TodoForm(PPanel):
@@ -24,17 +24,17 @@ class TodoForm(PPanel):
         text = self.inp.get_value()
         if len(text) == 0:
             text = "<" + str(datetime.now()) + ">"
-        self.get_parent().lst.add_child(TodoItem(text))
+        self.get_parent().lst.acquire_child(TodoItem, text, factory=_TODO_ITEM_TEMPLATE.create)
         self.inp.set_value("")
 
 
 class TodoItem(PPanel):
     """Todo item containing item delete/display fields"""
 
-    def __init__(self, todoTxt):
+    def __init__(self, todo_text):
         super().__init__(False)
         self.set_row_gap(5).set_column_gap(5)
-        self.lbl = PLabel(todoTxt)
+        self.lbl = PLabel(todo_text)
         self.delete_btn = (
             PButton("Delete").set_icon("trash alternate").on_click(self.delete_btn_click)
         )
@@ -43,7 +43,16 @@ class TodoItem(PPanel):
     def delete_btn_click(self, event):  # pylint: disable=unused-argument
         """Delete button event handler"""
         self.get_parent().get_parent().frm.inp.request_focus()
-        self.get_parent().remove_child(self)
+        self.get_parent().recycle_child(self)
+
+    def _recycle(self, todo_text):  # pylint: disable=arguments-differ
+        """Reset a deleted item, to reuse it for a new todo"""
+        self._reset_state()
+        self.lbl.set_text(todo_text)
+
+
+# Todo items are cloned from a prototype, instead of building their elements one by one
+_TODO_ITEM_TEMPLATE = PTemplate(TodoItem, "")
 
 
 class TodoList(PPanel):
@@ -6,11 +6,23 @@ PyScriptWidgets - A client side GUI class (widget) library for building web appl
 """
 
 
+from collections.abc import Callable
 from typing import Any, Self
 # Prefer pyscript import over more basic js import for the document and window objects
 from pyscript import document  # type: ignore # pylint: disable=import-error
 
-from widgets.globals import _generate_unique_id, _ensure_unique_id_beyond
+from widgets.globals import (
+    _add_listener,
+    _generate_unique_id,
+    _ensure_unique_id_beyond,
+    _hydration_element,
+    _observe_resize,
+    _remove_listener,
+    _remove_listeners,
+    _shift_ids,
+    _unobserve_resize,
+)
+from widgets.scheduler import _schedule_render, _measure_bounds
 
 
 class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
@@ -21,9 +33,11 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         self._tag = tag
         self._parent = None
         self._widget_id = _generate_unique_id()
+        self._listeners = []  # Event listeners: (elem, event_type, listener, filter), not pickled
+        self._subscriptions = []  # Subscribed event listeners: (event_type, listener, mode, millis)
+        self._disposed = False
         # DOM manipulation: https://developer.mozilla.org/en-US/docs/Web/API/Document_Object_Model
-        self._elem = document.createElement(self._tag)
-        self._insert_id_grid_area()
+        self._insert_element()
         # Standard widget styling through CSS: https://stackoverflow.com/questions/507138/how-to-add-a-class-to-a-given-element
         self._classlist = []
         self._elem.classList.add(self.__class__.__name__)
@@ -47,6 +61,19 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         self._render_max_width()
         self._max_height = None
         self._render_max_height()
+        self._resize = None
+        self._render_resize()
+
+    def _create_element(self) -> Any:
+        """Override this method to create the DOM element in another namespace"""
+        return document.createElement(self._tag)
+
+    def _insert_element(self):
+        """Adopt the pre-rendered or cloned element with the widget id, or create a new element"""
+        self._elem = _hydration_element(self._widget_id, self._tag)
+        if self._elem is None:
+            self._elem = self._create_element()
+            self._insert_id_grid_area()
 
     def _insert_id_grid_area(self):
         """Insert state for id and grid area"""
@@ -75,6 +102,7 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         # TypeError: cannot pickle 'pyodide.ffi.JsProxy' object
         # See: https://stackoverflow.com/questions/2345944/exclude-objects-field-from-pickling-in-python
         del state["_elem"]
+        del state["_listeners"]
 
     def __getstate__(self) -> dict[str, Any]:
         """Magic method to get the object state when pickling"""
@@ -84,8 +112,8 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
 
     def _insert_state(self):
         """Override this method to insert state, for keys that could not be pickled"""
-        self._elem = document.createElement(self._tag)
-        self._insert_id_grid_area()
+        self._listeners = []
+        self._insert_element()
 
     def __setstate__(self, state: dict[str, Any]):
         """Magic method to set the object state when unpickling"""
@@ -106,10 +134,96 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         self._render_min_height()
         self._render_max_width()
         self._render_max_height()
+        self._render_resize()
+        self._render_subscriptions()
+
+    def dispose(self):
+        """Remove the event listeners and destroy their JS proxies, when the widget is not used anymore"""
+        self._disposed = True
+        _remove_listeners(self)
+        _unobserve_resize(self)
+
+    def is_disposed(self) -> bool:
+        """Was the widget disposed, observables drop their subscriptions to it"""
+        return self._disposed
+
+    def _recycle(self, *args: Any):
+        """Override this method to reset the widget with new constructor arguments, to reuse it from a pool of a compound widget"""
+        # Only widgets of classes that override this method are pooled, an override calls _reset_state() first
+
+    def _reset_state(self):
+        """Override this method to reset the properties to their constructor defaults, before a widget is recycled"""
+        self.set_visible(True)
+        self.set_color("")
+        self.set_bg_color("")
+        self.set_width(None)
+        self.set_height(None)
+        self.set_min_width(None)
+        self.set_min_height(None)
+        self.set_max_width(None)
+        self.set_max_height(None)
+        self.on_resize(None)
+        for event_type, listener, _, _ in list(self._subscriptions):
+            self.unsubscribe(event_type, listener)
+
+    def _clone_state(self, offset: int):
+        """Override this method to insert state after cloning from a widget template, the id numbers are shifted by the offset"""
+        self._widget_id = _shift_ids(self._widget_id, offset)
+        # Event listeners are not cloned
+        self._render_resize()
+        self._render_subscriptions()
 
     def after_page_load(self):
         """Override this method tot execute code after the page DOM has loaded"""
 
+    def get_bounds(self) -> tuple[float, float, float, float]:
+        """Bounding box (x, y, width, height) of the widget, call this from a measure() callback to prevent layout thrashing"""
+        return _measure_bounds(self)
+
+    # Subscriptions
+    def _render_subscriptions(self):
+        """Renderer"""
+        for event_type, listener, mode, millis in self._subscriptions:
+            _add_listener(self, self._elem, event_type, listener, mode, millis)
+
+    def subscribe(  # pylint: disable=too-many-arguments
+        self,
+        event_type: str,
+        listener: Callable,
+        *,
+        throttle_millis: int | None = None,
+        debounce_millis: int | None = None,
+        animation_frame: bool = False,
+    ) -> Self:
+        """Add an event listener to the widget element, high frequency events can be filtered before they reach Python:
+        - throttle_millis: at most one call per period, with the last event of the period
+        - debounce_millis: one call with the last event, after no events arrived for the period
+        - animation_frame: at most one call per animation frame, with the last event
+        """
+        options = [throttle_millis is not None, debounce_millis is not None, animation_frame]
+        if options.count(True) > 1:
+            raise ValueError("Choose one of throttle_millis, debounce_millis or animation_frame")
+        if throttle_millis is not None:
+            mode, millis = "throttle", throttle_millis
+        elif debounce_millis is not None:
+            mode, millis = "debounce", debounce_millis
+        elif animation_frame:
+            mode, millis = "frame", 0
+        else:
+            mode, millis = None, 0
+        self._subscriptions.append((event_type, listener, mode, millis))
+        _add_listener(self, self._elem, event_type, listener, mode, millis)
+        return self
+
+    def unsubscribe(self, event_type: str, listener: Callable) -> Self:
+        """Remove an event listener, that was added with subscribe()"""
+        for index, (t, l, _, _) in enumerate(self._subscriptions):
+            if t == event_type and l == listener:
+                del self._subscriptions[index]
+                _remove_listener(self, self._elem, event_type, listener)
+                break
+        return self
+
     # Property: dark_mode
     def is_dark_mode(self) -> bool:
         """Accessor"""
@@ -139,7 +253,7 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Mutator"""
         if self._visible != visible:
             self._visible = visible
-            self._render_visible()
+            _schedule_render(self._render_visible)
         return self
 
     # Property: color
@@ -155,7 +269,7 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Mutator"""
         if self._color != color:
             self._color = color
-            self._render_color()
+            _schedule_render(self._render_color)
         return self
 
     # Property: bg_color
@@ -171,7 +285,7 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Mutator"""
         if self._bg_color != bg_color:
             self._bg_color = bg_color
-            self._render_bg_color()
+            _schedule_render(self._render_bg_color)
         return self
 
     # Property: width
@@ -183,6 +297,8 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
                 self._elem.style.width = str(pixels) + "px"
             except ValueError:
                 self._elem.style.width = str(self._width)  # It was not an integer value
+        else:
+            self._elem.style.width = None
 
     def get_width(self) -> int | str | None:
         """Accessor"""
@@ -192,7 +308,7 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Mutator"""
         if self._width != width:
             self._width = width
-            self._render_width()
+            _schedule_render(self._render_width)
         return self
 
     # Property: height
@@ -204,6 +320,8 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
                 self._elem.style.height = str(pixels) + "px"
             except ValueError:
                 self._elem.style.height = str(self._height)  # It was not an integer value
+        else:
+            self._elem.style.height = None
 
     def get_height(self) -> int | str | None:
         """Accessor"""
@@ -213,7 +331,7 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Mutator"""
         if self._height != height:
             self._height = height
-            self._render_height()
+            _schedule_render(self._render_height)
         return self
 
     # Property: min_width
@@ -225,6 +343,8 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
                 self._elem.style.minWidth = str(pixels) + "px"
             except ValueError:
                 self._elem.style.minWidth = str(self._min_width)  # It was not an integer value
+        else:
+            self._elem.style.minWidth = None
 
     def get_min_width(self) -> int | str | None:
         """Accessor"""
@@ -234,7 +354,7 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Mutator"""
         if self._min_width != min_width:
             self._min_width = min_width
-            self._render_min_width()
+            _schedule_render(self._render_min_width)
         return self
 
     # Property: min_height
@@ -246,6 +366,8 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
                 self._elem.style.minHeight = str(pixels) + "px"
             except ValueError:
                 self._elem.style.minHeight = str(self._min_height)  # It was not an integer value
+        else:
+            self._elem.style.minHeight = None
 
     def get_min_height(self) -> int | str | None:
         """Accessor"""
@@ -255,7 +377,7 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Mutator"""
         if self._min_height != min_height:
             self._min_height = min_height
-            self._render_min_height()
+            _schedule_render(self._render_min_height)
         return self
 
     # Property: max_width
@@ -267,6 +389,8 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
                 self._elem.style.maxWidth = str(pixels) + "px"
             except ValueError:
                 self._elem.style.maxWidth = str(self._max_width)  # It was not an integer value
+        else:
+            self._elem.style.maxWidth = None
 
     def get_max_width(self) -> int | str | None:
         """Accessor"""
@@ -276,7 +400,7 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Mutator"""
         if self._max_width != max_width:
             self._max_width = max_width
-            self._render_max_width()
+            _schedule_render(self._render_max_width)
         return self
 
     # Property: max_height
@@ -288,6 +412,8 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
                 self._elem.style.maxHeight = str(pixels) + "px"
             except ValueError:
                 self._elem.style.maxHeight = str(self._max_height)  # It was not an integer value
+        else:
+            self._elem.style.maxHeight = None
 
     def get_max_height(self) -> int | str | None:
         """Accessor"""
@@ -297,5 +423,24 @@ class PBaseWidget:  # pylint: disable=too-many-instance-attributes,too-many-publ
         """Mutator"""
         if self._max_height != max_height:
             self._max_height = max_height
-            self._render_max_height()
+            _schedule_render(self._render_max_height)
+        return self
+
+    # Property: resize (writeonly)
+    def _render_resize(self):
+        """Renderer"""
+        if self._resize is not None:
+            _observe_resize(self)
+        else:
+            _unobserve_resize(self)
+
+    def _resized(self, width: float, height: float):
+        """Size change notification from the shared resize observer, duplicate sizes are dropped"""
+        self._resize(width, height)
+
+    def on_resize(self, resize: Callable[[float, float], None] | None) -> Self:
+        """Mutator, the handler is called with the content width and height, when the size of the widget changes"""
+        if id(self._resize) != id(resize):  # Object reference/id comparison
+            self._resize = resize
+            self._render_resize()
         return self
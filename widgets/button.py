@@ -10,10 +10,11 @@ from collections.abc import Callable
 from typing import Self
 # Prefer pyscript import over more basic js import for the document and window objects
 from pyscript import document  # type: ignore # pylint: disable=import-error
-from pyodide.ffi.wrappers import add_event_listener, remove_event_listener  # type: ignore # pylint: disable=import-error
 
 from widgets.focussable import PFocussableWidget
-from widgets.globals import _ID_SUPPLEMENT
+from widgets.globals import _ID_SUPPLEMENT, _add_listener, _remove_listener
+from widgets.handler import PHandler
+from widgets.scheduler import _schedule_render
 
 
 class PButton(PFocussableWidget):
@@ -31,6 +32,12 @@ class PButton(PFocussableWidget):
         self._click = None
         self._render_click()
 
+    def _clone_state(self, offset: int):
+        """Override this method to insert state after cloning from a widget template, the id numbers are shifted by the offset"""
+        super()._clone_state(offset)
+        # Event listeners are not cloned
+        self._render_click()
+
     def restore_state(self):
         """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
         super().restore_state()
@@ -38,6 +45,19 @@ class PButton(PFocussableWidget):
         self._render_text_icon()
         self._render_click()
 
+    def dispose(self):
+        """Cancel a running click handler, remove the event listeners and destroy their JS proxies"""
+        super().dispose()
+        if isinstance(self._click, PHandler):
+            self._click.cancel()
+
+    def _recycle(self, text: str):  # pylint: disable=arguments-differ
+        """Override this method to reset the widget with new constructor arguments, to reuse it from a pool of a compound widget"""
+        self._reset_state()
+        self.set_text(text)
+        self.set_icon("")
+        self.on_click(None)
+
     # Property: text
     def _render_text_icon(self):
         """Renderer"""
@@ -61,7 +81,7 @@ class PButton(PFocussableWidget):
         """Mutator"""
         if self._text != text:
             self._text = text
-            self._render_text_icon()
+            _schedule_render(self._render_text_icon)
         return self
 
     # Property: icon
@@ -73,20 +93,24 @@ class PButton(PFocussableWidget):
         """Mutator"""
         if self._icon != icon:
             self._icon = icon
-            self._render_text_icon()
+            _schedule_render(self._render_text_icon)
         return self
 
     # Property: click (writeonly)
     def _render_click(self):
         """Renderer"""
         if self._click is not None:
-            add_event_listener(self._elem, "click", self._click)
+            _add_listener(self, self._elem, "click", self._click)
 
-    def on_click(self, click: Callable | None) -> Self:
-        """Mutator"""
+    def on_click(self, click: Callable | None, concurrency: str | None = None, limit: int | None = None) -> Self:
+        """Mutator, an async handler can have a concurrency policy: drop, cancel, queue or parallel with an optional limit"""
+        if click is not None and concurrency is not None:
+            click = PHandler(click, concurrency, limit)
         if id(self._click) != id(click):  # Object reference/id comparison
             if self._click is not None:
-                remove_event_listener(self._elem, "click", self._click)
+                _remove_listener(self, self._elem, "click", self._click)
+                if isinstance(self._click, PHandler):
+                    self._click.cancel()
             self._click = click
             self._render_click()
         return self
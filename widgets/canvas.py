@@ -0,0 +1,255 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+from array import array
+from typing import Any, Self
+
+import js  # type: ignore # pylint: disable=import-error
+from pyodide.ffi import to_js  # type: ignore # pylint: disable=import-error
+
+from widgets.base import PBaseWidget
+from widgets.globals import _interleave_coordinates
+from widgets.scheduler import mutate
+
+
+# Draw command opcodes, keep these in sync with pcanvas_replay() in widgets.js
+_OP_BEGIN_PATH = 0
+_OP_CLOSE_PATH = 1
+_OP_MOVE_TO = 2
+_OP_LINE_TO = 3
+_OP_ARC = 4
+_OP_RECT = 5
+_OP_FILL = 6
+_OP_STROKE = 7
+_OP_FILL_RECT = 8
+_OP_STROKE_RECT = 9
+_OP_CLEAR_RECT = 10
+_OP_FILL_STYLE = 11
+_OP_STROKE_STYLE = 12
+_OP_LINE_WIDTH = 13
+_OP_FONT = 14
+_OP_FILL_TEXT = 15
+_OP_SAVE = 16
+_OP_RESTORE = 17
+_OP_POLYLINE = 18
+_OP_POINTS = 19
+_OP_CLEAR = 20
+_OP_GLOBAL_ALPHA = 21
+
+
+class PCanvas(PBaseWidget):  # pylint: disable=too-many-public-methods
+    """Canvas widget class, draw commands are buffered in Python and replayed with one JavaScript call per frame"""
+
+    # See: https://developer.mozilla.org/en-US/docs/Web/API/CanvasRenderingContext2D
+    # The buffered commands are not pickled, redraw the canvas in after_page_load()
+
+    def __init__(self, canvas_width: int = 300, canvas_height: int = 150):
+        """Constructor, define tag and class attributes"""
+        super().__init__("canvas")
+        # Draw command buffer, not pickled
+        self._ops = array("d")
+        self._strings = []
+        self._flush_requested = False
+        self._size_changed = False
+        # Properties
+        self._canvas_width = canvas_width
+        self._render_canvas_width()
+        self._canvas_height = canvas_height
+        self._render_canvas_height()
+
+    def _delete_state(self, state):
+        """Override this method to delete state keys that cannot be pickled"""
+        super()._delete_state(state)
+        del state["_ops"]
+        del state["_strings"]
+        del state["_flush_requested"]
+        del state["_size_changed"]
+
+    def _insert_buffer(self):
+        """Insert an empty draw command buffer"""
+        self._ops = array("d")
+        self._strings = []
+        self._flush_requested = False
+        self._size_changed = False
+
+    def _insert_state(self):
+        """Override this method to insert state, for keys that could not be pickled"""
+        super()._insert_state()
+        self._insert_buffer()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_canvas_width()
+        self._render_canvas_height()
+
+    # Draw command buffer
+    def _command(self, *args: float, coordinates: array | None = None) -> Self:
+        """Append a draw command to the buffer, it is replayed in the DOM write phase of the next animation frame"""
+        # The opcode, arguments and coordinates are buffered before the flush, that runs immediately with sync rendering
+        self._ops.extend(args)
+        if coordinates is not None:
+            self._ops.extend(coordinates)
+        self._request_flush()
+        return self
+
+    def _request_flush(self):
+        """Replay the buffered draw commands in the DOM write phase of the next animation frame, once"""
+        if not self._flush_requested:
+            self._flush_requested = True
+            mutate(self._flush_commands)
+
+    def _string(self, s: str) -> int:
+        """Index of a string argument"""
+        self._strings.append(s)
+        return len(self._strings) - 1
+
+    def _flush_commands(self):
+        """Replay all buffered draw commands, with a single call into JavaScript"""
+        self._flush_requested = False
+        if self._size_changed:
+            # Resizing clears the canvas, so apply the size before replaying the commands of the same frame
+            self._size_changed = False
+            self._render_canvas_width()
+            self._render_canvas_height()
+        if len(self._ops) > 0:
+            js.pcanvas_replay(self._elem, to_js(self._ops), to_js(self._strings))
+            self._ops = array("d")
+            self._strings = []
+
+    def get_command_count(self) -> int:
+        """Number of buffered numbers, opcodes and arguments, that are not replayed yet"""
+        return len(self._ops)
+
+    # Draw commands
+    def clear(self) -> Self:
+        """Clear the whole canvas"""
+        return self._command(_OP_CLEAR)
+
+    def save(self) -> Self:
+        """Push the drawing state"""
+        return self._command(_OP_SAVE)
+
+    def restore(self) -> Self:
+        """Pop the drawing state"""
+        return self._command(_OP_RESTORE)
+
+    def set_fill_style(self, fill_style: str) -> Self:
+        """Color or style to fill shapes"""
+        return self._command(_OP_FILL_STYLE, self._string(fill_style))
+
+    def set_stroke_style(self, stroke_style: str) -> Self:
+        """Color or style of lines"""
+        return self._command(_OP_STROKE_STYLE, self._string(stroke_style))
+
+    def set_line_width(self, line_width: float) -> Self:
+        """Width of lines"""
+        return self._command(_OP_LINE_WIDTH, line_width)
+
+    def set_global_alpha(self, global_alpha: float) -> Self:
+        """Transparency of everything that is drawn"""
+        return self._command(_OP_GLOBAL_ALPHA, global_alpha)
+
+    def set_font(self, font: str) -> Self:
+        """CSS font of text"""
+        return self._command(_OP_FONT, self._string(font))
+
+    def begin_path(self) -> Self:
+        """Start a new path"""
+        return self._command(_OP_BEGIN_PATH)
+
+    def close_path(self) -> Self:
+        """Close the current path"""
+        return self._command(_OP_CLOSE_PATH)
+
+    def move_to(self, x: float, y: float) -> Self:
+        """Start a new sub path"""
+        return self._command(_OP_MOVE_TO, x, y)
+
+    def line_to(self, x: float, y: float) -> Self:
+        """Add a line to the current sub path"""
+        return self._command(_OP_LINE_TO, x, y)
+
+    def arc(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, x: float, y: float, radius: float, start_angle: float, end_angle: float
+    ) -> Self:
+        """Add a circular arc to the current path"""
+        return self._command(_OP_ARC, x, y, radius, start_angle, end_angle)
+
+    def rect(self, x: float, y: float, width: float, height: float) -> Self:
+        """Add a rectangle to the current path"""
+        return self._command(_OP_RECT, x, y, width, height)
+
+    def fill(self) -> Self:
+        """Fill the current path"""
+        return self._command(_OP_FILL)
+
+    def stroke(self) -> Self:
+        """Stroke the current path"""
+        return self._command(_OP_STROKE)
+
+    def fill_rect(self, x: float, y: float, width: float, height: float) -> Self:
+        """Draw a filled rectangle"""
+        return self._command(_OP_FILL_RECT, x, y, width, height)
+
+    def stroke_rect(self, x: float, y: float, width: float, height: float) -> Self:
+        """Draw a rectangle outline"""
+        return self._command(_OP_STROKE_RECT, x, y, width, height)
+
+    def clear_rect(self, x: float, y: float, width: float, height: float) -> Self:
+        """Clear a rectangle"""
+        return self._command(_OP_CLEAR_RECT, x, y, width, height)
+
+    def fill_text(self, text: str, x: float, y: float) -> Self:
+        """Draw text"""
+        return self._command(_OP_FILL_TEXT, self._string(text), x, y)
+
+    def polyline(self, xs: Any, ys: Any = None) -> Self:
+        """Add connected lines to the current path, from lists or NumPy arrays of x and y, or of (x, y) pairs"""
+        xy = _interleave_coordinates(xs, ys)
+        return self._command(_OP_POLYLINE, len(xy) // 2, coordinates=xy)
+
+    def points(self, xs: Any, ys: Any = None, size: float = 2.0) -> Self:
+        """Draw filled squares centered on the points, from lists or NumPy arrays of x and y, or of (x, y) pairs"""
+        xy = _interleave_coordinates(xs, ys)
+        return self._command(_OP_POINTS, len(xy) // 2, size, coordinates=xy)
+
+    # Property: canvas_width
+    def _render_canvas_width(self):
+        """Renderer"""
+        self._elem.width = self._canvas_width
+
+    def get_canvas_width(self) -> int:
+        """Accessor"""
+        return self._canvas_width
+
+    def set_canvas_width(self, canvas_width: int) -> Self:
+        """Mutator, width of the drawing surface in pixels, this clears the canvas"""
+        if self._canvas_width != canvas_width:
+            self._canvas_width = canvas_width
+            self._size_changed = True
+            self._request_flush()
+        return self
+
+    # Property: canvas_height
+    def _render_canvas_height(self):
+        """Renderer"""
+        self._elem.height = self._canvas_height
+
+    def get_canvas_height(self) -> int:
+        """Accessor"""
+        return self._canvas_height
+
+    def set_canvas_height(self, canvas_height: int) -> Self:
+        """Mutator, height of the drawing surface in pixels, this clears the canvas"""
+        if self._canvas_height != canvas_height:
+            self._canvas_height = canvas_height
+            self._size_changed = True
+            self._request_flush()
+        return self
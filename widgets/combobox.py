@@ -0,0 +1,398 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+import asyncio
+import inspect
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from typing import Any, Self
+
+from js import console  # type: ignore # pylint: disable=import-error
+# Prefer pyscript import over more basic js import for the document and window objects
+from pyscript import document  # type: ignore # pylint: disable=import-error
+
+from widgets.globals import (
+    _ID_SUPPLEMENT,
+    _add_listener,
+    _adopt_or_create_element,
+    _append_element,
+    _now_millis,
+    _set_timeout,
+)
+from widgets.input import PInputWidget
+from widgets.scheduler import _schedule_render
+from widgets.virtual import _PVirtualRows
+
+
+_ID_MENU = "menu"
+_ROW_HEIGHT = 32
+_VISIBLE_ROWS = 10
+_DEBOUNCE_MILLIS = 150
+_TRIGRAM = 3
+
+
+class _PSearchIndex:  # pylint: disable=too-few-public-methods
+    """Search index for a set of option texts, built once per option set"""
+
+    # Queries shorter than a trigram match on prefix, using a sorted list and bisection.
+    # Longer queries match on substring, using the intersection of trigram posting lists.
+    # When a substring query is extended, the previous result is filtered instead of searching all options.
+
+    def __init__(self, texts: list[str]):
+        """Constructor, build the prefix and trigram indexes"""
+        self._texts = [t.casefold() for t in texts]
+        self._sorted = sorted(range(len(self._texts)), key=lambda i: self._texts[i])
+        self._sorted_texts = [self._texts[i] for i in self._sorted]
+        self._trigrams = {}
+        for i, t in enumerate(self._texts):
+            for g in {t[j : j + _TRIGRAM] for j in range(len(t) - _TRIGRAM + 1)}:
+                self._trigrams.setdefault(g, []).append(i)
+        self._last_query = ""
+        self._last_result = list(range(len(self._texts)))
+
+    def search(self, query: str) -> list[int]:
+        """Indices of the matching options, in option order with prefix matches first"""
+        q = query.casefold()
+        if q == self._last_query:
+            return self._last_result
+        if len(q) == 0:
+            result = list(range(len(self._texts)))
+        elif len(q) < _TRIGRAM:
+            result = self._prefix_search(q)
+        elif len(self._last_query) >= _TRIGRAM and q.startswith(self._last_query):
+            # Incremental search, narrow down the previous substring matches
+            result = [i for i in self._last_result if q in self._texts[i]]
+        else:
+            result = self._trigram_search(q)
+        if len(q) >= _TRIGRAM:
+            prefix = [i for i in result if self._texts[i].startswith(q)]
+            other = [i for i in result if not self._texts[i].startswith(q)]
+            result = prefix + other
+        self._last_query = q
+        self._last_result = result
+        return result
+
+    def _prefix_search(self, q: str) -> list[int]:
+        """Options that start with the query"""
+        lo = bisect_left(self._sorted_texts, q)
+        hi = bisect_right(self._sorted_texts, q + "\uffff", lo)
+        return sorted(self._sorted[lo:hi])
+
+    def _trigram_search(self, q: str) -> list[int]:
+        """Options that contain the query"""
+        grams = {q[j : j + _TRIGRAM] for j in range(len(q) - _TRIGRAM + 1)}
+        postings = sorted((self._trigrams.get(g, []) for g in grams), key=len)
+        candidates = set(postings[0])
+        for p in postings[1:]:
+            if len(candidates) == 0:
+                break
+            candidates.intersection_update(p)
+        return [i for i in sorted(candidates) if q in self._texts[i]]
+
+
+class PComboBox(PInputWidget):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    """Combobox widget class, with incremental search and a virtualized list of options"""
+
+    # See: https://fomantic-ui.com/modules/dropdown.html
+    # Options are (key, text) tuples. A provider is called with the query and returns, or asynchronously returns,
+    # the matching options. The provider is pickled with the widget tree, so use a function or method.
+
+    def __init__(self, options: list[tuple[Any, str]] | None = None):
+        """Constructor, define tag and class attributes"""
+        super().__init__("text", "")
+        self._elem.style.position = "relative"
+        # Options, the search index is not pickled, it is built again after unpickling
+        self._options = [] if options is None else list(options)
+        self._provider = None
+        self._provider_sequence = 0
+        self._loading = False
+        self._query = ""
+        self._last_input_millis = 0.0
+        self._search_scheduled = False
+        self._matches = []  # Indices of the options that match the query
+        self._insert_index()
+        self._insert_menu()
+        # Properties
+        self._debounce_millis = _DEBOUNCE_MILLIS
+        self._open = False
+        self._render_open()
+        self._highlighted = None
+        self._selected = None
+        self._select = None
+
+    def _delete_state(self, state):
+        """Override this method to delete state keys that cannot be pickled"""
+        super()._delete_state(state)
+        del state["_elem_menu"]
+        del state["_virtual_rows"]
+        del state["_index"]
+        del state["_matches"]  # The matches are searched again after unpickling
+        if state["_provider"] is not None:
+            state["_options"] = []  # Options of a provider are loaded again on the next search
+        state["_loading"] = False
+        state["_search_scheduled"] = False
+        state["_open"] = False
+
+    def _insert_index(self):
+        """Build the search index for the options"""
+        self._index = _PSearchIndex([t for _, t in self._options])
+        self._matches = self._index.search(self._query)
+
+    def _insert_menu(self):
+        """Insert the menu with the virtualized options into the DOM tree"""
+        # No need to replace existing children, this method is only called from initialization or deserialization
+        self._elem_menu = _adopt_or_create_element("div", self._widget_id + _ID_SUPPLEMENT + _ID_MENU)
+        for c in ["ui", "segment"]:
+            self._elem_menu.classList.add(c)
+        self._elem_menu.style.position = "absolute"
+        self._elem_menu.style.top = "100%"
+        self._elem_menu.style.left = "0px"
+        self._elem_menu.style.right = "0px"
+        self._elem_menu.style.zIndex = "10"
+        self._elem_menu.style.margin = "0px"
+        self._elem_menu.style.padding = "0px"
+        self._elem_menu.style.maxHeight = str(_VISIBLE_ROWS * _ROW_HEIGHT) + "px"
+        _append_element(self._elem, self._elem_menu)
+        self._virtual_rows = _PVirtualRows(
+            self._elem_menu, _ROW_HEIGHT, self._create_row, self._row_key, self._fill_row
+        )
+        self._virtual_rows.set_count(len(self._matches))
+        # Keep the input focus when clicking an option
+        _add_listener(self, self._elem_menu, "mousedown", self._menu_mousedown)
+        _add_listener(self, self._elem_menu, "click", self._menu_click)
+        _add_listener(self, self._elem_input, "input", self._input_input)
+        _add_listener(self, self._elem_input, "keydown", self._input_keydown)
+        _add_listener(self, self._elem_input, "focus", self._input_focus)
+        _add_listener(self, self._elem_input, "blur", self._input_blur)
+
+    def _insert_state(self):
+        """Override this method to insert state, for keys that could not be pickled"""
+        super()._insert_state()
+        self._insert_index()
+        self._insert_menu()
+
+    def dispose(self):
+        """Remove the event listeners and destroy their JS proxies, also of the virtualized rows"""
+        super().dispose()
+        self._virtual_rows.dispose()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_open()
+        self._render_loading()
+
+    # Options
+    def get_options(self) -> list[tuple[Any, str]]:
+        """Get the list of options"""
+        return self._options
+
+    def set_options(self, options: list[tuple[Any, str]]) -> Self:
+        """Replace all options, the search index is built once for the new options"""
+        self._options = list(options)
+        self._insert_index()
+        self._show_matches()
+        return self
+
+    def set_provider(self, provider: Callable | None) -> Self:
+        """Load the matching options from a provider, that is called with the (debounced) query"""
+        self._provider = provider
+        if provider is not None:
+            self._search()
+        return self
+
+    def _show_matches(self):
+        """Show the matching options in the virtualized menu"""
+        self._highlighted = 0 if len(self._matches) > 0 else None
+        self._virtual_rows.set_count(len(self._matches))
+        self._virtual_rows.invalidate()
+        _schedule_render(self._render_open)
+
+    # Search, debounced while typing
+    def _input_input(self, event: Any):  # pylint: disable=unused-argument
+        """Input event handler"""
+        self._query = self.get_value()  # Updated by the delegated input event listener, before this handler
+        self._last_input_millis = _now_millis()
+        self.set_open(True)
+        if not self._search_scheduled:
+            self._search_scheduled = True
+            _set_timeout(self._search_timeout, self._debounce_millis)
+
+    def _search_timeout(self):
+        """Debounce timer, restart it for the remaining time when the user is still typing"""
+        remaining = self._last_input_millis + self._debounce_millis - _now_millis()
+        if remaining > 0:
+            _set_timeout(self._search_timeout, int(remaining) + 1)
+        else:
+            self._search_scheduled = False
+            self._search()
+
+    def _search(self):
+        """Search the options for the query"""
+        if self._provider is None:
+            self._matches = self._index.search(self._query)
+            self._show_matches()
+        else:
+            self._provider_sequence += 1
+            self._set_loading(True)
+            asyncio.ensure_future(self._provide(self._query, self._provider_sequence))
+
+    async def _provide(self, query: str, sequence: int):
+        """Load the matching options from the provider, results of older queries are ignored"""
+        try:
+            result = self._provider(query)
+            if inspect.isawaitable(result):
+                result = await result
+            options = list(result)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            console.error("Loading options for query " + repr(query) + " failed: " + repr(error))
+            options = []
+        if sequence == self._provider_sequence:
+            self._set_loading(False)
+            self._options = options
+            self._insert_index()  # Keep the search index in sync with the options
+            self._matches = list(range(len(self._options)))  # The provider already matched the query
+            self._show_matches()
+
+    def _set_loading(self, loading: bool):
+        """Show that the options are loading from the provider"""
+        self._loading = loading
+        _schedule_render(self._render_loading)
+
+    def _render_loading(self):
+        """Renderer"""
+        if self._loading:
+            self._elem.classList.add("loading")
+        else:
+            self._elem.classList.remove("loading")
+
+    def is_loading(self) -> bool:
+        """Accessor, are the options loading from the provider"""
+        return self._loading
+
+    # Keyboard and pointer
+    def _input_keydown(self, event: Any):
+        """Keyboard navigation through the options"""
+        if event.key in ["ArrowDown", "ArrowUp"] and len(self._matches) > 0:
+            event.preventDefault()
+            self.set_open(True)
+            step = 1 if event.key == "ArrowDown" else -1
+            current = -step if self._highlighted is None else self._highlighted
+            self._highlight(max(0, min(len(self._matches) - 1, current + step)))
+        elif event.key == "Enter" and self._open and self._highlighted is not None:
+            event.preventDefault()
+            self._choose(self._highlighted)
+        elif event.key == "Escape":
+            self.set_open(False)
+
+    def _input_focus(self, event: Any):  # pylint: disable=unused-argument
+        """Focus event handler"""
+        self.set_open(True)
+
+    def _input_blur(self, event: Any):  # pylint: disable=unused-argument
+        """Blur event handler"""
+        self.set_open(False)
+
+    def _menu_mousedown(self, event: Any):
+        """Mousedown event handler, prevent that the input loses focus"""
+        event.preventDefault()
+
+    def _menu_click(self, event: Any):
+        """Click event handler for all options"""
+        index = self._virtual_rows.index_of(event.target)
+        if index is not None:
+            self._choose(index)
+
+    def _highlight(self, index: int):
+        """Highlight the option at the index of the matches, and scroll it into view"""
+        self._highlighted = index
+        self._virtual_rows.invalidate()
+        self._virtual_rows.scroll_to(index)
+
+    def _choose(self, index: int):
+        """Select the option at the index of the matches"""
+        key, text = self._options[self._matches[index]]
+        self.set_selected(key)
+        self.set_value(text)  # Also when the same option is chosen again, after the text was edited
+        self.set_open(False)
+        if self._select is not None:
+            self._select(key)
+
+    # Virtualized rows
+    def _create_row(self, elem_row: Any) -> Any:
+        """Add the text to a new pooled row element"""
+        elem_row.classList.add("item")
+        elem_row.style.paddingLeft = "1em"
+        elem_row.style.paddingRight = "1em"
+        elem_row.style.cursor = "pointer"
+        elem_text = document.createTextNode("")
+        elem_row.appendChild(elem_text)
+        return elem_text
+
+    def _row_key(self, index: int) -> tuple:
+        """The row contents that are shown, to skip unchanged DOM writes"""
+        return (self._matches[index], index == self._highlighted)
+
+    def _fill_row(self, elem_row: Any, created: Any, index: int):
+        """Update a pooled row element"""
+        if index == self._highlighted:
+            elem_row.style.backgroundColor = "rgba(128, 128, 128, 0.25)"
+        else:
+            elem_row.style.backgroundColor = None
+        created.nodeValue = self._options[self._matches[index]][1]
+
+    # Property: debounce_millis
+    def get_debounce_millis(self) -> int:
+        """Accessor"""
+        return self._debounce_millis
+
+    def set_debounce_millis(self, debounce_millis: int) -> Self:
+        """Mutator"""
+        self._debounce_millis = debounce_millis
+        return self
+
+    # Property: open
+    def _render_open(self):
+        """Renderer"""
+        self._elem_menu.style.display = "block" if self._open and len(self._matches) > 0 else "none"
+        if self._open:
+            self._virtual_rows.refresh()
+
+    def is_open(self) -> bool:
+        """Accessor"""
+        return self._open
+
+    def set_open(self, is_open: bool) -> Self:
+        """Mutator"""
+        if self._open != is_open:
+            self._open = is_open
+            _schedule_render(self._render_open)
+        return self
+
+    # Property: selected
+    def get_selected(self) -> Any:
+        """Accessor, key of the selected option"""
+        return self._selected
+
+    def set_selected(self, selected: Any) -> Self:
+        """Mutator, key of the selected option, the input shows the text of the option"""
+        if self._selected != selected:
+            self._selected = selected
+            for key, text in self._options:
+                if key == selected:
+                    self.set_value(text)
+                    break
+        return self
+
+    # Property: select (writeonly)
+    def on_select(self, select: Callable | None) -> Self:
+        """Mutator, the callback is called with the key of the selected option"""
+        self._select = select
+        return self
@@ -6,12 +6,18 @@ PyScriptWidgets - A client side GUI class (widget) library for building web appl
 """
 
 
-from typing import Self
+from collections.abc import Callable
+from typing import Any, Self
 
 from widgets.base import PBaseWidget
+from widgets.globals import _append_element, _place_element, mark_state_dirty
+from widgets.scheduler import _schedule_render
 
 
-class PCompoundWidget(PBaseWidget):
+_MAX_POOL_SIZE = 100
+
+
+class PCompoundWidget(PBaseWidget):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Abstract compound widget base class, that can have children"""
 
     def __init__(self, tag: str):
@@ -19,6 +25,7 @@ class PCompoundWidget(PBaseWidget):
         super().__init__(tag)
         # Children
         self._children = []
+        self._pools = {}  # Recycled children per class, not pickled
         # Properties
         self._margin = None
         self._render_margin()
@@ -40,7 +47,7 @@ class PCompoundWidget(PBaseWidget):
         if self._widget_id == widget_id:
             return self
         for c in self._children:
-            f = c.findId(widget_id)
+            f = c.find_id(widget_id)
             if f is not None:
                 return f
         return None
@@ -50,19 +57,25 @@ class PCompoundWidget(PBaseWidget):
         """Get the list of children"""
         return self._children
 
-    def remove_child(self, child: PBaseWidget) -> Self:
-        """Remove a single child"""
+    def remove_child(self, child: PBaseWidget, keep: bool = False) -> Self:
+        """Remove a single child and dispose it, unless it is kept to be added again"""
         child._parent = None  # pylint: disable=protected-access
         self._elem.removeChild(child._elem)  # pylint: disable=protected-access
         self._children.remove(child)
+        if not keep:
+            child.dispose()
+        mark_state_dirty()  # Child changes do not pass the render scheduler
         return self
 
-    def remove_all_children(self) -> Self:
-        """Remove all children"""
+    def remove_all_children(self, keep: bool = False) -> Self:
+        """Remove all children and dispose them, unless they are kept to be added again"""
         self._elem.replaceChildren()
         for c in self._children:
             c._parent = None  # pylint: disable=protected-access
+            if not keep:
+                c.dispose()
         self._children.clear()
+        mark_state_dirty()
         return self
 
     def add_child(self, child: PBaseWidget) -> Self:
@@ -71,29 +84,104 @@ class PCompoundWidget(PBaseWidget):
         child.set_dark_mode(
             child.get_parent().is_dark_mode()
         )  # Inherit dark mode property from parent
-        self._elem.appendChild(child._elem)  # pylint: disable=protected-access
+        _append_element(self._elem, child._elem)  # pylint: disable=protected-access
         self._children.append(child)
+        mark_state_dirty()
+        return self
+
+    def insert_child(self, index: int, child: PBaseWidget) -> Self:
+        """Insert a single child before the child at the given index"""
+        if index >= len(self._children):
+            return self.add_child(child)
+        child._parent = self  # pylint: disable=protected-access
+        child.set_dark_mode(self.is_dark_mode())  # Inherit dark mode property from parent
+        self._elem.insertBefore(
+            child._elem, self._children[index]._elem  # pylint: disable=protected-access
+        )
+        self._children.insert(index, child)
+        mark_state_dirty()
+        return self
+
+    # Pooling, reuse removed children instead of creating new widgets and DOM elements
+    def recycle_child(self, child: PBaseWidget) -> Self:
+        """Remove a single child and keep it in the pool of its class, when the class overrides _recycle()"""
+        self.remove_child(child, keep=True)
+        if type(child)._recycle is not PBaseWidget._recycle:  # pylint: disable=protected-access
+            pool = self._pools.setdefault(type(child), [])
+            if len(pool) < _MAX_POOL_SIZE:
+                pool.append(child)
+                return self
+        child.dispose()
         return self
 
+    def acquire_child(self, cls: type, *args: Any, factory: Callable[[], PBaseWidget] | None = None) -> PBaseWidget:
+        """Add a child of the class, recycled from the pool with the constructor arguments, or a new one"""
+        # The optional factory creates the new child instead of the class, for example PTemplate.create
+        pool = self._pools.get(cls)
+        if pool:
+            child = pool.pop()
+            child._recycle(*args)  # pylint: disable=protected-access
+        elif factory is not None:
+            child = factory()
+            child._recycle(*args)  # pylint: disable=protected-access
+        else:
+            child = cls(*args)
+        self.add_child(child)
+        return child
+
+    def get_pool_size(self, cls: type) -> int:
+        """Number of recycled children of the class, that are available for reuse"""
+        return len(self._pools.get(cls, []))
+
     def add_children(self, children: list[PBaseWidget]) -> Self:
         """Add a list of children"""
         for c in children:
             self.add_child(c)
         return self
 
+    def _delete_state(self, state):
+        """Override this method to delete state keys that cannot be pickled"""
+        super()._delete_state(state)
+        del state["_pools"]
+
+    def _insert_state(self):
+        """Override this method to insert state, for keys that could not be pickled"""
+        super()._insert_state()
+        self._pools = {}
+
+    def dispose(self):
+        """Remove the event listeners and destroy their JS proxies, also of the children and pooled children"""
+        super().dispose()
+        for c in self._children:
+            c.dispose()
+        for pool in self._pools.values():
+            for c in pool:
+                c.dispose()
+        self._pools.clear()
+
     def backup_state(self):
         """Override this method to backup runtime DOM state to widget instance fields before pickling to session storage"""
         super().backup_state()
         for c in self._children:
             c.backup_state()
 
+    def _clone_state(self, offset: int):
+        """Override this method to insert state after cloning from a widget template, the id numbers are shifted by the offset"""
+        super()._clone_state(offset)
+        for c in self._children:
+            c._parent = self  # pylint: disable=protected-access
+            c._clone_state(offset)  # pylint: disable=protected-access
+
     def restore_state(self):
         """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
         super().restore_state()
+        # Pre-rendered markup could have the children in another order than the restored widget tree
+        previous = None
         for c in self._children:
             c.restore_state()
             c._parent = self  # pylint: disable=protected-access
-            self._elem.appendChild(c._elem)  # pylint: disable=protected-access
+            _place_element(self._elem, c._elem, previous)  # pylint: disable=protected-access
+            previous = c._elem  # pylint: disable=protected-access
         # Properties
         self._render_margin()
         self._render_border_width()
@@ -125,6 +213,8 @@ class PCompoundWidget(PBaseWidget):
                 self._elem.style.margin = str(pixels) + "px"
             except ValueError:
                 self._elem.style.margin = str(self._margin)  # It was not an integer value
+        else:
+            self._elem.style.margin = None
 
     def get_margin(self) -> int | str | None:
         """Accessor"""
@@ -134,7 +224,7 @@ class PCompoundWidget(PBaseWidget):
         """Mutator"""
         if self._margin != margin:
             self._margin = margin
-            self._render_margin()
+            _schedule_render(self._render_margin)
         return self
 
     # Property: border_width
@@ -146,6 +236,8 @@ class PCompoundWidget(PBaseWidget):
                 self._elem.style.borderWidth = str(pixels) + "px"
             except ValueError:
                 self._elem.style.borderWidth = str(self._border_width)  # It was not an integer value
+        else:
+            self._elem.style.borderWidth = None
 
     def get_border_width(self) -> int | str | None:
         """Accessor"""
@@ -155,7 +247,7 @@ class PCompoundWidget(PBaseWidget):
         """Mutator"""
         if self._border_width != border_width:
             self._border_width = border_width
-            self._render_border_width()
+            _schedule_render(self._render_border_width)
         return self
 
     # Property: border_style
@@ -172,7 +264,7 @@ class PCompoundWidget(PBaseWidget):
         # Valid styles, see: https://www.w3schools.com/css/css_border.asp
         if self._border_style != border_style:
             self._border_style = border_style
-            self._render_border_style()
+            _schedule_render(self._render_border_style)
         return self
 
     # Property: border_color
@@ -188,7 +280,7 @@ class PCompoundWidget(PBaseWidget):
         """Mutator"""
         if self._border_color != border_color:
             self._border_color = border_color
-            self._render_border_color()
+            _schedule_render(self._render_border_color)
         return self
 
     # Property: padding
@@ -200,6 +292,8 @@ class PCompoundWidget(PBaseWidget):
                 self._elem.style.padding = str(pixels) + "px"
             except ValueError:
                 self._elem.style.padding = str(self._padding)  # It was not an integer value
+        else:
+            self._elem.style.padding = None
 
     def get_padding(self) -> int | str | None:
         """Accessor"""
@@ -209,7 +303,7 @@ class PCompoundWidget(PBaseWidget):
         """Mutator"""
         if self._padding != padding:
             self._padding = padding
-            self._render_padding()
+            _schedule_render(self._render_padding)
         return self
 
     # Property: row_gap
@@ -217,6 +311,8 @@ class PCompoundWidget(PBaseWidget):
         """Renderer"""
         if self._row_gap is not None:
             self._elem.style.rowGap = str(self._row_gap) + "px"
+        else:
+            self._elem.style.rowGap = None
 
     def get_row_gap(self) -> int:
         """Accessor"""
@@ -226,7 +322,7 @@ class PCompoundWidget(PBaseWidget):
         """Mutator"""
         if self._row_gap != row_gap:
             self._row_gap = row_gap
-            self._render_row_gap()
+            _schedule_render(self._render_row_gap)
         return self
 
     # Property: column_gap
@@ -234,6 +330,8 @@ class PCompoundWidget(PBaseWidget):
         """Renderer"""
         if self._column_gap is not None:
             self._elem.style.columnGap = str(self._column_gap) + "px"
+        else:
+            self._elem.style.columnGap = None
 
     def get_column_gap(self) -> int:
         """Accessor"""
@@ -243,5 +341,5 @@ class PCompoundWidget(PBaseWidget):
         """Mutator"""
         if self._column_gap != column_gap:
             self._column_gap = column_gap
-            self._render_column_gap()
+            _schedule_render(self._render_column_gap)
         return self
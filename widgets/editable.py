@@ -0,0 +1,124 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+from collections.abc import Callable
+from typing import Any, Self
+
+from widgets.focussable import PFocussableWidget
+from widgets.globals import _add_listener, _remove_listener
+from widgets.handler import PHandler
+from widgets.scheduler import _schedule_render
+
+
+class PEditableWidget(PFocussableWidget):
+    """Abstract editable widget class, with an inner form control that can be disabled or read-only and sends change events"""
+
+    def __init__(self, tag: str):
+        """Constructor, define tag and class attributes"""
+        super().__init__(tag)
+        self._insert_control()
+        # Properties
+        self._render_enabled()  # The inner form control did not exist yet, when the super class rendered it
+        self._readonly = False
+        self._render_readonly()
+        self._change = None
+        self._render_change()
+
+    def _insert_control(self):
+        """Override this method to insert the inner form control element into the DOM tree"""
+
+    def _control_element(self) -> Any:
+        """Override this method to return the inner form control element"""
+        return self._elem
+
+    def _insert_state(self):
+        """Override this method to insert state, for keys that could not be pickled"""
+        super()._insert_state()
+        self._insert_control()
+
+    def _clone_state(self, offset: int):
+        """Override this method to insert state after cloning from a widget template, the id numbers are shifted by the offset"""
+        super()._clone_state(offset)
+        # Event listeners are not cloned
+        self._render_change()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_enabled()
+        self._render_readonly()
+        self._render_change()
+
+    def dispose(self):
+        """Cancel a running change handler, remove the event listeners and destroy their JS proxies"""
+        super().dispose()
+        if isinstance(self._change, PHandler):
+            self._change.cancel()
+
+    def _reset_state(self):
+        """Override this method to reset the properties to their constructor defaults, before a widget is recycled"""
+        super()._reset_state()
+        self.set_readonly(False)
+        self.on_change(None)
+
+    def _focus(self):
+        """Set the input focus and scroll in view"""
+        self._control_element().scrollIntoView()
+        self._control_element().focus()
+
+    # Property: enabled (overridden)
+    def _render_enabled(self):
+        """Renderer"""
+        # No need to call super(), because the surrounding element cannot be disabled
+        try:
+            elem = self._control_element()
+        except AttributeError:  # This overridden method is also called earlier, before the inner form control exists
+            return
+        if self._enabled:
+            elem.removeAttribute("disabled")
+        else:
+            elem.setAttribute("disabled", "")
+
+    # Property: readonly
+    def _render_readonly(self):
+        """Renderer"""
+        if self._readonly:
+            self._control_element().setAttribute("readonly", "")
+        else:
+            self._control_element().removeAttribute("readonly")
+
+    def is_readonly(self) -> bool:
+        """Accessor"""
+        return self._readonly
+
+    def set_readonly(self, readonly: bool) -> Self:
+        """Mutator"""
+        if self._readonly != readonly:
+            self._readonly = readonly
+            _schedule_render(self._render_readonly)
+        return self
+
+    # Property: change (writeonly)
+    def _render_change(self):
+        """Renderer"""
+        if self._change is not None:
+            _add_listener(self, self._control_element(), "change", self._change)
+
+    def on_change(self, change: Callable | None, concurrency: str | None = None, limit: int | None = None) -> Self:
+        """Mutator, an async handler can have a concurrency policy: drop, cancel, queue or parallel with an optional limit"""
+        if change is not None and concurrency is not None:
+            change = PHandler(change, concurrency, limit)
+        if id(self._change) != id(change):  # Object reference/id comparison
+            if self._change is not None:
+                _remove_listener(self, self._control_element(), "change", self._change)
+                if isinstance(self._change, PHandler):
+                    self._change.cancel()
+            self._change = change
+            self._render_change()
+        return self
@@ -9,6 +9,7 @@ PyScriptWidgets - A client side GUI class (widget) library for building web appl
 from typing import Self
 
 from widgets.base import PBaseWidget
+from widgets.scheduler import _schedule_render, mutate
 
 
 class PFocussableWidget(PBaseWidget):
@@ -27,8 +28,17 @@ class PFocussableWidget(PBaseWidget):
         # Properties
         self._render_enabled()
 
+    def _reset_state(self):
+        """Override this method to reset the properties to their constructor defaults, before a widget is recycled"""
+        super()._reset_state()
+        self.set_enabled(True)
+
     def request_focus(self):
-        """Request the input focus and scroll the widget into view"""
+        """Request the input focus and scroll the widget into view, in the write phase of the next animation frame"""
+        mutate(self._focus)
+
+    def _focus(self):
+        """Set the input focus and scroll the widget into view"""
         self._elem.scrollIntoView()
         self._elem.focus()
 
@@ -48,5 +58,5 @@ class PFocussableWidget(PBaseWidget):
         """Mutator"""
         if self._enabled != enabled:
             self._enabled = enabled
-            self._render_enabled()
+            _schedule_render(self._render_enabled)
         return self
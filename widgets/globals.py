@@ -6,16 +6,27 @@ PyScriptWidgets - A client side GUI class (widget) library for building web appl
 """
 
 
+import asyncio
 import base64
+import json
 import pickle
+import re
+import sys
+import weakref
 import zlib
 
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
-from js import console, sessionStorage  # type: ignore # pylint: disable=import-error
+from js import console, fetch, pevent_filter, sessionStorage, Date, IntersectionObserver, Object, ResizeObserver, Response  # type: ignore # pylint: disable=import-error
 # Prefer pyscript import over more basic js import for the document and window objects
 from pyscript import document, window  # type: ignore # pylint: disable=import-error
-from pyodide.ffi.wrappers import add_event_listener  # type: ignore # pylint: disable=import-error
+from pyodide.ffi import create_once_callable, create_proxy, to_js  # type: ignore # pylint: disable=import-error
+from pyodide.ffi.wrappers import add_event_listener, remove_event_listener  # type: ignore # pylint: disable=import-error
+
+from widgets.scheduler import _set_render_callback, flush_renders
 
 
 # Constants
@@ -23,6 +34,13 @@ _STATE_KEY: str = "widget_state"
 _ID_PREFIX: str = "e"
 _ID_SUPPLEMENT: str = "_"
 _UTF_8: str = "utf-8"
+_EVENT_FILTER_MODES: tuple[str, ...] = ("throttle", "debounce", "frame")
+_AUTOSAVE_DEBOUNCE_MILLIS: int = 2000
+_AUTOSAVE_IDLE_TIMEOUT_MILLIS: int = 5000
+_FETCH_CACHE_MAX_ENTRIES: int = 100
+_FETCH_CACHE_MAX_CHARS: int = 5_000_000
+_FETCH_CACHE_TTL_MILLIS: int = 60_000
+_FETCH_CACHED_AT_HEADER: str = "x-widgets-cached-at"
 
 
 # Private global reference to the root widget
@@ -33,6 +51,39 @@ _main_widget: Any  # pylint: disable=invalid-name
 _last_unique_id: int = 0  # pylint: disable=invalid-name
 
 
+# Private global autosave state, the widget tree is dirty when it changed after the last saved snapshot
+_autosave_enabled: bool = True  # pylint: disable=invalid-name
+_autosave_debounce_millis: int = _AUTOSAVE_DEBOUNCE_MILLIS  # pylint: disable=invalid-name
+_autosave_scheduled: bool = False  # pylint: disable=invalid-name
+_state_dirty: bool = False  # pylint: disable=invalid-name
+_last_dirty_millis: float = 0.0  # pylint: disable=invalid-name
+
+
+# Private global number of live event listener proxies per owner class, for leak tracking
+_live_proxies: dict[str, int] = {}  # pylint: disable=invalid-name
+
+
+# Private global shared resize observer, with the observed widgets and their last notified size (width, height) by widget id
+_resize_observer: Any = None  # pylint: disable=invalid-name
+_resize_widgets: dict[str, Any] = {}  # pylint: disable=invalid-name
+_resize_sizes: dict[str, tuple[float, float]] = {}  # pylint: disable=invalid-name
+
+
+# Private global shared intersection observers by root margin, with the observed widgets by (root margin, widget id)
+_intersection_observers: dict[str, Any] = {}  # pylint: disable=invalid-name
+_intersection_widgets: dict[tuple[str, str], Any] = {}  # pylint: disable=invalid-name
+
+
+# Private global input widgets by input element id, with one delegated input event listener for their cached values
+# The references are weak, so a removed widget that was not disposed is not kept alive
+_input_widgets: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()  # pylint: disable=invalid-name
+_input_listener: Any = None  # pylint: disable=invalid-name
+
+
+# Private global dictionary of pre-rendered elements by id, that are not adopted by a widget yet, None when not hydrating
+_hydration_elements: dict[str, Any] | None = None  # pylint: disable=invalid-name
+
+
 # Debug utiliies
 def debug_object(obj: Any):
     """Print object attributes to the debug console"""
@@ -62,6 +113,153 @@ def _deserialize_from_base64(state_data: bytes) -> Any:
     return root_widget
 
 
+# Event listeners of widgets, the JS proxies are destroyed when the owner widget is disposed
+def _add_listener(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    owner: Any, elem: Any, event_type: str, listener: Callable, mode: str | None = None, millis: int = 0
+):
+    """Add an event listener and register it with the owner, that has a _listeners list"""
+    if mode is None:
+        # See: https://pyodide.org/en/stable/usage/api/python-api/ffi.html#pyodide.ffi.wrappers.add_event_listener
+        add_event_listener(elem, event_type, listener)
+        handle = None
+    else:
+        # Throttle, debounce or coalesce per animation frame in JavaScript, discarded events do not cross into Python
+        if mode not in _EVENT_FILTER_MODES:
+            raise ValueError("Unknown event filter mode: " + mode)
+        proxy = create_proxy(listener)
+        handle = (pevent_filter(proxy, mode, millis), proxy)
+        elem.addEventListener(event_type, handle[0])
+    owner._listeners.append((elem, event_type, listener, handle))  # pylint: disable=protected-access
+    name = owner.__class__.__name__
+    _live_proxies[name] = _live_proxies.get(name, 0) + 1
+
+
+def _release_listener(elem: Any, event_type: str, listener: Callable, handle: tuple[Any, Any] | None):
+    """Remove an event listener and destroy its JS proxy"""
+    if handle is None:
+        remove_event_listener(elem, event_type, listener)
+    else:
+        js_filter, proxy = handle
+        js_filter.cancel()  # A pending delayed call would use the destroyed proxy
+        elem.removeEventListener(event_type, js_filter)
+        proxy.destroy()
+
+
+def _remove_listener(owner: Any, elem: Any, event_type: str, listener: Callable):
+    """Remove an event listener of the owner and destroy its JS proxy"""
+    listeners = owner._listeners  # pylint: disable=protected-access
+    for index, (e, t, l, h) in enumerate(listeners):
+        if t == event_type and l == listener and e.js_id == elem.js_id:
+            _release_listener(e, t, l, h)
+            del listeners[index]
+            name = owner.__class__.__name__
+            _live_proxies[name] = _live_proxies[name] - 1
+            return
+
+
+def _remove_listeners(owner: Any):
+    """Remove all event listeners of the owner and destroy their JS proxies"""
+    listeners = owner._listeners  # pylint: disable=protected-access
+    for e, t, l, h in listeners:
+        _release_listener(e, t, l, h)
+    name = owner.__class__.__name__
+    if len(listeners) > 0:
+        _live_proxies[name] = _live_proxies[name] - len(listeners)
+    listeners.clear()
+
+
+def get_live_proxy_counts() -> dict[str, int]:
+    """Number of live event listener proxies per widget class, a count that keeps growing indicates a leak"""
+    return {name: count for name, count in _live_proxies.items() if count > 0}
+
+
+# Size change notifications of widgets, with one shared resize observer instead of a window resize listener per widget
+def _observe_resize(widget: Any):
+    """Notify the widget when the size of its element changes"""
+    global _resize_observer  # pylint: disable=global-statement
+    if _resize_observer is None:
+        # See: https://developer.mozilla.org/en-US/docs/Web/API/ResizeObserver
+        _resize_observer = ResizeObserver.new(create_proxy(_resize_observed))
+    _resize_widgets[widget._widget_id] = widget  # pylint: disable=protected-access
+    _resize_observer.observe(widget._elem)  # pylint: disable=protected-access
+
+
+def _unobserve_resize(widget: Any):
+    """Stop notifying the widget of size changes"""
+    if _resize_widgets.pop(widget._widget_id, None) is not None:  # pylint: disable=protected-access
+        _resize_sizes.pop(widget._widget_id, None)  # pylint: disable=protected-access
+        _resize_observer.unobserve(widget._elem)  # pylint: disable=protected-access
+
+
+def _resize_observed(entries: Any, observer: Any):  # pylint: disable=unused-argument
+    """Resize observer callback, called once per animation frame after layout, with the entries of all resized elements"""
+    sizes = {}  # Only the last entry per element counts
+    for entry in entries:
+        sizes[entry.target.id] = (entry.contentRect.width, entry.contentRect.height)
+    for widget_id, size in sizes.items():
+        widget = _resize_widgets.get(widget_id)
+        if widget is not None and _resize_sizes.get(widget_id) != size:
+            _resize_sizes[widget_id] = size
+            widget._resized(*size)  # pylint: disable=protected-access
+
+
+# Viewport proximity notifications of widgets, with one shared intersection observer per root margin
+def _observe_intersection(widget: Any, root_margin: str):
+    """Notify the widget when its element enters or leaves the viewport, extended by the root margin"""
+    observer = _intersection_observers.get(root_margin)
+    if observer is None:
+        # See: https://developer.mozilla.org/en-US/docs/Web/API/IntersectionObserver
+        observer = IntersectionObserver.new(
+            create_proxy(lambda entries, _: _intersection_observed(root_margin, entries)),
+            to_js({"rootMargin": root_margin}, dict_converter=Object.fromEntries),
+        )
+        _intersection_observers[root_margin] = observer
+    if (root_margin, widget._widget_id) not in _intersection_widgets:  # pylint: disable=protected-access
+        _intersection_widgets[(root_margin, widget._widget_id)] = widget  # pylint: disable=protected-access
+        observer.observe(widget._elem)  # pylint: disable=protected-access
+
+
+def _unobserve_intersection(widget: Any, root_margin: str):
+    """Stop notifying the widget of entering or leaving the viewport, extended by the root margin"""
+    if _intersection_widgets.pop((root_margin, widget._widget_id), None) is not None:  # pylint: disable=protected-access
+        _intersection_observers[root_margin].unobserve(widget._elem)  # pylint: disable=protected-access
+
+
+def _intersection_observed(root_margin: str, entries: Any):
+    """Intersection observer callback, with the entries of all elements that entered or left the extended viewport"""
+    intersecting = {}  # Only the last entry per element counts
+    for entry in entries:
+        intersecting[entry.target.id] = entry.isIntersecting
+    for widget_id, is_intersecting in intersecting.items():
+        widget = _intersection_widgets.get((root_margin, widget_id))
+        if widget is not None:
+            widget._intersected(root_margin, is_intersecting)  # pylint: disable=protected-access
+
+
+# Cached values of input widgets, updated by one delegated input event listener instead of reading the DOM on every access
+def _register_input(widget: Any, elem_input: Any):
+    """Update the cached value of the widget, when the user changes the value of the input element"""
+    global _input_listener  # pylint: disable=global-statement
+    if _input_listener is None:
+        _input_listener = create_proxy(_document_input)
+        # Capture phase, so the cached value is updated before the event listeners of the input element are called
+        document.addEventListener("input", _input_listener, True)
+    _input_widgets[elem_input.id] = widget
+
+
+def _unregister_input(elem_input: Any):
+    """Stop updating the cached value of the widget of the input element"""
+    _input_widgets.pop(elem_input.id, None)
+
+
+def _document_input(event: Any):
+    """Delegated input event handler for all input widgets"""
+    widget = _input_widgets.get(event.target.id)
+    if widget is not None:
+        widget._input_value(event.target.value)  # pylint: disable=protected-access
+        mark_state_dirty()
+
+
 # Global functions to get references to widgets in event handlers
 def find_event_target(event: Any) -> Any | None:
     """Find the target widget for this event in the widget tree"""
@@ -87,19 +285,184 @@ def _detect_dark_mode():
     document.body.style.backgroundImage = f"linear-gradient(to bottom right, {top_left}, {bottom_right})"
 
 
+# Timer utilities, the callbacks are wrapped in a proxy that is destroyed after the first call
+def _now_millis() -> float:
+    """High resolution timestamp in milliseconds"""
+    return window.performance.now()
+
+
+def _set_timeout(callback: Callable, millis: int):
+    """Call the callback once, after the given number of milliseconds"""
+    window.setTimeout(create_once_callable(callback), millis)
+
+
+def _request_idle_callback(callback: Callable, timeout_millis: int):
+    """Call the callback once, when the browser is idle or when the timeout expires"""
+    # Not all browsers support this, see: https://developer.mozilla.org/en-US/docs/Web/API/Window/requestIdleCallback
+    if hasattr(window, "requestIdleCallback"):
+        window.requestIdleCallback(
+            create_once_callable(callback),
+            to_js({"timeout": timeout_millis}, dict_converter=Object.fromEntries),
+        )
+    else:
+        _set_timeout(lambda: callback(None), 0)
+
+
 # Store the widget state
+def _save_state():
+    """Save widget tree state in browser session storage, when it changed after the last save"""
+    global _state_dirty  # pylint: disable=global-statement
+    if _state_dirty:
+        _state_dirty = False
+        state = _serialize_to_base64(_main_widget)
+        sessionStorage.setItem(_STATE_KEY, state)
+
+
+def mark_state_dirty():
+    """Mark the widget tree state as changed, an autosave is scheduled when the changes settle"""
+    global _state_dirty, _last_dirty_millis, _autosave_scheduled  # pylint: disable=global-statement
+    _state_dirty = True
+    _last_dirty_millis = _now_millis()
+    if _autosave_enabled and not _autosave_scheduled:
+        _autosave_scheduled = True
+        _set_timeout(_autosave_timeout, _autosave_debounce_millis)
+
+
+# Rendered property changes mark the state dirty, the scheduler calls this once per flush
+_set_render_callback(mark_state_dirty)
+
+
+def _autosave_timeout():
+    """Debounce timer, wait until there were no changes during the debounce period"""
+    global _autosave_scheduled  # pylint: disable=global-statement
+    # Restart the timer for the remaining time, instead of clearing and setting a timer on every change
+    remaining = _last_dirty_millis + _autosave_debounce_millis - _now_millis()
+    if remaining > 0:
+        _set_timeout(_autosave_timeout, int(remaining) + 1)
+    else:
+        _request_idle_callback(_autosave_idle, _AUTOSAVE_IDLE_TIMEOUT_MILLIS)
+        _autosave_scheduled = False
+
+
+def _autosave_idle(deadline: Any):  # pylint: disable=unused-argument
+    """Save the widget tree state, while the browser is idle"""
+    if _autosave_enabled:
+        _save_state()
+
+
+def configure_autosave(enabled: bool = True, debounce_millis: int = _AUTOSAVE_DEBOUNCE_MILLIS):
+    """Enable or disable the periodic background autosave and set the debounce period"""
+    global _autosave_enabled, _autosave_debounce_millis  # pylint: disable=global-statement
+    _autosave_enabled = enabled
+    _autosave_debounce_millis = debounce_millis
+    if enabled and _state_dirty:
+        mark_state_dirty()
+
+
+def _document_interaction(event: Any):  # pylint: disable=unused-argument
+    """User interaction could change the widget tree state"""
+    mark_state_dirty()
+
+
 def _window_beforeunload(event: Any):  # pylint: disable=unused-argument
     """Save widget tree state in browser session storage, before unloading the page"""
-    state = _serialize_to_base64(_main_widget)
-    sessionStorage.setItem(_STATE_KEY, state)
+    _save_state()
+
+
+def _window_pagehide(event: Any):  # pylint: disable=unused-argument
+    """Save widget tree state, mobile browsers often skip the beforeunload event"""
+    _save_state()
+
+
+def _document_visibilitychange(event: Any):  # pylint: disable=unused-argument
+    """Save widget tree state when the page is hidden, it could be discarded without further notice"""
+    if document.visibilityState == "hidden":
+        _save_state()
+
+
+# Hydrate pre-rendered markup, widgets adopt the existing elements with their id instead of creating new elements
+def _begin_hydration(root: Any):
+    """Collect the elements with widget ids in the markup of the root element"""
+    global _hydration_elements  # pylint: disable=global-statement
+    elements = {}
+    for elem in root.querySelectorAll("[id^='" + _ID_PREFIX + "']"):
+        # Only generated widget ids, other elements in the markup are not adopted, and not removed afterwards
+        if _is_widget_id(elem.id):
+            elements[elem.id] = elem
+    _hydration_elements = elements if len(elements) > 0 else None
+
+
+def _is_widget_id(element_id: str) -> bool:
+    """Is the element id a generated widget id, or a widget id with a supplement for an inner element"""
+    return re.fullmatch(re.escape(_ID_PREFIX) + r"\d+(" + re.escape(_ID_SUPPLEMENT) + r".+)?", element_id) is not None
+
+
+def _end_hydration():
+    """Remove the pre-rendered elements that were not adopted, because the markup did not match the widget tree"""
+    global _hydration_elements  # pylint: disable=global-statement
+    if _hydration_elements is not None:
+        for elem in _hydration_elements.values():
+            elem.remove()
+        _hydration_elements = None
+
+
+def _hydration_element(element_id: str, tag: str) -> Any | None:
+    """While hydrating, adopt the pre-rendered element with this id, when it has the same tag"""
+    if _hydration_elements is None:
+        return None
+    elem = _hydration_elements.get(element_id)
+    if elem is None or elem.tagName.lower() != tag.lower():
+        return None
+    del _hydration_elements[element_id]
+    return elem
+
+
+def _adopt_or_create_element(tag: str, element_id: str) -> Any:
+    """Create an element with this id, or adopt the pre-rendered element while hydrating"""
+    elem = _hydration_element(element_id, tag)
+    if elem is None:
+        elem = document.createElement(tag)
+        elem.id = element_id
+    return elem
+
+
+def _swap_hydration_elements(elements: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Set the elements to adopt by id, for example the elements of a cloned widget template, returns the previous ones"""
+    global _hydration_elements  # pylint: disable=global-statement
+    previous = _hydration_elements
+    _hydration_elements = elements
+    return previous
+
+
+def _append_element(parent: Any, child: Any):
+    """Append a child element, unless it is an adopted element that already has this parent"""
+    if _hydration_elements is None or child.parentNode is None or not child.parentNode.isSameNode(parent):
+        parent.appendChild(child)
+
+
+def _place_element(parent: Any, child: Any, previous: Any | None):
+    """Place a child element after the previous child element, adopted elements are only moved when their order differs"""
+    if previous is None:
+        _append_element(parent, child)
+    else:
+        following = previous.nextSibling
+        if following is None or not following.isSameNode(child):
+            parent.insertBefore(child, following)
 
 
 # Create or load the widget state and bind to the browser DOM
-def bind_to_dom(MainWidgetClass, root_element_id: str, debug: bool = False):  # pylint: disable=invalid-name
+def bind_to_dom(
+    MainWidgetClass, root_element_id: str, debug: bool = False, hydrate: bool = True
+):  # pylint: disable=invalid-name
     """Bind the main widget to the dom, or load the widget tree state from browser session storage if available"""
     # What is the impact of: https://developer.chrome.com/blog/enabling-shared-array-buffer/?utm_source=devtools
     global _main_widget  # pylint: disable=global-statement
 
+    # Adopt pre-rendered markup, see prerender.py, the widget ids are the same for a new and a restored widget tree
+    root = document.getElementById(root_element_id)
+    if hydrate:
+        _begin_hydration(root)
+
     state = sessionStorage.getItem(_STATE_KEY)
     if state is None or debug:
         _main_widget = MainWidgetClass()
@@ -108,17 +471,29 @@ def bind_to_dom(MainWidgetClass, root_element_id: str, debug: bool = False):  #
         sessionStorage.removeItem(_STATE_KEY)
         #console.log("Application state restored from browser session storage")
 
+    _end_hydration()
     _detect_dark_mode()
 
-    document.getElementById(root_element_id).replaceChildren(
-        _main_widget._elem  # pylint: disable=protected-access
-    )
+    elem = _main_widget._elem  # pylint: disable=protected-access
+    if root.childElementCount != 1 or not root.firstElementChild.isSameNode(elem):
+        root.replaceChildren(elem)
 
     # See: https://jeff.glass/post/pyscript-why-create-proxy/
     add_event_listener(window, "beforeunload", _window_beforeunload)
+    # See: https://developer.chrome.com/docs/web-platform/page-lifecycle-api
+    add_event_listener(window, "pagehide", _window_pagehide)
+    add_event_listener(document, "visibilitychange", _document_visibilitychange)
+    for event_type in ["input", "change", "click"]:
+        add_event_listener(document, event_type, _document_interaction)
+
+    # Render property changes from the constructors, before executing code after the page load
+    flush_renders()
 
     _main_widget.after_page_load()
 
+    # Take an initial snapshot, so the state also survives a crash before the first change
+    mark_state_dirty()
+
 
 # Get the base url of the page
 def base_url() -> str:
@@ -129,6 +504,143 @@ def base_url() -> str:
     return url
 
 
+# Shared fetch layer, with deduplication of requests in flight and a least recently used cache
+class PStubTransport:
+    """Local transport with fixed responses, to use the fetch cache without a network, for example in tests"""
+
+    def __init__(self, responses: dict[str, str]):
+        """Constructor, define the response text per url"""
+        self._responses = responses
+        self._calls = []
+
+    def get_calls(self) -> list[str]:
+        """Urls that were requested from this transport, in order"""
+        return self._calls
+
+    async def __call__(self, url: str) -> str:
+        """Return the response text for the url"""
+        self._calls.append(url)
+        await asyncio.sleep(0)  # Behave like a network request, let other tasks run
+        if url not in self._responses:
+            raise OSError(f"HTTP error 404 for: {url}")
+        return self._responses[url]
+
+
+async def _browser_transport(url: str) -> str:
+    """Fetch the response text from the network"""
+    response = await fetch(url)
+    if not response.ok:
+        raise OSError(f"HTTP error {response.status} for: {url}")
+    return await response.text()
+
+
+# Private global fetch cache state, cached entries are (timestamp in millis, response text)
+_fetch_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()  # pylint: disable=invalid-name
+_fetch_cache_chars: int = 0  # pylint: disable=invalid-name
+_fetch_in_flight: dict[str, asyncio.Future] = {}  # pylint: disable=invalid-name
+_fetch_cache_max_entries: int = _FETCH_CACHE_MAX_ENTRIES  # pylint: disable=invalid-name
+_fetch_cache_max_chars: int = _FETCH_CACHE_MAX_CHARS  # pylint: disable=invalid-name
+_fetch_cache_ttl_millis: int = _FETCH_CACHE_TTL_MILLIS  # pylint: disable=invalid-name
+_fetch_cache_storage: str | None = None  # pylint: disable=invalid-name
+_fetch_transport: Callable = _browser_transport  # pylint: disable=invalid-name
+
+
+def configure_fetch_cache(  # pylint: disable=too-many-arguments
+    max_entries: int = _FETCH_CACHE_MAX_ENTRIES,
+    max_chars: int = _FETCH_CACHE_MAX_CHARS,
+    ttl_millis: int = _FETCH_CACHE_TTL_MILLIS,
+    storage: str | None = None,
+    transport: Callable | None = None,
+):
+    """Configure the limits of the fetch cache, an optional Cache API storage name and the transport"""
+    global _fetch_cache_max_entries, _fetch_cache_max_chars, _fetch_cache_ttl_millis  # pylint: disable=global-statement
+    global _fetch_cache_storage, _fetch_transport  # pylint: disable=global-statement
+    _fetch_cache_max_entries = max_entries
+    _fetch_cache_max_chars = max_chars
+    _fetch_cache_ttl_millis = ttl_millis
+    _fetch_cache_storage = storage
+    _fetch_transport = _browser_transport if transport is None else transport
+    clear_fetch_cache()
+
+
+def clear_fetch_cache():
+    """Remove all entries from the in memory fetch cache"""
+    global _fetch_cache_chars  # pylint: disable=global-statement
+    _fetch_cache.clear()
+    _fetch_cache_chars = 0
+
+
+def _fetch_cache_get(url: str) -> str | None:
+    """Get a cached response text that is not expired"""
+    global _fetch_cache_chars  # pylint: disable=global-statement
+    entry = _fetch_cache.get(url)
+    if entry is None:
+        return None
+    if Date.now() - entry[0] > _fetch_cache_ttl_millis:
+        del _fetch_cache[url]
+        _fetch_cache_chars -= len(entry[1])
+        return None
+    _fetch_cache.move_to_end(url)
+    return entry[1]
+
+
+def _fetch_cache_put(url: str, timestamp: float, text: str):
+    """Add a response text to the cache, evict least recently used entries beyond the limits"""
+    global _fetch_cache_chars  # pylint: disable=global-statement
+    if len(text) > _fetch_cache_max_chars:
+        return
+    old = _fetch_cache.pop(url, None)
+    if old is not None:
+        _fetch_cache_chars -= len(old[1])
+    _fetch_cache[url] = (timestamp, text)
+    _fetch_cache_chars += len(text)
+    while len(_fetch_cache) > _fetch_cache_max_entries or _fetch_cache_chars > _fetch_cache_max_chars:
+        _, (_, evicted) = _fetch_cache.popitem(last=False)
+        _fetch_cache_chars -= len(evicted)
+
+
+async def _fetch_and_cache(url: str) -> str:
+    """Get the response text from the Cache API storage or the transport, and cache it"""
+    # See: https://developer.mozilla.org/en-US/docs/Web/API/Cache
+    storage = None
+    if _fetch_cache_storage is not None and hasattr(window, "caches"):
+        storage = await window.caches.open(_fetch_cache_storage)
+        response = await storage.match(url)
+        if response is not None:
+            timestamp = float(response.headers.get(_FETCH_CACHED_AT_HEADER) or 0)
+            if Date.now() - timestamp <= _fetch_cache_ttl_millis:
+                text = await response.text()
+                _fetch_cache_put(url, timestamp, text)
+                return text
+    text = await _fetch_transport(url)
+    timestamp = Date.now()
+    _fetch_cache_put(url, timestamp, text)
+    if storage is not None:
+        headers = to_js({_FETCH_CACHED_AT_HEADER: str(timestamp)}, dict_converter=Object.fromEntries)
+        init = to_js({"headers": headers}, dict_converter=Object.fromEntries)
+        await storage.put(url, Response.new(text, init))
+    return text
+
+
+async def fetch_text(url: str) -> str:
+    """Fetch the response text, concurrent requests for the same url share a single request"""
+    text = _fetch_cache_get(url)
+    if text is not None:
+        return text
+    future = _fetch_in_flight.get(url)
+    if future is None:
+        future = asyncio.ensure_future(_fetch_and_cache(url))
+        _fetch_in_flight[url] = future
+        future.add_done_callback(lambda f: _fetch_in_flight.pop(url, None))
+    # Shield the shared request, cancelling one caller should not cancel it for the others
+    return await asyncio.shield(future)
+
+
+async def fetch_json(url: str) -> Any:
+    """Fetch and parse a JSON response, each caller gets its own parsed copy"""
+    return json.loads(await fetch_text(url))
+
+
 # Generate a new unique widget id
 def _generate_unique_id() -> str:
     """Generate a new unique widget id, a sequential number"""
@@ -137,6 +649,23 @@ def _generate_unique_id() -> str:
     return _ID_PREFIX + str(_last_unique_id)
 
 
+# Reserve a range of unique widget id's, for cloning a widget template
+def _reserve_unique_ids(count: int) -> int:
+    """Reserve a number of new unique widget id's, returns the number of the first id"""
+    global _last_unique_id  # pylint: disable=global-statement
+    first = _last_unique_id + 1
+    _last_unique_id = _last_unique_id + count
+    return first
+
+
+# Shift the numbers of widget id's, in an id, a supplemented id or a grid template areas string
+def _shift_ids(text: str, offset: int) -> str:
+    """Add the offset to the number of each widget id in the text"""
+    return re.sub(
+        r"\b" + _ID_PREFIX + r"(\d+)", lambda m: _ID_PREFIX + str(int(m.group(1)) + offset), text
+    )
+
+
 # Ensure new unique widget id's after unpickling from session state
 def _ensure_unique_id_beyond(widget_id: str):
     """Ensure any new unique widget id, is beyond the given number of the last unpickled widget"""
@@ -145,4 +674,31 @@ def _ensure_unique_id_beyond(widget_id: str):
     _last_unique_id = max(_last_unique_id, i)
 
 
+# Convert coordinates to a compact array of floats: x0, y0, x1, y1, ...
+def _interleave_coordinates(xs: Any, ys: Any = None) -> array:
+    """Interleave x and y coordinates, or flatten (x, y) pairs when there are no y coordinates"""
+    # NumPy is optional, arrays are converted without a Python loop when the application already imported it
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and (isinstance(xs, numpy.ndarray) or isinstance(ys, numpy.ndarray)):
+        if ys is None:
+            xy = numpy.asarray(xs, dtype=numpy.float64).ravel()
+        else:
+            xy = numpy.column_stack((xs, ys)).astype(numpy.float64).ravel()
+        result = array("d")
+        result.frombytes(xy.tobytes())
+        return result
+    if ys is None:
+        result = array("d")
+        for p in xs:
+            if isinstance(p, (tuple, list)):
+                result.extend(p)
+            else:
+                result.append(p)
+        return result
+    result = array("d", [0.0]) * (2 * len(xs))
+    result[0::2] = array("d", xs)
+    result[1::2] = array("d", ys)
+    return result
+
+
 #TODO Global function def _str_or_px for common logic inside width/height/etc. properties
@@ -10,7 +10,9 @@ from typing import Self
 
 from widgets.base import PBaseWidget
 from widgets.compound import PCompoundWidget
+from widgets.globals import _shift_ids
 from widgets.panel import PPanel
+from widgets.scheduler import _schedule_render
 
 
 class PGrid(PCompoundWidget):
@@ -33,6 +35,11 @@ class PGrid(PCompoundWidget):
         super()._insert_state()
         self._insert_display()
 
+    def _clone_state(self, offset: int):
+        """Override this method to insert state after cloning from a widget template, the id numbers are shifted by the offset"""
+        super()._clone_state(offset)
+        self._areas = _shift_ids(self._areas, offset)
+
     def restore_state(self):
         """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
         super().restore_state()
@@ -83,7 +90,7 @@ class PGrid(PCompoundWidget):
 
         if self._columns != columns:
             self._columns = columns
-            self._render_columns()
+            _schedule_render(self._render_columns)
         return self
 
     # Property: rows
@@ -123,7 +130,7 @@ class PGrid(PCompoundWidget):
 
         if self._rows != rows:
             self._rows = rows
-            self._render_rows()
+            _schedule_render(self._render_rows)
         return self
 
     # Property: areas (readonly)
@@ -135,7 +142,9 @@ class PGrid(PCompoundWidget):
         """Mutator"""
         # See: https://www.w3schools.com/css/css_grid.asp
         # See: https://developer.mozilla.org/en-US/docs/Web/CSS/grid-template-areas
-        self.remove_all_children()
+        # Children that are not in the new areas are disposed afterwards
+        previous_children = list(self.get_children())
+        self.remove_all_children(keep=True)
 
         self._areas = ""
         for line in areas:
@@ -155,7 +164,10 @@ class PGrid(PCompoundWidget):
 
         if len(self._areas) > 0:
             self._areas = self._areas[1:]
-        self._render_areas()
+        for c in previous_children:
+            if c not in self.get_children():
+                c.dispose()
+        _schedule_render(self._render_areas)
         return self
 
     def add_child(self, child: PBaseWidget) -> Self:
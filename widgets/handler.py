@@ -0,0 +1,95 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+import asyncio
+import inspect
+
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+
+_CONCURRENCY_POLICIES = ("drop", "cancel", "queue", "parallel")
+
+
+class PHandler:
+    """Event handler wrapper class, with a concurrency policy for async handlers that are still running when the next event arrives"""
+
+    # Concurrency policies:
+    # - drop: ignore events while the handler is running
+    # - cancel: cancel the running handler, so it does not apply a stale result, and handle the new event
+    # - queue: handle the events one after the other, in order
+    # - parallel: handle the events concurrently, events wait in order when the optional limit of running handlers is reached
+    # Handlers that are not async run to completion, so a policy has no effect on them.
+    # The handler is pickled with the widget tree, so use functions or methods instead of lambdas.
+
+    def __init__(self, handler: Callable, policy: str, limit: int | None = None):
+        """Constructor, wrap the handler"""
+        if policy not in _CONCURRENCY_POLICIES:
+            raise ValueError("Unknown concurrency policy: " + policy)
+        self._handler = handler
+        self._policy = policy
+        self._limit = limit if policy == "parallel" else 1
+        self._tasks = set()  # Running handlers, not pickled
+        self._queue = deque()  # Waiting events, not pickled
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Magic method to get the object state when pickling, running handlers and waiting events are not pickled"""
+        state = self.__dict__.copy()
+        del state["_tasks"]
+        del state["_queue"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Magic method to set the object state when unpickling"""
+        self.__dict__.update(state)
+        self._tasks = set()
+        self._queue = deque()
+
+    def __call__(self, event: Any):
+        """Event listener, handle the event according to the concurrency policy"""
+        if self._policy == "cancel":
+            for task in self._tasks:
+                task.cancel()  # Raises asyncio.CancelledError at the await in the running handler
+        elif self._limit is not None and len(self._tasks) >= self._limit:
+            if self._policy != "drop":
+                self._queue.append(event)
+            return
+        self._start(event)
+
+    def _start(self, event: Any):
+        """Call the handler, and keep track of it while it runs, when it is async"""
+        result = self._handler(event)
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Future):
+        """Handle the next waiting event, when a handler finished"""
+        self._tasks.discard(task)
+        if self._queue and (self._limit is None or len(self._tasks) < self._limit):
+            self._start(self._queue.popleft())
+
+    def get_handler(self) -> Callable:
+        """Wrapped event handler"""
+        return self._handler
+
+    def get_policy(self) -> str:
+        """Concurrency policy"""
+        return self._policy
+
+    def is_running(self) -> bool:
+        """Is an async handler running"""
+        return len(self._tasks) > 0
+
+    def cancel(self):
+        """Cancel the running handlers and forget the waiting events"""
+        self._queue.clear()
+        for task in self._tasks:
+            task.cancel()
@@ -6,93 +6,103 @@ PyScriptWidgets - A client side GUI class (widget) library for building web appl
 """
 
 
-from collections.abc import Callable
-from typing import Self
+from typing import Any, Self
 
-# Prefer pyscript import over more basic js import for the document and window objects
-from pyscript import document  # type: ignore # pylint: disable=import-error
-from pyodide.ffi.wrappers import add_event_listener, remove_event_listener  # type: ignore # pylint: disable=import-error
-
-from widgets.focussable import PFocussableWidget
-from widgets.globals import _ID_SUPPLEMENT
+from widgets.editable import PEditableWidget
+from widgets.globals import (
+    _ID_SUPPLEMENT,
+    _adopt_or_create_element,
+    _append_element,
+    _register_input,
+    _unregister_input,
+    mark_state_dirty,
+)
+from widgets.scheduler import _schedule_render
 
 
 _ID_INPUT = "input"
 
 
-class PInputWidget(PFocussableWidget):
+class PInputWidget(PEditableWidget):
     """Abstract input widget class with value and shared functionality"""
 
     def __init__(self, input_type: str, value: str):
         """Constructor, define tag and class attributes"""
         super().__init__("div")
         self._elem.classList.add("input")
-        self._insert_input()
-        # Value
-        self._value = ""
-        self.set_value(value)
+        # Value, cached so reading it does not cross the FFI
+        self._value = value
+        self._render_value()
+        _register_input(self, self._elem_input)
         # Properties
         self._input_type = input_type
         self._render_input_type()
-        self._enabled = True
-        self._render_enabled()
         self._required = ""
         self._render_required()
-        self._readonly = False
-        self._render_readonly()
-        self._change = None
-        self._render_change()
-
-    def backup_state(self):
-        """Override this method to backup runtime DOM state to widget instance fields before pickling to session storage"""
-        super().backup_state()
-        self._value = self._elem_input.value
 
     def _delete_state(self, state):
         """Override this method to delete state keys that cannot be pickled"""
         super()._delete_state(state)
         del state["_elem_input"]
 
-    def _insert_input(self):
+    def _insert_control(self):
         """Insert the inner input element into the DOM tree"""
         # No need to replace existing children, this method is only called from initialization or deserialization
-        self._elem_input = document.createElement("input")
+        self._elem_input = _adopt_or_create_element("input", self._widget_id + _ID_SUPPLEMENT + _ID_INPUT)
         self._elem_input.setAttribute("type", "text")
-        self._elem_input.id = self._widget_id + _ID_SUPPLEMENT + _ID_INPUT
         self._elem_input.classList.add(self.__class__.__name__)
-        self._elem.appendChild(self._elem_input)
+        _append_element(self._elem, self._elem_input)
 
-    def _insert_state(self):
-        """Override this method to insert state, for keys that could not be pickled"""
-        super()._insert_state()
-        self._insert_input()
+    def _control_element(self) -> Any:
+        """Inner input element"""
+        return self._elem_input
+
+    def _clone_state(self, offset: int):
+        """Override this method to insert state after cloning from a widget template, the id numbers are shifted by the offset"""
+        super()._clone_state(offset)
+        # The value property is not cloned
+        self._render_value()
+        _register_input(self, self._elem_input)
 
     def restore_state(self):
         """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
         super().restore_state()
         # Value
-        self.set_value(self._value)
+        self._render_value()
+        _register_input(self, self._elem_input)
         # Properties
         self._render_input_type()
-        self._render_enabled()
         self._render_required()
-        self._render_readonly()
-        self._render_change()
 
-    def request_focus(self):
-        """Request the input focus and scroll in view"""
-        self._elem_input.scrollIntoView()
-        self._elem_input.focus()
+    def dispose(self):
+        """Stop caching the value, cancel a running change handler, remove the event listeners and destroy their JS proxies"""
+        super().dispose()
+        _unregister_input(self._elem_input)
+
+    def _reset_state(self):
+        """Override this method to reset the properties to their constructor defaults, before a widget is recycled"""
+        super()._reset_state()
+        self.set_required(False)
 
     # Value
+    def _render_value(self):
+        """Renderer"""
+        self._elem_input.value = self._value
+
+    def _input_value(self, value: str):
+        """Value change notification from the delegated input event listener"""
+        self._value = value
+
     def get_value(self) -> str:
         """Accessor"""
-        return self._elem_input.value
+        return self._value
 
     def set_value(self, value: str) -> Self:
         """Mutator"""
-        if self._elem_input.value != value:
-            self._elem_input.value = value
+        if self._value != value:
+            self._value = value
+            self._render_value()  # Not scheduled, so the state is marked dirty here
+            mark_state_dirty()
         return self
 
     # Property: input_type
@@ -108,21 +118,9 @@ class PInputWidget(PFocussableWidget):
         """Mutator"""
         if self._input_type != input_type:
             self._input_type = input_type
-            self._render_input_type()
+            _schedule_render(self._render_input_type)
         return self
 
-    # Property: enabled (overridden)
-    def _render_enabled(self):
-        """Renderer"""
-        # No need to call super(), because the surrounding element cannot be disabled
-        if hasattr(
-            self, "_elem_input"
-        ):  # This overridden method is also called earlier, before _elem_input exists
-            if self._enabled:
-                self._elem_input.removeAttribute("disabled")
-            else:
-                self._elem_input.setAttribute("disabled", "")
-
     # Property: required
     def _render_required(self):
         """Renderer"""
@@ -139,39 +137,5 @@ class PInputWidget(PFocussableWidget):
         """Mutator"""
         if self._required != required:
             self._required = required
-            self._render_required()
-        return self
-
-    # Property: readonly
-    def _render_readonly(self):
-        """Renderer"""
-        if self._readonly:
-            self._elem_input.setAttribute("readonly", "")
-        else:
-            self._elem_input.removeAttribute("readonly")
-
-    def is_readonly(self) -> bool:
-        """Accessor"""
-        return self._readonly
-
-    def set_readonly(self, readonly: bool) -> Self:
-        """Mutator"""
-        if self._readonly != readonly:
-            self._readonly = readonly
-            self._render_readonly()
-        return self
-
-    # Property: change (writeonly)
-    def _render_change(self):
-        """Renderer"""
-        if self._change is not None:
-            add_event_listener(self._elem, "change", self._change)
-
-    def on_change(self, change: Callable | None) -> Self:
-        """Mutator"""
-        if id(self._change) != id(change):  # Object reference/id comparison
-            if self._change is not None:
-                remove_event_listener(self._elem, "change", self._change)
-            self._change = change
-            self._render_change()
+            _schedule_render(self._render_required)
         return self
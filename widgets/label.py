@@ -14,6 +14,7 @@ from pyscript import document  # type: ignore # pylint: disable=import-error
 from widgets.focussable import PFocussableWidget
 from widgets.globals import _ID_SUPPLEMENT
 from widgets.input import PInputWidget, _ID_INPUT
+from widgets.scheduler import _schedule_render
 
 
 class PLabel(PFocussableWidget):
@@ -35,6 +36,12 @@ class PLabel(PFocussableWidget):
         self._render_text()
         self._render_for()
 
+    def _recycle(self, text: str):  # pylint: disable=arguments-differ
+        """Override this method to reset the widget with new constructor arguments, to reuse it from a pool of a compound widget"""
+        self._reset_state()
+        self.set_text(text)
+        self.set_for(None)
+
     # Property: text
     def _render_text(self):
         """Renderer"""
@@ -48,7 +55,7 @@ class PLabel(PFocussableWidget):
         """Mutator"""
         if self._text != text:
             self._text = text
-            self._render_text()
+            _schedule_render(self._render_text)
         return self
 
     # Property: for
@@ -74,5 +81,5 @@ class PLabel(PFocussableWidget):
         """Mutator"""
         if id(self._for) != id(for_widget):  # Object reference/id comparison
             self._for = for_widget
-            self._render_for()
+            _schedule_render(self._render_for)
         return self
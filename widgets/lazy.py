@@ -0,0 +1,138 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+from collections.abc import Callable
+from typing import Self
+
+from widgets.base import PBaseWidget
+from widgets.globals import _observe_intersection, _unobserve_intersection
+from widgets.panel import PPanel
+from widgets.scheduler import _schedule_render
+
+
+_NEAR_ROOT_MARGIN = "100%"  # Build the content one viewport size before it scrolls into view
+_FAR_ROOT_MARGIN = "300%"  # Release the content three viewport sizes after it scrolled out of view
+_PLACEHOLDER_HEIGHT = 200
+
+
+class PLazyPanel(PPanel):
+    """Lazy panel widget class, the content is built when the panel scrolls near the viewport"""
+
+    # Shared intersection observers report when the panel comes near the viewport, or goes far away from it.
+    # The panel has content-visibility: auto, so the browser also skips rendering the built content while it is off-screen.
+    # The placeholder height is the estimated height of the content, until the browser remembers the rendered height.
+    # The factory is pickled with the widget tree, so use classes, functions or methods instead of lambdas.
+
+    def __init__(self, vertical: bool, factory: Callable[[], PBaseWidget]):
+        """Constructor, define tag and class attributes"""
+        super().__init__(vertical)
+        self._factory = factory
+        self._content = None  # Content widget, or None when not built (yet) or released
+        self._elem.style.contentVisibility = "auto"
+        # Properties
+        self._placeholder_height = _PLACEHOLDER_HEIGHT
+        self._render_placeholder_height()
+        self._release = False
+        self._render_observed()
+
+    def _insert_state(self):
+        """Override this method to insert state, for keys that could not be pickled"""
+        super()._insert_state()
+        self._elem.style.contentVisibility = "auto"
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_placeholder_height()
+        self._render_observed()
+
+    def _clone_state(self, offset: int):
+        """Override this method to insert state after cloning from a widget template, the id numbers are shifted by the offset"""
+        super()._clone_state(offset)
+        self._render_observed()
+
+    def dispose(self):
+        """Stop observing the panel, remove the event listeners and destroy their JS proxies"""
+        super().dispose()
+        _unobserve_intersection(self, _NEAR_ROOT_MARGIN)
+        _unobserve_intersection(self, _FAR_ROOT_MARGIN)
+
+    def _render_observed(self):
+        """Observe coming near the viewport when the content is not built, or going far away when it can be released"""
+        if self._content is None:
+            _unobserve_intersection(self, _FAR_ROOT_MARGIN)
+            _observe_intersection(self, _NEAR_ROOT_MARGIN)
+        else:
+            _unobserve_intersection(self, _NEAR_ROOT_MARGIN)
+            if self._release:
+                _observe_intersection(self, _FAR_ROOT_MARGIN)
+            else:
+                _unobserve_intersection(self, _FAR_ROOT_MARGIN)
+
+    def _intersected(self, root_margin: str, is_intersecting: bool):
+        """Viewport proximity notification from a shared intersection observer"""
+        if root_margin == _NEAR_ROOT_MARGIN and is_intersecting:
+            self.materialize()
+        elif root_margin == _FAR_ROOT_MARGIN and not is_intersecting and self._release:
+            self.release()
+
+    # Content
+    def get_content(self) -> PBaseWidget | None:
+        """Content widget, or None when it is not built (yet)"""
+        return self._content
+
+    def is_materialized(self) -> bool:
+        """Is the content widget built"""
+        return self._content is not None
+
+    def materialize(self) -> Self:
+        """Build the content widget now, when it was not built yet"""
+        if self._content is None:
+            self._content = self._factory()
+            self.add_child(self._content)
+            self._render_observed()
+        return self
+
+    def release(self) -> Self:
+        """Remove the content widget, it is built again when the panel comes near the viewport"""
+        if self._content is not None:
+            content = self._content
+            self._content = None
+            self.remove_child(content)
+            self._render_observed()
+        return self
+
+    # Property: placeholder_height
+    def _render_placeholder_height(self):
+        """Renderer"""
+        # See: https://developer.mozilla.org/en-US/docs/Web/CSS/contain-intrinsic-height
+        self._elem.style.containIntrinsicHeight = "auto " + str(self._placeholder_height) + "px"
+
+    def get_placeholder_height(self) -> int:
+        """Accessor"""
+        return self._placeholder_height
+
+    def set_placeholder_height(self, placeholder_height: int) -> Self:
+        """Mutator, the estimated height in pixels of the content that is not rendered"""
+        if self._placeholder_height != placeholder_height:
+            self._placeholder_height = placeholder_height
+            _schedule_render(self._render_placeholder_height)
+        return self
+
+    # Property: release
+    def is_release(self) -> bool:
+        """Accessor"""
+        return self._release
+
+    def set_release(self, release: bool) -> Self:
+        """Mutator, release the content again when the panel scrolls far away from the viewport"""
+        if self._release != release:
+            self._release = release
+            self._render_observed()
+        return self
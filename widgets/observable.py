@@ -0,0 +1,264 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+from collections.abc import Callable, Iterator
+from typing import Any, Self
+
+from widgets.base import PBaseWidget
+from widgets.compound import PCompoundWidget
+from widgets.globals import mark_state_dirty
+
+
+# Constants for list change notifications
+LIST_INSERT: str = "insert"
+LIST_REMOVE: str = "remove"
+LIST_REPLACE: str = "replace"
+LIST_CLEAR: str = "clear"
+
+
+# Private global stack of computed values being evaluated, to track their dependencies
+_evaluating: list[Any] = []  # pylint: disable=invalid-name
+
+
+def _track_dependency(observable: Any):
+    """Register the observable as a dependency of the computed value being evaluated"""
+    if len(_evaluating) > 0:
+        _evaluating[-1]._depend_on(observable)  # pylint: disable=protected-access
+
+
+def _is_disposed(callback: Callable) -> bool:
+    """Is the subscriber a method or binding of a widget that was disposed"""
+    widget = getattr(callback, "_widget", getattr(callback, "__self__", None))
+    return isinstance(widget, PBaseWidget) and widget.is_disposed()
+
+
+class PObservable:
+    """Observable value, that notifies subscribers when the value changes"""
+
+    # Subscribers are pickled with the widget tree, so use functions or methods instead of lambdas
+
+    def __init__(self, value: Any = None):
+        """Constructor, define the initial value"""
+        self._value = value
+        self._subscribers = []
+
+    # Subscribers
+    def subscribe(self, callback: Callable) -> Self:
+        """Call the callback with the new value, when the value changes"""
+        self._subscribers.append(callback)
+        return self
+
+    def unsubscribe(self, callback: Callable) -> Self:
+        """Remove a callback that was subscribed earlier"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+        return self
+
+    def bind(self, setter: Callable) -> Self:
+        """Bind to a widget property mutator, like label.set_text, only that property is updated on changes"""
+        setter(self.get())
+        return self.subscribe(setter)
+
+    def _notify(self, *args):
+        """Notify all subscribers"""
+        mark_state_dirty()  # Observable values are pickled with the widgets that hold them, their changes do not pass the render scheduler
+        for callback in list(self._subscribers):  # Callbacks could (un)subscribe
+            if _is_disposed(callback):
+                self.unsubscribe(callback)  # The widget is not used anymore, and should not be kept alive
+            else:
+                callback(*args)
+
+    # Value
+    def get(self) -> Any:
+        """Accessor"""
+        _track_dependency(self)
+        return self._value
+
+    def _set_value(self, value: Any):
+        """Change the value and notify subscribers, only when the value is different"""
+        if self._value != value:
+            self._value = value
+            self._notify(value)
+
+    def set(self, value: Any) -> Self:
+        """Mutator"""
+        self._set_value(value)
+        return self
+
+
+class PComputed(PObservable):
+    """Computed value, that is evaluated again when one of the observables it read changes"""
+
+    def __init__(self, compute: Callable):
+        """Constructor, define the function that computes the value"""
+        super().__init__()
+        self._compute = compute
+        self._dependencies = []
+        self._value = self._evaluate()
+
+    def _evaluate(self) -> Any:
+        """Compute the value, and track the observables that were read as dependencies"""
+        for d in self._dependencies:
+            d.unsubscribe(self._dependency_changed)
+        self._dependencies = []
+        _evaluating.append(self)
+        try:
+            return self._compute()
+        finally:
+            _evaluating.pop()
+
+    def _depend_on(self, observable: PObservable):
+        """Subscribe to a dependency, once"""
+        if not any(d is observable for d in self._dependencies):
+            self._dependencies.append(observable)
+            observable.subscribe(self._dependency_changed)
+
+    def _dependency_changed(self, *args):  # pylint: disable=unused-argument
+        """Evaluate again, subscribers are only notified when the computed value is different"""
+        self._set_value(self._evaluate())
+
+    def set(self, value: Any) -> Self:
+        """Mutator, not supported because the value is computed"""
+        raise TypeError("A computed value cannot be set")
+
+
+class PObservableList(PObservable):
+    """Observable list, that notifies subscribers with fine grained changes: (change, index, item)"""
+
+    def __init__(self, items: list[Any] | None = None):
+        """Constructor, define the initial items"""
+        super().__init__([] if items is None else list(items))
+
+    def bind(self, setter: Callable) -> Self:
+        """Bind to a widget property mutator, that is called with a copy of all items on each change"""
+        binding = _PListBinding(self, setter)
+        setter(list(self._value))
+        return self.subscribe(binding)
+
+    def bind_children(self, widget: PCompoundWidget, factory: Callable) -> Self:
+        """Bind to the children of a compound widget, a child widget is created by the factory for each item"""
+        binding = _PChildrenBinding(widget, factory)
+        for index, item in enumerate(self._value):
+            binding(LIST_INSERT, index, item)
+        return self.subscribe(binding)
+
+    # Items
+    def __len__(self) -> int:
+        """Number of items"""
+        _track_dependency(self)
+        return len(self._value)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over a copy of the items"""
+        _track_dependency(self)
+        return iter(list(self._value))
+
+    def __getitem__(self, index: int) -> Any:
+        """Get a single item"""
+        _track_dependency(self)
+        return self._value[index]
+
+    def __setitem__(self, index: int, item: Any):
+        """Replace a single item"""
+        if index < 0:
+            index += len(self._value)  # Subscribers get the position of the item
+        if self._value[index] != item:
+            self._value[index] = item
+            self._notify(LIST_REPLACE, index, item)
+
+    def set(self, value: list[Any]) -> Self:
+        """Mutator, replace all items"""
+        self.clear()
+        for item in value:
+            self.append(item)
+        return self
+
+    def append(self, item: Any) -> Self:
+        """Add a single item at the end"""
+        return self.insert(len(self._value), item)
+
+    def insert(self, index: int, item: Any) -> Self:
+        """Insert a single item before the given index"""
+        if index < 0:
+            index = max(index + len(self._value), 0)  # Subscribers get the position of the item, like list.insert
+        index = min(index, len(self._value))
+        self._value.insert(index, item)
+        self._notify(LIST_INSERT, index, item)
+        return self
+
+    def pop(self, index: int = -1) -> Any:
+        """Remove and return a single item"""
+        if index < 0:
+            index += len(self._value)
+        item = self._value.pop(index)
+        self._notify(LIST_REMOVE, index, item)
+        return item
+
+    def remove(self, item: Any) -> Self:
+        """Remove the first occurrence of the item"""
+        self.pop(self._value.index(item))
+        return self
+
+    def clear(self) -> Self:
+        """Remove all items"""
+        if len(self._value) > 0:
+            self._value.clear()
+            self._notify(LIST_CLEAR, 0, None)
+        return self
+
+
+class _PListBinding:  # pylint: disable=too-few-public-methods
+    """Subscriber that calls a property mutator with a copy of all items of an observable list, on each change"""
+
+    def __init__(self, observable_list: PObservableList, setter: Callable):
+        """Constructor, define the list and mutator"""
+        self._list = observable_list
+        self._setter = setter
+        self._widget = getattr(setter, "__self__", None)  # Widget of the mutator, if any
+
+    def __call__(self, change: str, index: int, item: Any):  # pylint: disable=unused-argument
+        """Call the mutator, instead of passing the fine grained change"""
+        self._setter(list(self._list._value))  # pylint: disable=protected-access
+
+
+class _PChildrenBinding:  # pylint: disable=too-few-public-methods
+    """Subscriber that keeps the children of a compound widget in sync with an observable list"""
+
+    def __init__(self, widget: PCompoundWidget, factory: Callable):
+        """Constructor, define the widget and child factory"""
+        self._widget = widget
+        self._factory = factory
+        self._bound = []  # Child widgets, in the order of the list items
+
+    def _index_in_widget(self, index: int) -> int:
+        """Translate a list index to a child index, the widget could have other children too"""
+        children = self._widget.get_children()
+        if index < len(self._bound):
+            return children.index(self._bound[index])
+        if len(self._bound) > 0:
+            return children.index(self._bound[-1]) + 1
+        return len(children)
+
+    def _insert(self, index: int, child: PBaseWidget):
+        """Insert a child widget for a list item"""
+        self._widget.insert_child(self._index_in_widget(index), child)
+        self._bound.insert(index, child)
+
+    def __call__(self, change: str, index: int, item: Any):
+        """Apply a list change to the children, siblings are not touched"""
+        if change == LIST_INSERT:
+            self._insert(index, self._factory(item))
+        elif change == LIST_REMOVE:
+            self._widget.remove_child(self._bound.pop(index))
+        elif change == LIST_REPLACE:
+            self._widget.remove_child(self._bound.pop(index))
+            self._insert(index, self._factory(item))
+        elif change == LIST_CLEAR:
+            for child in self._bound:
+                self._widget.remove_child(child)
+            self._bound.clear()
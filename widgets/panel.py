@@ -8,6 +8,7 @@ PyScriptWidgets - A client side GUI class (widget) library for building web appl
 from typing import Self
 
 from widgets.compound import PCompoundWidget
+from widgets.scheduler import _schedule_render
 
 
 class PPanel(PCompoundWidget):
@@ -53,7 +54,7 @@ class PPanel(PCompoundWidget):
         """Mutator"""
         if self._vertical != vertical:
             self._vertical = vertical
-            self._render_vertical()
+            _schedule_render(self._render_vertical)
         return self
 
     # Property: wrap
@@ -69,5 +70,5 @@ class PPanel(PCompoundWidget):
         """Mutator"""
         if self._wrap != wrap:
             self._wrap = wrap
-            self._render_wrap()
+            _schedule_render(self._render_wrap)
         return self
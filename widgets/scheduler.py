@@ -0,0 +1,161 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+from collections.abc import Callable
+from typing import Any
+
+# Prefer pyscript import over more basic js import for the document and window objects
+from pyscript import window  # type: ignore # pylint: disable=import-error
+from pyodide.ffi import create_once_callable  # type: ignore # pylint: disable=import-error
+
+
+# Private global queue of pending renderers, coalesced per widget id and renderer name
+_pending_renders: dict[tuple[str, str], Callable] = {}  # pylint: disable=invalid-name
+
+
+# Private global queues of pending layout reads and DOM writes, to prevent layout thrashing
+# See: https://developer.chrome.com/docs/performance/rendering/avoid-large-complex-layouts-and-layout-thrashing
+_pending_measures: list[Callable] = []  # pylint: disable=invalid-name
+_pending_mutations: list[Callable] = []  # pylint: disable=invalid-name
+
+
+# Private global cache of widget bounding boxes (x, y, width, height), valid until the next DOM write phase
+_bounds_cache: dict[str, tuple[float, float, float, float]] = {}  # pylint: disable=invalid-name
+
+
+# Private global flags for the render scheduler
+_frame_requested: bool = False  # pylint: disable=invalid-name
+_sync_rendering: bool = False  # pylint: disable=invalid-name
+
+
+# Private global callback, called once after each flush that rendered property changes, to mark the widget tree state dirty
+_render_callback: Callable | None = None  # pylint: disable=invalid-name
+
+
+def _set_render_callback(callback: Callable | None):
+    """Set the callback that is called after property changes were rendered"""
+    global _render_callback  # pylint: disable=global-statement
+    _render_callback = callback
+
+
+def _rendered():
+    """Call the render callback, the widget tree state changed"""
+    if _render_callback is not None:
+        _render_callback()
+
+
+# Render property changes once per animation frame
+def _schedule_render(renderer: Callable):
+    """Schedule a bound renderer method for the next animation frame, multiple calls in one frame render once"""
+    if _sync_rendering:
+        renderer()
+        _bounds_cache.clear()
+        _rendered()
+    else:
+        widget = renderer.__self__
+        _pending_renders[(widget._widget_id, renderer.__name__)] = renderer  # pylint: disable=protected-access
+        _request_frame()
+
+
+def _request_frame():
+    """Request a single animation frame for all pending work"""
+    global _frame_requested  # pylint: disable=global-statement
+    if not _frame_requested:
+        _frame_requested = True
+        # See: https://developer.mozilla.org/en-US/docs/Web/API/Window/requestAnimationFrame
+        window.requestAnimationFrame(create_once_callable(_animation_frame))
+
+
+def _animation_frame(timestamp: Any):  # pylint: disable=unused-argument
+    """Animation frame callback"""
+    global _frame_requested  # pylint: disable=global-statement
+    _frame_requested = False
+    # Layout could have changed since the previous frame, for example by scrolling or resizing
+    _bounds_cache.clear()
+    flush_renders()
+
+
+def flush_renders():
+    """Execute all pending layout reads, then all DOM writes and renders, for example in tests"""
+    global _pending_measures, _pending_mutations, _pending_renders  # pylint: disable=global-statement
+    rendered = False
+    while len(_pending_measures) > 0 or len(_pending_mutations) > 0 or len(_pending_renders) > 0:
+        # Callbacks could schedule other callbacks, these are executed in the next pass
+        measures = _pending_measures
+        _pending_measures = []
+        for callback in measures:
+            callback()
+        mutations = _pending_mutations
+        _pending_mutations = []
+        for callback in mutations:
+            callback()
+        renderers = _pending_renders
+        _pending_renders = {}
+        for renderer in renderers.values():
+            renderer()
+            rendered = True
+        if len(mutations) > 0 or len(renderers) > 0:
+            _bounds_cache.clear()
+    if rendered:
+        _rendered()  # Once per flush, instead of once per scheduled render
+
+
+# Measure/mutate scheduling, batch layout reads before DOM writes in each animation frame
+def measure(callback: Callable):
+    """Schedule a callback that reads layout, in the read phase of the next animation frame"""
+    if _sync_rendering:
+        callback()
+    else:
+        _pending_measures.append(callback)
+        _request_frame()
+
+
+def mutate(callback: Callable):
+    """Schedule a callback that writes to the DOM, in the write phase of the next animation frame"""
+    if _sync_rendering:
+        callback()
+        _bounds_cache.clear()
+    else:
+        _pending_mutations.append(callback)
+        _request_frame()
+
+
+def _measure_bounds(widget: Any) -> tuple[float, float, float, float]:
+    """Read the bounding box of the widget element, cached until the next DOM write phase"""
+    widget_id = widget._widget_id  # pylint: disable=protected-access
+    bounds = _bounds_cache.get(widget_id)
+    if bounds is None:
+        # See: https://developer.mozilla.org/en-US/docs/Web/API/Element/getBoundingClientRect
+        rect = widget._elem.getBoundingClientRect()  # pylint: disable=protected-access
+        bounds = (rect.x, rect.y, rect.width, rect.height)
+        _bounds_cache[widget_id] = bounds
+    return bounds
+
+
+def _call_sync_rendering(callback: Callable, *args: Any) -> Any:
+    """Call the callback with sync rendering, its property changes render immediately, other pending renders stay pending"""
+    global _sync_rendering  # pylint: disable=global-statement
+    previous = _sync_rendering
+    _sync_rendering = True
+    try:
+        return callback(*args)
+    finally:
+        _sync_rendering = previous
+
+
+def is_sync_rendering() -> bool:
+    """Are property changes rendered immediately"""
+    return _sync_rendering
+
+
+def set_sync_rendering(sync_rendering: bool):
+    """Opt out of the render scheduler, render property changes immediately instead of once per animation frame"""
+    global _sync_rendering  # pylint: disable=global-statement
+    _sync_rendering = sync_rendering
+    if sync_rendering:
+        flush_renders()
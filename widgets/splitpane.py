@@ -0,0 +1,175 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+from typing import Any, Self
+
+from widgets.base import PBaseWidget
+from widgets.globals import _add_listener
+from widgets.grid import PGrid
+
+
+_DIVIDER_SIZE = 6
+_MIN_SIZE = 20
+
+
+class _PSplitDivider(PBaseWidget):
+    """Draggable divider of a split pane, the drag position is reported to the parent split pane"""
+
+    def __init__(self, vertical: bool):
+        """Constructor, define tag and class attributes"""
+        super().__init__("div")
+        self._insert_listeners()
+        # Properties
+        self._vertical = vertical
+        self._render_vertical()
+
+    def _insert_listeners(self):
+        """Insert pointer event listeners"""
+        # See: https://developer.mozilla.org/en-US/docs/Web/API/Element/setPointerCapture
+        self._elem.style.touchAction = "none"
+        _add_listener(self, self._elem, "pointerdown", self._pointerdown)
+        _add_listener(self, self._elem, "pointermove", self._pointermove)
+        _add_listener(self, self._elem, "pointerup", self._pointerup)
+        _add_listener(self, self._elem, "pointercancel", self._pointerup)
+
+    def _insert_state(self):
+        """Override this method to insert state, for keys that could not be pickled"""
+        super()._insert_state()
+        self._insert_listeners()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_vertical()
+
+    def _position(self, event: Any) -> float:
+        """Pointer position along the split direction"""
+        return event.clientY if self._vertical else event.clientX
+
+    def _pointerdown(self, event: Any):
+        """Start dragging, all following pointer events are captured by the divider"""
+        self._elem.setPointerCapture(event.pointerId)
+        self._parent._drag_start(self._position(event))  # pylint: disable=protected-access
+
+    def _pointermove(self, event: Any):
+        """Drag, only while the pointer is captured"""
+        if self._elem.hasPointerCapture(event.pointerId):
+            self._parent._drag_move(self._position(event))  # pylint: disable=protected-access
+
+    def _pointerup(self, event: Any):
+        """Stop dragging"""
+        if self._elem.hasPointerCapture(event.pointerId):
+            self._elem.releasePointerCapture(event.pointerId)
+            self._parent._drag_end()  # pylint: disable=protected-access
+
+    # Property: vertical
+    def _render_vertical(self):
+        """Renderer"""
+        self._elem.style.cursor = "row-resize" if self._vertical else "col-resize"
+        self._elem.style.backgroundColor = "rgba(128, 128, 128, 0.25)"
+
+
+class PSplitPane(PGrid):  # pylint: disable=too-many-instance-attributes
+    """Split pane widget class, with a draggable divider between two widgets"""
+
+    # The sizes are applied to the grid track template, so dragging writes a single style per animation frame
+
+    def __init__(self, first: PBaseWidget, second: PBaseWidget, vertical: bool = False):
+        """Constructor, define tag and class attributes"""
+        super().__init__()
+        self._first = first
+        self._divider = _PSplitDivider(vertical)
+        self._second = second
+        # Drag state, the layout is only read when dragging starts
+        self._drag_start_position = None
+        self._drag_start_size = 0.0
+        self._drag_total_size = 0.0
+        # Properties
+        self._vertical = vertical
+        self._size = "50%"
+        self._min_size = _MIN_SIZE
+        self._update_layout()
+
+    def _delete_state(self, state):
+        """Override this method to delete state keys that cannot be pickled"""
+        super()._delete_state(state)
+        state["_drag_start_position"] = None
+
+    def _insert_display(self):
+        """Stretch both widgets and the divider over the full track"""
+        super()._insert_display()
+        self._elem.style.alignItems = "stretch"
+
+    def _update_layout(self):
+        """Place the widgets and the divider in the grid areas"""
+        if self._vertical:
+            self.set_areas([[self._first], [self._divider], [self._second]])
+            self.set_columns(["100%"])
+        else:
+            self.set_areas([[self._first, self._divider, self._second]])
+            self.set_rows(["100%"])
+        self._update_tracks()
+
+    def _update_tracks(self):
+        """Apply the size of the first widget to the grid track template"""
+        size = self._size
+        tracks = [str(size) + "px" if isinstance(size, (int, float)) else size, _DIVIDER_SIZE, "1fr"]
+        if self._vertical:
+            self.set_rows(tracks)
+        else:
+            self.set_columns(tracks)
+
+    # Dragging
+    def _drag_start(self, position: float):
+        """Read the layout once when dragging starts"""
+        _, _, pane_width, pane_height = self.get_bounds()
+        _, _, first_width, first_height = self._first.get_bounds()
+        self._drag_start_position = position
+        self._drag_start_size = first_height if self._vertical else first_width
+        self._drag_total_size = pane_height if self._vertical else pane_width
+        self._elem.style.userSelect = "none"
+
+    def _drag_move(self, position: float):
+        """Resize without reading the layout, the render scheduler writes the track template once per frame"""
+        if self._drag_start_position is not None:
+            size = self._drag_start_size + position - self._drag_start_position
+            size = min(size, self._drag_total_size - _DIVIDER_SIZE - self._min_size)
+            self.set_size(int(max(size, self._min_size)))
+
+    def _drag_end(self):
+        """Stop dragging"""
+        self._drag_start_position = None
+        self._elem.style.userSelect = None
+
+    # Property: vertical
+    def is_vertical(self) -> bool:
+        """Accessor"""
+        return self._vertical
+
+    # Property: size
+    def get_size(self) -> int | str:
+        """Accessor"""
+        return self._size
+
+    def set_size(self, size: int | str) -> Self:
+        """Mutator, size of the first widget in pixels, or a CSS length like a percentage"""
+        if self._size != size:
+            self._size = size
+            self._update_tracks()
+        return self
+
+    # Property: min_size
+    def get_min_size(self) -> int:
+        """Accessor"""
+        return self._min_size
+
+    def set_min_size(self, min_size: int) -> Self:
+        """Mutator, minimum size in pixels of both widgets while dragging"""
+        self._min_size = min_size
+        return self
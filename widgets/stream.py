@@ -0,0 +1,127 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+import asyncio
+import codecs
+import json
+
+from collections.abc import Callable
+from typing import Any
+
+from js import fetch  # type: ignore # pylint: disable=import-error
+
+from widgets.compound import PCompoundWidget
+from widgets.globals import _UTF_8
+
+
+_BATCH_SIZE = 100
+
+
+class _PRecordParser:
+    """Incremental parser for a JSON array of records, or newline delimited JSON (NDJSON) records"""
+
+    # The format is detected from the first character: a JSON array starts with '['.
+    # Array elements are parsed with raw_decode as soon as they are complete, so the buffer only holds one partial record.
+
+    def __init__(self):
+        """Constructor, the format is not known yet"""
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._array = None
+        self._done = False
+
+    def feed(self, text: str) -> list[Any]:
+        """Add text and return the records that are complete"""
+        self._buffer += text
+        if self._array is None:
+            stripped = self._buffer.lstrip()
+            if len(stripped) == 0:
+                return []
+            self._array = stripped[0] == "["
+            self._buffer = stripped[1:] if self._array else stripped
+        return self._feed_array() if self._array else self._feed_lines(final=False)
+
+    def close(self) -> list[Any]:
+        """Return the last record, when the text did not end with a newline"""
+        if self._array is False:
+            return self._feed_lines(final=True)
+        return []
+
+    def _feed_lines(self, final: bool) -> list[Any]:
+        """Parse complete lines"""
+        lines = self._buffer.split("\n")
+        self._buffer = "" if final else lines.pop()
+        return [json.loads(line) for line in lines if len(line.strip()) > 0]
+
+    def _feed_array(self) -> list[Any]:
+        """Parse complete array elements"""
+        records = []
+        pos = 0
+        buffer = self._buffer
+        while not self._done:
+            # Skip whitespace and separators between elements
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._done = True
+                pos += 1
+                break
+            try:
+                record, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Incomplete element, wait for more text
+            if end >= len(buffer) and not isinstance(record, (dict, list, str)):
+                break  # A number or literal could continue in the next chunk
+            records.append(record)
+            pos = end
+        self._buffer = buffer[pos:]
+        return records
+
+
+async def stream_records(
+    url: str, on_batch: Callable[[list[Any]], Any], batch_size: int = _BATCH_SIZE
+) -> int:
+    """Fetch a JSON array or NDJSON resource and pass the records in batches while downloading, returns the record count"""
+    # See: https://developer.mozilla.org/en-US/docs/Web/API/Streams_API/Using_readable_streams
+    response = await fetch(url)
+    if not response.ok:
+        raise OSError(f"HTTP error {response.status} for: {url}")
+    reader = response.body.getReader()
+    decoder = codecs.getincrementaldecoder(_UTF_8)()
+    parser = _PRecordParser()
+    batch = []
+    count = 0
+    while True:
+        chunk = await reader.read()
+        if chunk.done:
+            batch.extend(parser.feed(decoder.decode(b"", final=True)))
+            batch.extend(parser.close())
+        else:
+            batch.extend(parser.feed(decoder.decode(chunk.value.to_bytes())))
+        # Pass the complete records of this chunk, so the first rows are shown before the download finishes
+        while len(batch) > 0:
+            records = batch[:batch_size]
+            del batch[:batch_size]
+            count += len(records)
+            on_batch(records)
+            await asyncio.sleep(0)  # Let the browser render
+        if chunk.done:
+            return count
+
+
+async def stream_children(
+    url: str, widget: PCompoundWidget, factory: Callable[[Any], Any], batch_size: int = _BATCH_SIZE
+) -> int:
+    """Stream records into a compound widget, the factory creates a child widget per record"""
+
+    def add_batch(records: list[Any]):
+        widget.add_children([factory(r) for r in records])
+
+    return await stream_records(url, add_batch, batch_size)
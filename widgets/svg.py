@@ -0,0 +1,316 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+from typing import Any, Self
+
+# Prefer pyscript import over more basic js import for the document and window objects
+from pyscript import document  # type: ignore # pylint: disable=import-error
+
+from widgets.base import PBaseWidget
+from widgets.compound import PCompoundWidget
+from widgets.globals import _interleave_coordinates
+from widgets.scheduler import _schedule_render
+
+
+_SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+
+
+class PSvg(PCompoundWidget):
+    """SVG container widget class, for shape widgets"""
+
+    # See: https://developer.mozilla.org/en-US/docs/Web/SVG/Element/svg
+
+    def __init__(self, view_box: str = ""):
+        """Constructor, define tag and class attributes"""
+        super().__init__("svg")
+        # Properties
+        self._view_box = view_box
+        self._render_view_box()
+
+    def _create_element(self) -> Any:
+        """Create the DOM element in the SVG namespace"""
+        return document.createElementNS(_SVG_NAMESPACE, self._tag)
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_view_box()
+
+    # Property: view_box
+    def _render_view_box(self):
+        """Renderer"""
+        if len(self._view_box) > 0:
+            self._elem.setAttribute("viewBox", self._view_box)
+        else:
+            self._elem.removeAttribute("viewBox")
+
+    def get_view_box(self) -> str:
+        """Accessor"""
+        return self._view_box
+
+    def set_view_box(self, view_box: str) -> Self:
+        """Mutator, for example: "0 0 100 100" """
+        if self._view_box != view_box:
+            self._view_box = view_box
+            _schedule_render(self._render_view_box)
+        return self
+
+
+class PSvgShape(PBaseWidget):
+    """Abstract SVG shape widget class, with fill and stroke"""
+
+    def __init__(self, tag: str):
+        """Constructor, define tag and class attributes"""
+        super().__init__(tag)
+        # Properties
+        self._fill = ""
+        self._render_fill()
+        self._stroke = ""
+        self._render_stroke()
+        self._stroke_width = None
+        self._render_stroke_width()
+
+    def _create_element(self) -> Any:
+        """Create the DOM element in the SVG namespace"""
+        return document.createElementNS(_SVG_NAMESPACE, self._tag)
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_fill()
+        self._render_stroke()
+        self._render_stroke_width()
+
+    def _render_attributes(self, names: list[str], values: tuple):
+        """Set the geometry attributes of the shape"""
+        for name, value in zip(names, values):
+            self._elem.setAttribute(name, str(value))
+
+    # Property: fill
+    def _render_fill(self):
+        """Renderer"""
+        if len(self._fill) > 0:
+            self._elem.setAttribute("fill", self._fill)
+        else:
+            self._elem.removeAttribute("fill")
+
+    def get_fill(self) -> str:
+        """Accessor"""
+        return self._fill
+
+    def set_fill(self, fill: str) -> Self:
+        """Mutator"""
+        if self._fill != fill:
+            self._fill = fill
+            _schedule_render(self._render_fill)
+        return self
+
+    # Property: stroke
+    def _render_stroke(self):
+        """Renderer"""
+        if len(self._stroke) > 0:
+            self._elem.setAttribute("stroke", self._stroke)
+        else:
+            self._elem.removeAttribute("stroke")
+
+    def get_stroke(self) -> str:
+        """Accessor"""
+        return self._stroke
+
+    def set_stroke(self, stroke: str) -> Self:
+        """Mutator"""
+        if self._stroke != stroke:
+            self._stroke = stroke
+            _schedule_render(self._render_stroke)
+        return self
+
+    # Property: stroke_width
+    def _render_stroke_width(self):
+        """Renderer"""
+        if self._stroke_width is not None:
+            self._elem.setAttribute("stroke-width", str(self._stroke_width))
+        else:
+            self._elem.removeAttribute("stroke-width")
+
+    def get_stroke_width(self) -> float | None:
+        """Accessor"""
+        return self._stroke_width
+
+    def set_stroke_width(self, stroke_width: float | None) -> Self:
+        """Mutator"""
+        if self._stroke_width != stroke_width:
+            self._stroke_width = stroke_width
+            _schedule_render(self._render_stroke_width)
+        return self
+
+
+class PSvgRect(PSvgShape):
+    """SVG rectangle widget class"""
+
+    def __init__(self, x: float, y: float, width: float, height: float):
+        """Constructor, define tag and class attributes"""
+        super().__init__("rect")
+        # Properties
+        self._geometry = (x, y, width, height)
+        self._render_geometry()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_geometry()
+
+    # Property: geometry
+    def _render_geometry(self):
+        """Renderer"""
+        self._render_attributes(["x", "y", "width", "height"], self._geometry)
+
+    def get_geometry(self) -> tuple[float, float, float, float]:
+        """Accessor"""
+        return self._geometry
+
+    def set_geometry(self, x: float, y: float, width: float, height: float) -> Self:
+        """Mutator"""
+        if self._geometry != (x, y, width, height):
+            self._geometry = (x, y, width, height)
+            _schedule_render(self._render_geometry)
+        return self
+
+
+class PSvgCircle(PSvgShape):
+    """SVG circle widget class"""
+
+    def __init__(self, cx: float, cy: float, r: float):
+        """Constructor, define tag and class attributes"""
+        super().__init__("circle")
+        # Properties
+        self._geometry = (cx, cy, r)
+        self._render_geometry()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_geometry()
+
+    # Property: geometry
+    def _render_geometry(self):
+        """Renderer"""
+        self._render_attributes(["cx", "cy", "r"], self._geometry)
+
+    def get_geometry(self) -> tuple[float, float, float]:
+        """Accessor"""
+        return self._geometry
+
+    def set_geometry(self, cx: float, cy: float, r: float) -> Self:
+        """Mutator"""
+        if self._geometry != (cx, cy, r):
+            self._geometry = (cx, cy, r)
+            _schedule_render(self._render_geometry)
+        return self
+
+
+class PSvgLine(PSvgShape):
+    """SVG line widget class"""
+
+    def __init__(self, x1: float, y1: float, x2: float, y2: float):
+        """Constructor, define tag and class attributes"""
+        super().__init__("line")
+        # Properties
+        self._geometry = (x1, y1, x2, y2)
+        self._render_geometry()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_geometry()
+
+    # Property: geometry
+    def _render_geometry(self):
+        """Renderer"""
+        self._render_attributes(["x1", "y1", "x2", "y2"], self._geometry)
+
+    def get_geometry(self) -> tuple[float, float, float, float]:
+        """Accessor"""
+        return self._geometry
+
+    def set_geometry(self, x1: float, y1: float, x2: float, y2: float) -> Self:
+        """Mutator"""
+        if self._geometry != (x1, y1, x2, y2):
+            self._geometry = (x1, y1, x2, y2)
+            _schedule_render(self._render_geometry)
+        return self
+
+
+class PSvgPath(PSvgShape):
+    """SVG path widget class, a large series of points is a single path element"""
+
+    # See: https://developer.mozilla.org/en-US/docs/Web/SVG/Attribute/d
+
+    def __init__(self, d: str = ""):
+        """Constructor, define tag and class attributes"""
+        super().__init__("path")
+        self._decimals = 2
+        # Properties
+        self._d = d
+        self._render_d()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_d()
+
+    def _format_points(self, xs: Any, ys: Any, command: str) -> str:
+        """Format points as path commands, with a single string formatting operation"""
+        xy = _interleave_coordinates(xs, ys)
+        n = len(xy) // 2
+        if n == 0:
+            return ""
+        point = f"%.{self._decimals}f,%.{self._decimals}f"
+        return ((command + point) + ("L" + point) * (n - 1)) % tuple(xy)
+
+    def set_points(self, xs: Any, ys: Any = None) -> Self:
+        """Replace the path by lines through the points, from lists or NumPy arrays of x and y, or of (x, y) pairs"""
+        return self.set_d(self._format_points(xs, ys, "M"))
+
+    def append_points(self, xs: Any, ys: Any = None) -> Self:
+        """Extend the path with lines to the points, only the new points are formatted, for streaming series"""
+        return self.set_d(self._d + self._format_points(xs, ys, "L" if len(self._d) > 0 else "M"))
+
+    # Property: decimals
+    def get_decimals(self) -> int:
+        """Accessor"""
+        return self._decimals
+
+    def set_decimals(self, decimals: int) -> Self:
+        """Mutator, number of decimals of the coordinates of points that are formatted afterwards"""
+        self._decimals = decimals
+        return self
+
+    # Property: d
+    def _render_d(self):
+        """Renderer"""
+        if len(self._d) > 0:
+            self._elem.setAttribute("d", self._d)
+        else:
+            self._elem.removeAttribute("d")
+
+    def get_d(self) -> str:
+        """Accessor"""
+        return self._d
+
+    def set_d(self, d: str) -> Self:
+        """Mutator, the path data, multiple changes in one animation frame are rendered once"""
+        if self._d != d:
+            self._d = d
+            _schedule_render(self._render_d)
+        return self
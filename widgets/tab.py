@@ -5,13 +5,15 @@ This software is distributed under the terms of the MIT license. See LICENSE.txt
 PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
 """
 
-from typing import Self
+from typing import Any, Self
 
 # Prefer pyscript import over more basic js import for the document and window objects
 from pyscript import document  # type: ignore # pylint: disable=import-error
 
+from widgets.base import PBaseWidget
 from widgets.compound import PCompoundWidget
-from widgets.globals import _ID_SUPPLEMENT
+from widgets.globals import _ID_SUPPLEMENT, _add_listener, _adopt_or_create_element, _append_element
+from widgets.scheduler import _schedule_render
 
 
 _ID_DIV = "div"
@@ -21,13 +23,15 @@ _ID_A = "a"
 class PTab(PCompoundWidget):
     """Tabs widget class"""
 
+    # Tab switching is done in Python and only needs the Fomantic UI CSS, not the jQuery based tab module.
+    # Each child is a tab segment with a data-tab attribute, that is matched with the index of the tab.
+
     def __init__(self):
         """Constructor, define tag and class attributes"""
         super().__init__("div")
-        self._insert_div()
         # Tabs
-        self._elem_tabs = []
         self._tabs = []
+        self._insert_div()
         # Properties
         self._active = None
         self._render_active()
@@ -36,28 +40,48 @@ class PTab(PCompoundWidget):
         """Override this method to delete state keys that cannot be pickled"""
         super()._delete_state(state)
         del state["_elem_div"]
-        # TODO del state _elem_tabs
+        del state["_elem_tabs"]
 
     def _insert_div(self):
         """Insert the inner div element into the DOM tree"""
         # No need to replace existing children, this method is only called from initialization or deserialization
         # See: https://fomantic-ui.com/modules/tab.html#/examples
-        self._elem_div = document.createElement("div")
-        self._elem_div.id = self._widget_id + _ID_SUPPLEMENT + _ID_DIV
+        self._elem_div = _adopt_or_create_element("div", self._widget_id + _ID_SUPPLEMENT + _ID_DIV)
         #self._elem_div.classList.add(self.__class__.__name__)
         self._elem_div.classList.add("ui")
         self._elem_div.classList.add("top")
         self._elem_div.classList.add("attached")
         self._elem_div.classList.add("tabular")
         self._elem_div.classList.add("menu")
-        self._elem.appendChild(self._elem_div)
+        self._elem_tabs = []
+        for tab in self._tabs:
+            self._insert_tab(tab)
+        _append_element(self._elem, self._elem_div)
+        _add_listener(self, self._elem_div, "click", self._div_click)
+
+    def _insert_tab(self, tab: str):
+        """Insert a menu item for a tab into the DOM tree"""
+        elem_a = _adopt_or_create_element(
+            "a", self._widget_id + _ID_SUPPLEMENT + _ID_DIV + _ID_SUPPLEMENT + _ID_A + str(len(self._elem_tabs))
+        )
+        #elem_a.classList.add(self.__class__.__name__)
+        elem_a.classList.add("item")
+        elem_a.dataset.tab = len(self._elem_tabs)
+        elem_a.replaceChildren(document.createTextNode(tab))
+        _append_element(self._elem_div, elem_a)
+        self._elem_tabs.append(elem_a)
 
     def _insert_state(self):
         """Override this method to insert state, for keys that could not be pickled"""
         super()._insert_state()
-        # TODO Make in _insert_tab call in a loop over _tabs
         self._insert_div()
 
+    def _div_click(self, event: Any):
+        """Click event handler for all menu items, switch to the clicked tab"""
+        elem_a = event.target.closest(".item")
+        if elem_a is not None:
+            self.set_active(int(elem_a.dataset.tab))
+
     # Tabs
     def get_tabs(self) -> list[str]:
         """Get the list of tabs"""
@@ -72,18 +96,22 @@ class PTab(PCompoundWidget):
 
     def add_tab(self, tab: str) -> Self:
         """Add a single tab"""
-        elem_a = document.createElement("a")
-        elem_a.id = self._widget_id + _ID_SUPPLEMENT + _ID_DIV + _ID_SUPPLEMENT + _ID_A + str(len(self._tabs))
-        #elem_a.classList.add(self.__class__.__name__)
-        elem_a.classList.add("item")
-        elem_a.dataset.tab = len(self._tabs)
-        elem_a.replaceChildren(document.createTextNode(tab))
-        self._elem_div.appendChild(elem_a)
-
-        self._elem_tabs.append(elem_a)
+        self._insert_tab(tab)
         self._tabs.append(tab)
         return self
 
+    def add_child(self, child: PBaseWidget) -> Self:
+        """Add a single child, a tab segment that is only displayed when its tab is active"""
+        super().add_child(child)
+        _schedule_render(self._render_active)
+        return self
+
+    def insert_child(self, index: int, child: PBaseWidget) -> Self:
+        """Insert a single child, a tab segment that is only displayed when its tab is active"""
+        super().insert_child(index, child)
+        _schedule_render(self._render_active)
+        return self
+
     def backup_state(self):
         """Override this method to backup runtime DOM state to widget instance fields before pickling to session storage"""
         super().backup_state()
@@ -120,10 +148,17 @@ class PTab(PCompoundWidget):
     # Property: active
     def _render_active(self):
         """Renderer"""
-        for e in self._elem_tabs:
-            e.classList.remove("active")
-        if self._active is not None and self._active > 0 and self._active < len(self._elem_tabs):
-            self._elem_tabs[self._active].classList.add("active")
+        for i, e in enumerate(self._elem_tabs):
+            if i == self._active:
+                e.classList.add("active")
+            else:
+                e.classList.remove("active")
+        # The Fomantic UI CSS only displays the active tab segment
+        for c in self._children:
+            if c._elem.getAttribute("data-tab") == str(self._active):  # pylint: disable=protected-access
+                c._elem.classList.add("active")  # pylint: disable=protected-access
+            else:
+                c._elem.classList.remove("active")  # pylint: disable=protected-access
 
     def get_active(self) -> int | None:
         """Accessor"""
@@ -133,5 +168,5 @@ class PTab(PCompoundWidget):
         """Mutator"""
         if self._active != active:
             self._active = active
-            self._render_active()
+            _schedule_render(self._render_active)
         return self
@@ -0,0 +1,200 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+from collections.abc import Callable
+from typing import Any, Self
+
+# Prefer pyscript import over more basic js import for the document and window objects
+from pyscript import document  # type: ignore # pylint: disable=import-error
+
+from widgets.base import PBaseWidget
+from widgets.compound import PCompoundWidget
+from widgets.globals import _ID_SUPPLEMENT, _add_listener, _adopt_or_create_element, _append_element
+from widgets.scheduler import _schedule_render
+
+
+_ID_MENU = "menu"
+_ID_ITEM = "item"
+
+
+class PTabPane(PCompoundWidget):  # pylint: disable=too-many-instance-attributes
+    """Tab pane widget class, the contents of a tab are built when the tab is activated for the first time"""
+
+    # See: https://fomantic-ui.com/modules/tab.html
+    # Tab switching only needs the Fomantic UI CSS, the active tab segment is displayed.
+    # The factories are pickled with the widget tree, so use classes, functions or methods instead of lambdas.
+
+    def __init__(self):
+        """Constructor, define tag and class attributes"""
+        super().__init__("div")
+        # Tabs
+        self._titles = []
+        self._factories = []
+        self._contents = []  # Content widget per tab, or None when not built yet or unloaded
+        self._recent = []  # Built tab indices, least recently active first
+        self._insert_menu()
+        # Properties
+        self._max_loaded_tabs = None
+        self._active = None
+        self._render_active()
+
+    def _delete_state(self, state):
+        """Override this method to delete state keys that cannot be pickled"""
+        super()._delete_state(state)
+        del state["_elem_menu"]
+        del state["_elem_items"]
+
+    def _insert_menu(self):
+        """Insert the tab menu and an item per tab into the DOM tree"""
+        # No need to replace existing children, this method is only called from initialization or deserialization
+        self._elem_menu = _adopt_or_create_element("div", self._widget_id + _ID_SUPPLEMENT + _ID_MENU)
+        for c in ["ui", "top", "attached", "tabular", "menu"]:
+            self._elem_menu.classList.add(c)
+        self._elem_items = []
+        for title in self._titles:
+            self._insert_item(title)
+        _append_element(self._elem, self._elem_menu)
+        _add_listener(self, self._elem_menu, "click", self._menu_click)
+
+    def _insert_item(self, title: str):
+        """Insert a menu item for a tab"""
+        elem_item = _adopt_or_create_element(
+            "a", self._widget_id + _ID_SUPPLEMENT + _ID_ITEM + _ID_SUPPLEMENT + str(len(self._elem_items))
+        )
+        elem_item.classList.add("item")
+        elem_item.dataset.tab = len(self._elem_items)
+        elem_item.replaceChildren(document.createTextNode(title))
+        _append_element(self._elem_menu, elem_item)
+        self._elem_items.append(elem_item)
+
+    def _insert_state(self):
+        """Override this method to insert state, for keys that could not be pickled"""
+        super()._insert_state()
+        self._insert_menu()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_dark_menu()
+        self._render_active()
+
+    def _menu_click(self, event: Any):
+        """Click event handler for all menu items, switch to the clicked tab"""
+        elem_item = event.target.closest(".item")
+        if elem_item is not None:
+            self.set_active(int(elem_item.dataset.tab))
+
+    # Tabs
+    def get_tab_count(self) -> int:
+        """Number of tabs"""
+        return len(self._titles)
+
+    def get_tab_title(self, index: int) -> str:
+        """Title of a tab"""
+        return self._titles[index]
+
+    def get_tab_content(self, index: int) -> PBaseWidget | None:
+        """Content widget of a tab, or None when it is not built (yet)"""
+        return self._contents[index]
+
+    def add_tab(self, title: str, factory: Callable[[], PBaseWidget]) -> Self:
+        """Add a tab, the factory builds the content widget when the tab is activated"""
+        self._titles.append(title)
+        self._factories.append(factory)
+        self._contents.append(None)
+        self._insert_item(title)
+        if self._active is None:
+            self.set_active(0)
+        return self
+
+    def _build_tab(self, index: int):
+        """Build the content widget of a tab, when it was not built yet"""
+        if self._contents[index] is None:
+            content = self._factories[index]()
+            for c in ["bottom", "attached", "tab", "segment"]:
+                content._elem.classList.add(c)  # pylint: disable=protected-access
+            self._contents[index] = content
+            self.add_child(content)
+        if index in self._recent:
+            self._recent.remove(index)
+        self._recent.append(index)
+
+    def _unload_tab(self, index: int):
+        """Remove the content widget of an inactive tab, it is built again on the next activation"""
+        content = self._contents[index]
+        if content is not None and index != self._active:
+            self._contents[index] = None
+            self._recent.remove(index)
+            self.remove_child(content)
+
+    def unload_inactive_tabs(self) -> Self:
+        """Remove the content widgets of all inactive tabs, for example under memory pressure"""
+        for index in list(self._recent):
+            self._unload_tab(index)
+        return self
+
+    def _unload_least_recent_tabs(self):
+        """Keep at most the maximum number of built tabs"""
+        if self._max_loaded_tabs is not None:
+            for index in self._recent[: max(0, len(self._recent) - self._max_loaded_tabs)]:
+                self._unload_tab(index)
+
+    # Property: dark_mode (overridden)
+    def _render_dark_menu(self):
+        """Renderer"""
+        if self.is_dark_mode():
+            self._elem_menu.classList.add("inverted")
+        else:
+            self._elem_menu.classList.remove("inverted")
+
+    def set_dark_mode(self, dark_mode: bool):
+        """Mutator"""
+        super().set_dark_mode(dark_mode)
+        self._render_dark_menu()
+
+    # Property: max_loaded_tabs
+    def get_max_loaded_tabs(self) -> int | None:
+        """Accessor"""
+        return self._max_loaded_tabs
+
+    def set_max_loaded_tabs(self, max_loaded_tabs: int | None) -> Self:
+        """Mutator, least recently active tabs are unloaded when more tabs are built, None for no limit"""
+        if self._max_loaded_tabs != max_loaded_tabs:
+            self._max_loaded_tabs = max_loaded_tabs
+            self._unload_least_recent_tabs()
+        return self
+
+    # Property: active
+    def _render_active(self):
+        """Renderer"""
+        for index, elem_item in enumerate(self._elem_items):
+            active = index == self._active
+            if active:
+                elem_item.classList.add("active")
+            else:
+                elem_item.classList.remove("active")
+            content = self._contents[index]
+            if content is not None:
+                if active:
+                    content._elem.classList.add("active")  # pylint: disable=protected-access
+                else:
+                    content._elem.classList.remove("active")  # pylint: disable=protected-access
+
+    def get_active(self) -> int | None:
+        """Accessor"""
+        return self._active
+
+    def set_active(self, active: int | None) -> Self:
+        """Mutator, the contents of the tab are built when it is activated for the first time"""
+        if self._active != active:
+            self._active = active
+            if active is not None:
+                self._build_tab(active)
+                self._unload_least_recent_tabs()
+            _schedule_render(self._render_active)
+        return self
@@ -0,0 +1,75 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+import pickle
+
+from collections.abc import Callable
+from typing import Any
+
+import js  # type: ignore # pylint: disable=import-error
+
+from widgets.base import PBaseWidget
+from widgets.globals import _ID_PREFIX, _reserve_unique_ids, _swap_hydration_elements
+from widgets.scheduler import _call_sync_rendering
+
+
+class PTemplate:
+    """Widget template class, new widgets are cloned from a prototype widget subtree instead of being built one element at a time"""
+
+    # The prototype is built once by calling the factory with the arguments, then its DOM subtree is cloned with one
+    # cloneNode(true) call and the widget state is copied by pickling. The cloned widgets adopt the cloned elements by id,
+    # like hydration, so none of the elements are created or rendered again. Change the properties that differ per widget,
+    # like a label text, afterwards with the mutators.
+    # The prototype is copied with pickle, so callbacks must be methods of widgets in the prototype subtree or functions.
+
+    def __init__(self, factory: Callable[..., PBaseWidget], *args: Any):
+        """Constructor, the prototype is built when the first widget is created"""
+        self._factory = factory
+        self._args = args
+        self._prototype_elem = None
+        self._prototype_state = None
+        self._first_id = 0
+        self._id_count = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Magic method to get the object state when pickling, the prototype is built again after unpickling"""
+        state = self.__dict__.copy()
+        state["_prototype_elem"] = None
+        state["_prototype_state"] = None
+        return state
+
+    def _build_prototype(self):
+        """Build and render the prototype widget, and keep its DOM subtree and pickled state"""
+        # Render the property changes of the factory before cloning, without rendering the other widgets of the page
+        prototype = _call_sync_rendering(self._factory, *self._args)
+        prototype.backup_state()
+        self._prototype_elem = prototype._elem  # pylint: disable=protected-access
+        self._prototype_state = pickle.dumps(prototype)
+        prototype.dispose()  # Only its markup and state are used, its event listeners and their proxies are not
+        numbers = [
+            int(element_id[len(_ID_PREFIX) :].split("_")[0])
+            for element_id in js.ptemplate_elements(self._prototype_elem).to_py().keys()
+        ]
+        self._first_id = min(numbers)
+        self._id_count = max(numbers) - self._first_id + 1
+
+    def create(self) -> PBaseWidget:
+        """Create a new widget, cloned from the prototype, with new unique widget ids"""
+        if self._prototype_state is None:
+            self._build_prototype()
+        offset = _reserve_unique_ids(self._id_count) - self._first_id
+        elem = self._prototype_elem.cloneNode(True)
+        # Unpickling inserts the widget state, the widgets adopt the cloned elements with the prototype ids
+        previous = _swap_hydration_elements(js.ptemplate_elements(elem).to_py())
+        try:
+            widget = pickle.loads(self._prototype_state)
+        finally:
+            _swap_hydration_elements(previous)
+        js.ptemplate_shift_ids(elem, offset)
+        widget._clone_state(offset)  # pylint: disable=protected-access
+        return widget
@@ -9,6 +9,7 @@ PyScriptWidgets - A client side GUI class (widget) library for building web appl
 from typing import Self
 
 from widgets.input import PInputWidget
+from widgets.scheduler import _schedule_render
 
 
 class PTextInput(PInputWidget):
@@ -30,6 +31,14 @@ class PTextInput(PInputWidget):
         self._render_placeholder()
         self._render_pattern()
 
+    def _recycle(self, value: str):  # pylint: disable=arguments-differ
+        """Override this method to reset the widget with new constructor arguments, to reuse it from a pool of a compound widget"""
+        self._reset_state()
+        self.set_value(value)
+        self.set_input_type("text")
+        self.set_placeholder("")
+        self.set_pattern("")
+
     # Type: password
     def is_type_password(self) -> bool:
         """Accessor"""
@@ -82,7 +91,7 @@ class PTextInput(PInputWidget):
         """Mutator"""
         if self._placeholder != placeholder:
             self._placeholder = placeholder
-            self._render_placeholder()
+            _schedule_render(self._render_placeholder)
         return self
 
     # Property: pattern
@@ -101,5 +110,5 @@ class PTextInput(PInputWidget):
         """Mutator"""
         if self._pattern != pattern:
             self._pattern = pattern
-            self._render_pattern()
+            _schedule_render(self._render_pattern)
         return self
@@ -0,0 +1,235 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+from typing import Any, Self
+
+# Prefer pyscript import over more basic js import for the document and window objects
+from pyscript import document  # type: ignore # pylint: disable=import-error
+
+from widgets.editable import PEditableWidget
+from widgets.globals import _ID_SUPPLEMENT, _add_listener, _adopt_or_create_element, _append_element, mark_state_dirty
+from widgets.scheduler import _schedule_render
+from widgets.virtual import _PVirtualRows
+
+
+_ID_TEXTAREA = "textarea"
+_ID_LOG = "log"
+_ROW_HEIGHT = 20
+_ROWS = 5
+
+
+class PTextArea(PEditableWidget):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    """Text area widget class, for large texts with a read-only virtualized log view"""
+
+    # See: https://fomantic-ui.com/collections/form.html#text-area
+    # The value is cached in Python, so reading it does not copy the text across the FFI. An input event only marks
+    # the cached value as stale, it is read from the text area once, when it is needed. Appending text only copies
+    # the appended text. In the log view the text area is emptied and only the lines in and near the viewport get
+    # an element, so texts of many megabytes scroll smoothly.
+
+    def __init__(self, value: str):
+        """Constructor, define tag and class attributes"""
+        super().__init__("div")
+        self._elem.classList.add("form")
+        # Value
+        self._value = value
+        self._value_stale = False
+        self._lines = []  # Lines of the value, only in the log view
+        # Properties
+        self._rows = _ROWS
+        self._render_rows()
+        self._log_view = False
+        self._follow = True
+        self._render_log_view()  # Also renders the value
+
+    def backup_state(self):
+        """Override this method to backup runtime DOM state to widget instance fields before pickling to session storage"""
+        super().backup_state()
+        self._read_value()
+
+    def _delete_state(self, state):
+        """Override this method to delete state keys that cannot be pickled"""
+        super()._delete_state(state)
+        del state["_elem_textarea"]
+        del state["_elem_log"]
+        del state["_virtual_rows"]
+        del state["_lines"]  # The lines are split again from the value
+
+    def _insert_control(self):
+        """Insert the inner text area and log view elements into the DOM tree"""
+        # No need to replace existing children, this method is only called from initialization or deserialization
+        self._elem_textarea = _adopt_or_create_element("textarea", self._widget_id + _ID_SUPPLEMENT + _ID_TEXTAREA)
+        self._elem_textarea.style.resize = "none"
+        _append_element(self._elem, self._elem_textarea)
+        self._elem_log = _adopt_or_create_element("div", self._widget_id + _ID_SUPPLEMENT + _ID_LOG)
+        self._elem_log.style.fontFamily = "monospace"
+        self._elem_log.style.height = "100%"
+        _append_element(self._elem, self._elem_log)
+        self._virtual_rows = _PVirtualRows(
+            self._elem_log, _ROW_HEIGHT, self._create_row, self._row_key, self._fill_row
+        )
+        _add_listener(self, self._elem_textarea, "input", self._textarea_input)
+
+    def _control_element(self) -> Any:
+        """Inner text area element"""
+        return self._elem_textarea
+
+    def _insert_state(self):
+        """Override this method to insert state, for keys that could not be pickled"""
+        super()._insert_state()
+        self._lines = []
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_rows()
+        self._render_log_view()
+
+    def dispose(self):
+        """Cancel a running change handler, remove the event listeners and destroy their JS proxies, also of the virtualized rows"""
+        super().dispose()
+        self._virtual_rows.dispose()
+
+    def _recycle(self, value: str):  # pylint: disable=arguments-differ
+        """Override this method to reset the widget with new constructor arguments, to reuse it from a pool of a compound widget"""
+        self._reset_state()
+        self.set_log_view(False)
+        self.set_value(value)
+        self.set_rows(_ROWS)
+        self.set_follow(True)
+
+    def _textarea_input(self, event: Any):  # pylint: disable=unused-argument
+        """Input event handler, the cached value is read again when it is needed"""
+        self._value_stale = True
+        mark_state_dirty()
+
+    def _read_value(self):
+        """Read the value from the text area, only when it was edited after the last read"""
+        if self._value_stale:
+            self._value_stale = False
+            self._value = self._elem_textarea.value
+
+    # Value
+    def get_value(self) -> str:
+        """Accessor"""
+        self._read_value()
+        return self._value
+
+    def set_value(self, value: str) -> Self:
+        """Mutator"""
+        self._read_value()
+        if self._value != value:
+            self._value = value
+            if self._log_view:
+                self._lines = value.split("\n")
+                self._render_lines()
+            else:
+                self._elem_textarea.value = value
+            mark_state_dirty()
+        return self
+
+    def append(self, text: str) -> Self:
+        """Append text to the value, only the appended text is copied to the text area"""
+        self._read_value()
+        self._value += text
+        if self._log_view:
+            lines = text.split("\n")
+            self._lines[-1] += lines[0]
+            self._lines.extend(lines[1:])
+            self._render_lines()
+        else:
+            # See: https://developer.mozilla.org/en-US/docs/Web/API/HTMLTextAreaElement/setRangeText
+            end = self._elem_textarea.textLength
+            self._elem_textarea.setRangeText(text, end, end, "preserve")
+        mark_state_dirty()
+        return self
+
+    def get_line_count(self) -> int:
+        """Number of lines of the value"""
+        if self._log_view:
+            return len(self._lines)
+        return self.get_value().count("\n") + 1
+
+    # Virtualized log view rows
+    def _render_lines(self):
+        """Render the visible lines of the log view, and scroll to the last line when following"""
+        self._virtual_rows.set_count(len(self._lines))
+        if self._follow:
+            self._virtual_rows.scroll_to(len(self._lines) - 1)
+
+    def _create_row(self, elem_row: Any) -> Any:
+        """Add the text to a new pooled row element"""
+        elem_row.style.paddingLeft = "0.5em"
+        elem_row.style.paddingRight = "0.5em"
+        elem_text = document.createTextNode("")
+        elem_row.appendChild(elem_text)
+        return elem_text
+
+    def _row_key(self, index: int) -> str:
+        """The row contents that are shown, to skip unchanged DOM writes"""
+        return self._lines[index]
+
+    def _fill_row(self, elem_row: Any, created: Any, index: int):  # pylint: disable=unused-argument
+        """Update a pooled row element"""
+        created.nodeValue = self._lines[index]
+
+    # Property: rows
+    def _render_rows(self):
+        """Renderer"""
+        self._elem_textarea.setAttribute("rows", str(self._rows))
+        self._elem_log.style.minHeight = str(self._rows * _ROW_HEIGHT) + "px"
+
+    def get_rows(self) -> int:
+        """Accessor"""
+        return self._rows
+
+    def set_rows(self, rows: int) -> Self:
+        """Mutator, the number of visible lines"""
+        if self._rows != rows:
+            self._rows = rows
+            _schedule_render(self._render_rows)
+        return self
+
+    # Property: log_view
+    def _render_log_view(self):
+        """Renderer"""
+        if self._log_view:
+            self._elem_textarea.style.display = "none"
+            self._elem_textarea.value = ""  # The text area does not keep a copy of a large value
+            self._elem_log.style.display = "block"
+            self._lines = self._value.split("\n")
+            self._render_lines()
+        else:
+            self._elem_log.style.display = "none"
+            self._lines = []
+            self._virtual_rows.set_count(0)
+            self._elem_textarea.value = self._value
+            self._elem_textarea.style.display = None
+
+    def is_log_view(self) -> bool:
+        """Accessor"""
+        return self._log_view
+
+    def set_log_view(self, log_view: bool) -> Self:
+        """Mutator, show the value as read-only log lines, only the lines in and near the viewport are rendered"""
+        if self._log_view != log_view:
+            self._read_value()
+            self._log_view = log_view
+            self._render_log_view()
+        return self
+
+    # Property: follow
+    def is_follow(self) -> bool:
+        """Accessor"""
+        return self._follow
+
+    def set_follow(self, follow: bool) -> Self:
+        """Mutator, scroll to the last line of the log view when text is appended"""
+        self._follow = follow
+        return self
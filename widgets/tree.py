@@ -0,0 +1,324 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+import asyncio
+import inspect
+
+from collections.abc import Callable
+from typing import Any, Self
+
+from js import console  # type: ignore # pylint: disable=import-error
+# Prefer pyscript import over more basic js import for the document and window objects
+from pyscript import document  # type: ignore # pylint: disable=import-error
+
+from widgets.compound import PCompoundWidget
+from widgets.globals import _add_listener
+from widgets.scheduler import _schedule_render
+from widgets.virtual import _PVirtualRows
+
+
+_ROW_HEIGHT = 24
+_INDENT = 16
+
+
+class _PTreeNode:  # pylint: disable=too-few-public-methods
+    """Loaded tree node, only the children of expanded nodes are loaded"""
+
+    def __init__(self, key: str, text: str, has_children: bool):
+        """Constructor, define the node attributes"""
+        self.key = key
+        self.text = text
+        self.has_children = has_children
+        self.children = None  # Not loaded yet
+        self.children_by_key = {}
+        self.loading = False
+
+
+class PTree(PCompoundWidget):  # pylint: disable=too-many-instance-attributes
+    """Tree widget class, with lazy loading of child nodes and a virtualized list of visible rows"""
+
+    # The provider is called with the path (a tuple of keys) of the parent node, the root node has an empty path.
+    # It returns, or asynchronously returns, a list of (key, text, has_children) tuples.
+    # The provider is pickled with the widget tree, so use a function or method instead of a lambda.
+
+    def __init__(self, provider: Callable):
+        """Constructor, define tag and class attributes"""
+        super().__init__("div")
+        self._row_height = _ROW_HEIGHT
+        self._insert_viewport()
+        # Nodes, only the expansion state is kept when pickling
+        self._provider = provider
+        self._expanded = set()
+        self._rows = []  # Visible rows: (depth, path, node)
+        self._row_indexes = {}  # Index of the visible row by path
+        self._insert_nodes()
+        # Properties
+        self._selected = None
+        self._render_selected()
+        self._select = None
+
+    def _delete_state(self, state):
+        """Override this method to delete state keys that cannot be pickled"""
+        super()._delete_state(state)
+        del state["_virtual_rows"]
+        # Loaded nodes are not part of the state, they are loaded again from the provider
+        del state["_root"]
+        del state["_rows"]
+        del state["_row_indexes"]
+
+    def _insert_viewport(self):
+        """Insert the virtualized rows into the DOM tree"""
+        # No need to replace existing children, this method is only called from initialization or deserialization
+        self._virtual_rows = _PVirtualRows(
+            self._elem, self._row_height, self._create_row, self._row_key, self._fill_row
+        )
+        _add_listener(self, self._elem, "click", self._viewport_click)
+
+    def _insert_nodes(self):
+        """Start loading the root node"""
+        self._root = _PTreeNode("", "", True)
+        self._rows = []
+        self._row_indexes = {}
+        self._load(self._root, ())
+
+    def _insert_state(self):
+        """Override this method to insert state, for keys that could not be pickled"""
+        super()._insert_state()
+        self._insert_viewport()
+        self._insert_nodes()
+
+    def dispose(self):
+        """Remove the event listeners and destroy their JS proxies, also of the virtualized rows"""
+        super().dispose()
+        self._virtual_rows.dispose()
+
+    def restore_state(self):
+        """Override this method to restore runtime DOM state from widget instance fields after unpickling from session storage"""
+        super().restore_state()
+        # Properties
+        self._render_selected()
+
+    def after_page_load(self):
+        """Override this method tot execute code after the page DOM has loaded"""
+        super().after_page_load()
+        self._load(self._root, ())  # Retry, when loading the root node failed before
+        self._virtual_rows.refresh()
+
+    # Nodes
+    def _find_node(self, path: tuple[str, ...]) -> _PTreeNode | None:
+        """Find a loaded node by its path"""
+        node = self._root
+        for key in path:
+            if node.children is None:
+                return None
+            node = node.children_by_key.get(key)
+            if node is None:
+                return None
+        return node
+
+    def _find_row(self, path: tuple[str, ...]) -> int:
+        """Find the index of a visible row by its path, or -1"""
+        return self._row_indexes.get(path, -1)
+
+    def _index_rows(self, start: int):
+        """Update the indexes of the visible rows by path, from the start index"""
+        for index in range(start, len(self._rows)):
+            self._row_indexes[self._rows[index][1]] = index
+
+    def _is_shown(self, path: tuple[str, ...]) -> bool:
+        """Are the children of this path shown, because it and all of its ancestors are expanded"""
+        return all(path[:i] in self._expanded for i in range(1, len(path) + 1))
+
+    def _load(self, node: _PTreeNode, path: tuple[str, ...]):
+        """Load the children of a node asynchronously, once"""
+        if node.children is None and not node.loading:
+            node.loading = True
+            asyncio.ensure_future(self._load_async(node, path))
+
+    async def _load_async(self, node: _PTreeNode, path: tuple[str, ...]):
+        """Call the provider and insert the rows of the loaded children when they are shown"""
+        try:
+            result = self._provider(path)
+            if inspect.isawaitable(result):
+                result = await result
+            children = [_PTreeNode(str(k), str(t), bool(h)) for k, t, h in result]
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # Show the node collapsed, expanding it again retries loading, reload() retries loading the root node
+            console.error("Loading tree node " + repr(path) + " failed: " + repr(error))
+            if len(path) == 0:
+                self._rows = []
+                self._row_indexes = {}
+                self._virtual_rows.set_count(0)
+            self._expanded.discard(path)
+            self._virtual_rows.invalidate()
+            return
+        finally:
+            node.loading = False
+        node.children = children
+        node.children_by_key = {c.key: c for c in node.children}
+        if len(path) == 0:
+            self._rows = list(self._subtree_rows(node, path, 0))
+            self._row_indexes = {}
+            self._index_rows(0)
+            self._virtual_rows.set_count(len(self._rows))
+        elif self._is_shown(path):
+            self._insert_subtree_rows(path)
+        # Restore the expansion state of the children, for example after unpickling
+        for c in node.children:
+            child_path = path + (c.key,)
+            if child_path in self._expanded:
+                self._load(c, child_path)
+
+    def _subtree_rows(self, node: _PTreeNode, path: tuple[str, ...], depth: int):
+        """Generate the visible rows for the loaded children of a node"""
+        if node.children is not None:
+            for c in node.children:
+                child_path = path + (c.key,)
+                yield (depth, child_path, c)
+                if child_path in self._expanded:
+                    yield from self._subtree_rows(c, child_path, depth + 1)
+
+    def _insert_subtree_rows(self, path: tuple[str, ...]):
+        """Insert the rows of the children of an expanded node, below its own row"""
+        index = self._find_row(path)
+        if index >= 0:
+            depth, _, node = self._rows[index]
+            self._rows[index + 1 : index + 1] = list(self._subtree_rows(node, path, depth + 1))
+            self._index_rows(index + 1)
+            self._virtual_rows.set_count(len(self._rows))
+
+    def _remove_subtree_rows(self, path: tuple[str, ...]):
+        """Remove the rows of the descendants of a collapsed node, below its own row"""
+        index = self._find_row(path)
+        if index >= 0:
+            depth = self._rows[index][0]
+            end = index + 1
+            while end < len(self._rows) and self._rows[end][0] > depth:
+                end += 1
+            for row in self._rows[index + 1 : end]:
+                del self._row_indexes[row[1]]
+            del self._rows[index + 1 : end]
+            self._index_rows(index + 1)
+            self._virtual_rows.set_count(len(self._rows))
+
+    def reload(self) -> Self:
+        """Load all nodes again from the provider, the expansion state is kept"""
+        if not self._root.loading:
+            self._insert_nodes()
+            self._virtual_rows.set_count(0)
+        return self
+
+    # Expansion state
+    def is_expanded(self, path: tuple[str, ...]) -> bool:
+        """Accessor"""
+        return tuple(path) in self._expanded
+
+    def expand(self, path: tuple[str, ...]) -> Self:
+        """Expand a node, the children are loaded from the provider on first expansion"""
+        path = tuple(path)
+        if path not in self._expanded:
+            self._expanded.add(path)
+            node = self._find_node(path)
+            if node is not None:
+                if node.children is None:
+                    self._load(node, path)
+                elif self._is_shown(path):
+                    self._insert_subtree_rows(path)
+        return self
+
+    def collapse(self, path: tuple[str, ...]) -> Self:
+        """Collapse a node, the loaded children are kept in memory"""
+        path = tuple(path)
+        if path in self._expanded:
+            if self._is_shown(path):
+                self._remove_subtree_rows(path)
+            self._expanded.remove(path)
+        return self
+
+    def toggle(self, path: tuple[str, ...]) -> Self:
+        """Expand a collapsed node, or collapse an expanded node"""
+        if self.is_expanded(path):
+            return self.collapse(path)
+        return self.expand(path)
+
+    # Virtualized rows
+    def _create_row(self, elem_row: Any) -> tuple[Any, Any]:
+        """Add the icon and text to a new pooled row element"""
+        elem_row.classList.add("item")
+        elem_row.style.cursor = "pointer"
+        elem_icon = document.createElement("i")
+        elem_text = document.createTextNode("")
+        elem_row.appendChild(elem_icon)
+        elem_row.appendChild(elem_text)
+        return (elem_icon, elem_text)
+
+    def _row_key(self, index: int) -> tuple:
+        """The row contents that are shown, to skip unchanged DOM writes"""
+        path = self._rows[index][1]
+        return (path, path in self._expanded, path == self._selected)
+
+    def _fill_row(self, elem_row: Any, created: tuple[Any, Any], index: int):
+        """Update a pooled row element"""
+        elem_icon, elem_text = created
+        depth, path, node = self._rows[index]
+        elem_row.style.paddingLeft = str(depth * _INDENT) + "px"
+        if path == self._selected:
+            elem_row.classList.add("active")
+        else:
+            elem_row.classList.remove("active")
+        if node.has_children:
+            elem_icon.className = "caret icon " + ("down" if path in self._expanded else "right")
+        else:
+            elem_icon.className = "icon"
+        elem_text.nodeValue = node.text
+
+    def _viewport_click(self, event: Any):
+        """Click event handler for all rows, toggle the node and select it"""
+        index = self._virtual_rows.index_of(event.target)
+        if index is not None:
+            _, path, node = self._rows[index]
+            if node.has_children:
+                self.toggle(path)
+            self.set_selected(path)
+            if self._select is not None:
+                self._select(path)
+
+    # Property: row_height
+    def get_row_height(self) -> int:
+        """Accessor"""
+        return self._row_height
+
+    def set_row_height(self, row_height: int) -> Self:
+        """Mutator"""
+        if self._row_height != row_height:
+            self._row_height = row_height
+            self._virtual_rows.set_row_height(row_height)
+        return self
+
+    # Property: selected
+    def _render_selected(self):
+        """Renderer"""
+        self._virtual_rows.invalidate()
+
+    def get_selected(self) -> tuple[str, ...] | None:
+        """Accessor"""
+        return self._selected
+
+    def set_selected(self, selected: tuple[str, ...] | None) -> Self:
+        """Mutator"""
+        selected = tuple(selected) if selected is not None else None
+        if self._selected != selected:
+            self._selected = selected
+            _schedule_render(self._render_selected)
+        return self
+
+    # Property: select (writeonly)
+    def on_select(self, select: Callable | None) -> Self:
+        """Mutator, the callback is called with the path of the selected node"""
+        self._select = select
+        return self
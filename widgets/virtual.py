@@ -0,0 +1,176 @@
+"""
+Copyright (c) 2025 Michiel Westland
+This software is distributed under the terms of the MIT license. See LICENSE.txt
+
+PyScriptWidgets - A client side GUI class (widget) library for building web applications with PyScript.
+"""
+
+
+from collections.abc import Callable
+from typing import Any, Hashable
+
+# Prefer pyscript import over more basic js import for the document and window objects
+from pyscript import document  # type: ignore # pylint: disable=import-error
+
+from widgets.globals import (
+    _ID_SUPPLEMENT,
+    _add_listener,
+    _adopt_or_create_element,
+    _append_element,
+    _remove_listeners,
+)
+from widgets.scheduler import measure, mutate
+
+
+_ID_SPACER = "spacer"
+_OVERSCAN_ROWS = 10
+
+
+class _PVirtualRows:  # pylint: disable=too-many-instance-attributes
+    """Virtualized rows in a scrollable viewport element, only rows in and near the viewport get a pooled element"""
+
+    # This helper holds DOM elements, so the owning widget deletes it before pickling and inserts it again after.
+    # The owning widget provides the callbacks:
+    # - create_row(elem_row) adds child elements to a new pooled row element and returns them
+    # - row_key(index) returns a hashable value, a pooled row element is only filled when its key changes
+    # - fill_row(elem_row, created, index) updates a pooled row element for the row at the index
+
+    def __init__(
+        self,
+        elem_viewport: Any,
+        row_height: int,
+        create_row: Callable[[Any], Any],
+        row_key: Callable[[int], Hashable],
+        fill_row: Callable[[Any, Any, int], None],
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Constructor, insert a spacer into the viewport element"""
+        self._elem_viewport = elem_viewport
+        self._elem_viewport.style.overflow = "auto"
+        self._elem_viewport.style.position = "relative"
+        self._elem_spacer = _adopt_or_create_element("div", elem_viewport.id + _ID_SUPPLEMENT + _ID_SPACER)
+        self._elem_spacer.replaceChildren()  # Pre-rendered rows are not pooled
+        self._elem_spacer.style.position = "relative"
+        _append_element(self._elem_viewport, self._elem_spacer)
+        self._row_height = row_height
+        self._create_row = create_row
+        self._row_key = row_key
+        self._fill_row = fill_row
+        self._count = 0
+        self._pool = []  # Pooled rows: (elem_row, created)
+        self._shown = []  # Row key shown per pooled row, or None when hidden
+        self._window_requested = False
+        self._scroll_index = None  # Row to scroll into view, before the next window is rendered
+        self._scroll_top = 0
+        self._client_height = 0
+        self._listeners = []
+        _add_listener(self, self._elem_viewport, "scroll", self._viewport_scroll, "frame")
+
+    def dispose(self):
+        """Remove the scroll event listener and destroy its JS proxy"""
+        _remove_listeners(self)
+
+    def get_count(self) -> int:
+        """Number of rows"""
+        return self._count
+
+    def set_count(self, count: int):
+        """Change the number of rows, and render the visible window"""
+        self._count = count
+        self.refresh()
+
+    def set_row_height(self, row_height: int):
+        """Change the row height of all rows"""
+        self._row_height = row_height
+        for elem_row, _ in self._pool:
+            elem_row.style.height = str(row_height) + "px"
+            elem_row.style.lineHeight = str(row_height) + "px"
+        self.invalidate()
+
+    def invalidate(self):
+        """Fill all visible rows again, for example when the rows changed but the count did not"""
+        self._shown = [None] * len(self._shown)
+        self.refresh()
+
+    def refresh(self):
+        """Render the visible window of rows in the next animation frame, once"""
+        if not self._window_requested:
+            self._window_requested = True
+            measure(self._measure_window)
+
+    def scroll_to(self, index: int):
+        """Scroll a row into view, the next window is rendered at the new scroll position"""
+        self._scroll_index = index
+        self.refresh()
+
+    def _scroll_to(self, index: int):
+        """Scroll a row into view, in the DOM write phase after the spacer height is set"""
+        top = index * self._row_height
+        if top < self._scroll_top:
+            self._scroll_top = top
+        elif top + self._row_height > self._scroll_top + self._client_height:
+            self._scroll_top = top + self._row_height - self._client_height
+        else:
+            return
+        self._elem_viewport.scrollTop = self._scroll_top
+
+    def index_of(self, elem_target: Any) -> int | None:
+        """Index of the row that contains the target element of an event"""
+        elem_row = elem_target.closest("[data-row]")
+        if elem_row is None:
+            return None
+        index = int(elem_row.dataset.row)
+        return index if index < self._count else None
+
+    def _viewport_scroll(self, event: Any):  # pylint: disable=unused-argument
+        """Scroll event handler, at most once per animation frame"""
+        self.refresh()
+
+    def _measure_window(self):
+        """Read the scroll position and size of the viewport"""
+        self._scroll_top = self._elem_viewport.scrollTop
+        self._client_height = self._elem_viewport.clientHeight
+        mutate(self._render_window)
+
+    def _render_window(self):
+        """Only create and update row elements for the rows in and near the viewport"""
+        self._window_requested = False
+        self._elem_spacer.style.height = str(self._count * self._row_height) + "px"
+        if self._scroll_index is not None:
+            # Render the window from the target scroll position, instead of the position measured before scrolling
+            self._scroll_to(self._scroll_index)
+            self._scroll_index = None
+        first = max(0, int(self._scroll_top // self._row_height) - _OVERSCAN_ROWS)
+        count = int(self._client_height // self._row_height) + 2 * _OVERSCAN_ROWS + 1
+        last = min(self._count, first + count)
+        while len(self._pool) < last - first:
+            self._append_row()
+        for i, (elem_row, created) in enumerate(self._pool):
+            index = first + i
+            if index < last:
+                key = (index, self._row_key(index))
+                if self._shown[i] != key:
+                    if self._shown[i] is None:
+                        elem_row.style.display = "block"
+                    self._shown[i] = key
+                    elem_row.dataset.row = index
+                    elem_row.style.top = str(index * self._row_height) + "px"
+                    self._fill_row(elem_row, created, index)
+            elif self._shown[i] is not None:
+                self._shown[i] = None
+                elem_row.style.display = "none"
+
+    def _append_row(self):
+        """Add a row element to the pool"""
+        elem_row = document.createElement("div")
+        elem_row.style.position = "absolute"
+        elem_row.style.left = "0px"
+        elem_row.style.right = "0px"
+        elem_row.style.height = str(self._row_height) + "px"
+        elem_row.style.lineHeight = str(self._row_height) + "px"
+        elem_row.style.whiteSpace = "nowrap"
+        elem_row.style.overflow = "hidden"
+        elem_row.style.display = "none"
+        created = self._create_row(elem_row)
+        self._elem_spacer.appendChild(elem_row)
+        self._pool.append((elem_row, created))
+        self._shown.append(None)
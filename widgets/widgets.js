@@ -1,3 +1,138 @@
-function ptab_init() {
-    $(".menu .item").tab();
+// Replay a buffer of draw commands from the PCanvas widget, keep the opcodes in sync with widgets/canvas.py
+function pcanvas_replay(canvas, ops, strings) {
+    const ctx = canvas.getContext("2d");
+    const n = ops.length;
+    let i = 0;
+    while (i < n) {
+        switch (ops[i++]) {
+            case 0: ctx.beginPath(); break;
+            case 1: ctx.closePath(); break;
+            case 2: ctx.moveTo(ops[i], ops[i + 1]); i += 2; break;
+            case 3: ctx.lineTo(ops[i], ops[i + 1]); i += 2; break;
+            case 4: ctx.arc(ops[i], ops[i + 1], ops[i + 2], ops[i + 3], ops[i + 4]); i += 5; break;
+            case 5: ctx.rect(ops[i], ops[i + 1], ops[i + 2], ops[i + 3]); i += 4; break;
+            case 6: ctx.fill(); break;
+            case 7: ctx.stroke(); break;
+            case 8: ctx.fillRect(ops[i], ops[i + 1], ops[i + 2], ops[i + 3]); i += 4; break;
+            case 9: ctx.strokeRect(ops[i], ops[i + 1], ops[i + 2], ops[i + 3]); i += 4; break;
+            case 10: ctx.clearRect(ops[i], ops[i + 1], ops[i + 2], ops[i + 3]); i += 4; break;
+            case 11: ctx.fillStyle = strings[ops[i++]]; break;
+            case 12: ctx.strokeStyle = strings[ops[i++]]; break;
+            case 13: ctx.lineWidth = ops[i++]; break;
+            case 14: ctx.font = strings[ops[i++]]; break;
+            case 15: ctx.fillText(strings[ops[i]], ops[i + 1], ops[i + 2]); i += 3; break;
+            case 16: ctx.save(); break;
+            case 17: ctx.restore(); break;
+            case 18: {
+                const count = ops[i++];
+                if (count > 0) {
+                    ctx.moveTo(ops[i], ops[i + 1]);
+                    for (let k = 1; k < count; k++) {
+                        ctx.lineTo(ops[i + 2 * k], ops[i + 2 * k + 1]);
+                    }
+                }
+                i += 2 * count;
+                break;
+            }
+            case 19: {
+                const count = ops[i++];
+                const size = ops[i++];
+                const half = size / 2;
+                for (let k = 0; k < count; k++) {
+                    ctx.fillRect(ops[i + 2 * k] - half, ops[i + 2 * k + 1] - half, size, size);
+                }
+                i += 2 * count;
+                break;
+            }
+            case 20: ctx.clearRect(0, 0, canvas.width, canvas.height); break;
+            case 21: ctx.globalAlpha = ops[i++]; break;
+            default: throw new Error("Unknown canvas opcode: " + ops[i - 1]);
+        }
+    }
+}
+
+// Map the ids of an element and its descendants to the elements, the widgets of a cloned template adopt them by id
+function ptemplate_elements(elem) {
+    const elements = new Map();
+    elements.set(elem.id, elem);
+    for (const e of elem.querySelectorAll("[id]")) {
+        elements.set(e.id, e);
+    }
+    return elements;
+}
+
+// Shift the numbers of the widget ids in a cloned template, keep the id prefix in sync with widgets/globals.py
+function ptemplate_shift_ids(elem, offset) {
+    const shift = (text) => text.replace(/\be(\d+)/g, (match, n) => "e" + (Number(n) + offset));
+    for (const e of [elem, ...elem.querySelectorAll("*")]) {
+        if (e.id) {
+            e.id = shift(e.id);
+        }
+        if (e.style.gridArea) {
+            e.style.gridArea = shift(e.style.gridArea);
+        }
+        if (e.style.gridTemplateAreas) {
+            e.style.gridTemplateAreas = shift(e.style.gridTemplateAreas);
+        }
+        if (e.hasAttribute("for")) {
+            e.setAttribute("for", shift(e.getAttribute("for")));
+        }
+    }
+}
+
+// Wrap an event listener proxy, so only the events that pass the filter cross into Python, keep the modes in sync with widgets/globals.py
+// - throttle: at most one call per period, the last event of a period is passed at the end of the period
+// - debounce: one call with the last event, when no other events arrived during the period
+// - frame: at most one call per animation frame, with the last event
+function pevent_filter(listener, mode, millis) {
+    let lastEvent = null;
+    let timer = null;
+    let previous = -Infinity;
+    let filter;
+    if (mode === "throttle") {
+        filter = (event) => {
+            lastEvent = event;
+            if (timer === null) {
+                const wait = previous + millis - performance.now();
+                if (wait <= 0) {
+                    previous = performance.now();
+                    lastEvent = null;
+                    listener(event);
+                } else {
+                    timer = setTimeout(() => {
+                        timer = null;
+                        previous = performance.now();
+                        const e = lastEvent;
+                        lastEvent = null;
+                        listener(e);
+                    }, wait);
+                }
+            }
+        };
+        filter.cancel = () => clearTimeout(timer);
+    } else if (mode === "debounce") {
+        filter = (event) => {
+            lastEvent = event;
+            clearTimeout(timer);
+            timer = setTimeout(() => {
+                timer = null;
+                listener(lastEvent);
+            }, millis);
+        };
+        filter.cancel = () => clearTimeout(timer);
+    } else if (mode === "frame") {
+        filter = (event) => {
+            lastEvent = event;
+            if (timer === null) {
+                timer = requestAnimationFrame(() => {
+                    timer = null;
+                    listener(lastEvent);
+                });
+            }
+        };
+        filter.cancel = () => cancelAnimationFrame(timer);
+    } else {
+        throw new Error("Unknown event filter mode: " + mode);
+    }
+    return filter;
 }